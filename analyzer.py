@@ -3,13 +3,13 @@
 수집된 뉴스 데이터에서 키워드를 추출하고 빈도 분석을 수행합니다.
 """
 
-import json
 import os
 import re
 from datetime import datetime, timezone, timedelta
 from collections import Counter
 from typing import List, Dict
-from config import DATA_DIR
+from news_store import get_news_store
+from output_writer import output_writer, volatile_lines
 
 # 한국 시간대 (KST = UTC+9)
 KST = timezone(timedelta(hours=9))
@@ -18,6 +18,9 @@ def get_kst_now():
     """한국 시간(KST)으로 현재 시간을 반환합니다."""
     return datetime.now(KST)
 
+# 트렌드 파일 비교에서 제외할 줄 (생성 시각)
+TREND_VOLATILE = volatile_lines(r'  "generated_at": ')
+
 # 불용어 리스트 (분석에서 제외할 단어들)
 STOPWORDS = {
     '있다', '없다', '하다', '되다', '이다', '아니다', '그리고', '그러나', '하지만',
@@ -66,40 +69,9 @@ def analyze_daily_keywords(date: str = None, top_n: int = 20) -> List[Dict[str,
 
     all_keywords = []
 
-    # 3개 시간대
-    times = ['09-20', '15-00', '19-00']
-
-    # 모든 카테고리/소스의 뉴스 파일 탐색
-    for category_dir in os.listdir(DATA_DIR):
-        category_path = os.path.join(DATA_DIR, category_dir)
-
-        if not os.path.isdir(category_path):
-            continue
-
-        for source_dir in os.listdir(category_path):
-            source_path = os.path.join(category_path, source_dir)
-
-            if not os.path.isdir(source_path):
-                continue
-
-            # 3개 시간대의 뉴스 파일 모두 읽기
-            for time in times:
-                news_file = os.path.join(source_path, f'news_{date}_{time}.json')
-
-                if os.path.exists(news_file):
-                    try:
-                        with open(news_file, 'r', encoding='utf-8') as f:
-                            news_items = json.load(f)
-
-                        # 각 뉴스 제목에서 키워드 추출
-                        for item in news_items:
-                            title = item.get('title', '')
-                            keywords = extract_korean_nouns(title)
-                            all_keywords.extend(keywords)
-
-                    except Exception as e:
-                        print(f"파일 읽기 오류 ({news_file}): {e}")
-                        continue
+    # 모든 카테고리/소스, 모든 시간대의 뉴스 제목에서 키워드 추출 (날짜 인덱스 조회)
+    for item in get_news_store().load_news(date_from=date, date_to=date):
+        all_keywords.extend(extract_korean_nouns(item.get('title', '')))
 
     # 빈도 분석
     keyword_counts = Counter(all_keywords)
@@ -129,38 +101,10 @@ def analyze_category_keywords(category: str, date: str = None, top_n: int = 10)
         date = get_kst_now().strftime('%Y-%m-%d')
 
     all_keywords = []
-    category_path = os.path.join(DATA_DIR, category)
-
-    if not os.path.isdir(category_path):
-        return []
-
-    # 3개 시간대
-    times = ['09-20', '15-00', '19-00']
-
-    # 해당 카테고리의 모든 소스 탐색
-    for source_dir in os.listdir(category_path):
-        source_path = os.path.join(category_path, source_dir)
-
-        if not os.path.isdir(source_path):
-            continue
-
-        # 3개 시간대의 뉴스 파일 모두 읽기
-        for time in times:
-            news_file = os.path.join(source_path, f'news_{date}_{time}.json')
-
-            if os.path.exists(news_file):
-                try:
-                    with open(news_file, 'r', encoding='utf-8') as f:
-                        news_items = json.load(f)
-
-                    for item in news_items:
-                        title = item.get('title', '')
-                        keywords = extract_korean_nouns(title)
-                        all_keywords.extend(keywords)
 
-                except Exception as e:
-                    print(f"파일 읽기 오류 ({news_file}): {e}")
-                    continue
+    # 해당 카테고리의 모든 소스, 모든 시간대 (카테고리+날짜 인덱스 조회)
+    for item in get_news_store().load_news(category=category, date_from=date, date_to=date):
+        all_keywords.extend(extract_korean_nouns(item.get('title', '')))
 
     keyword_counts = Counter(all_keywords)
     top_keywords = [
@@ -207,8 +151,10 @@ def save_trend_data(date: str = None):
     trend_file = os.path.join(trends_dir, f'trends_{date}.json')
     
     try:
-        with open(trend_file, 'w', encoding='utf-8') as f:
-            json.dump(trend_data, f, ensure_ascii=False, indent=2)
+        # 키워드가 그대로이면 generated_at만 다르므로 기존 파일 유지
+        if not output_writer.write_json(trend_file, trend_data, TREND_VOLATILE):
+            print(f"ℹ️ 트렌드 변경 없음, 기존 파일 유지: {trend_file}")
+            return trend_file
         
         print(f"✅ 트렌드 데이터 저장 완료: {trend_file}")
         print(f"   - 전체 키워드: {len(daily_keywords)}개")
@@ -237,6 +183,7 @@ def main():
     
     # 트렌드 데이터 생성 및 저장
     save_trend_data(today)
+    output_writer.sync()
     
     print("=" * 60)
 
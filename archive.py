@@ -0,0 +1,209 @@
+"""
+HTTP 응답 기록/재생(Record/Replay) 모듈
+크롤링 중 받은 섹션·기사 응답을 압축·내용 주소화(content-addressed)하여 보관하고,
+네트워크 없이 같은 응답으로 파이프라인을 다시 실행할 수 있게 합니다.
+
+보관 구조:
+    {archive_dir}/manifest.json              # URL → 응답 메타데이터 + blob 해시
+    {archive_dir}/run.json                   # 기록한 실행의 날짜/시간대 (재생 결과를 그 시간대로 저장)
+    {archive_dir}/blobs/{해시 앞 2자리}/{sha256}.gz
+"""
+
+import gzip
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+MODE_RECORD = 'record'
+MODE_REPLAY = 'replay'
+
+# 재생 시 복원할 응답 헤더
+RECORDED_HEADERS = ('Content-Type', 'Location', 'ETag', 'Last-Modified')
+
+# 기본 보관소 이름 ({날짜}_{시간대}) - run.json이 없는 이전 보관소용
+ARCHIVE_NAME_PATTERN = re.compile(r'(\d{4}-\d{2}-\d{2})_(\d{2}-\d{2})$')
+
+
+class ResponseArchive:
+    """
+    응답 보관소.
+
+    record 모드에서는 세션의 response hook으로 모든 응답을 저장하고,
+    replay 모드에서는 세션에 ReplayAdapter를 장착해 보관된 응답을 돌려줍니다.
+    """
+
+    def __init__(self, archive_dir: str, mode: str):
+        self.archive_dir = archive_dir
+        self.mode = mode
+        self.manifest_file = os.path.join(archive_dir, 'manifest.json')
+        self.run_file = os.path.join(archive_dir, 'run.json')
+        self.manifest: Dict[str, Dict] = {}
+        self.run_info: Dict[str, str] = {}  # 기록한 실행의 {'date', 'slot'}
+        self.recorded = 0
+        self.replayed = 0
+        self.missing = 0
+        self._lock = threading.Lock()
+
+        if mode == MODE_REPLAY:
+            self.load()
+
+    def load(self):
+        """manifest를 로드합니다."""
+        with open(self.manifest_file, 'r', encoding='utf-8') as f:
+            self.manifest = json.load(f)
+        self.run_info = read_run_info(self.archive_dir) or {}
+        logger.info(f"응답 보관소 로드: {self.archive_dir} ({len(self.manifest)}개 URL)")
+
+    def save(self):
+        """manifest를 저장합니다 (record 모드)."""
+        if self.mode != MODE_RECORD:
+            return
+        os.makedirs(self.archive_dir, exist_ok=True)
+        with self._lock:
+            snapshot = dict(sorted(self.manifest.items()))
+        with open(self.manifest_file, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f, ensure_ascii=False, indent=2)
+        if self.run_info:
+            with open(self.run_file, 'w', encoding='utf-8') as f:
+                json.dump(self.run_info, f, ensure_ascii=False, indent=2)
+        logger.info(f"응답 보관소 저장: {self.archive_dir} ({len(snapshot)}개 URL)")
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.archive_dir, 'blobs', digest[:2], f"{digest}.gz")
+
+    def _write_blob(self, body: bytes) -> str:
+        digest = hashlib.sha256(body).hexdigest()
+        path = self._blob_path(digest)
+        # 내용이 같은 응답은 한 번만 저장
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with gzip.open(path, 'wb') as f:
+                f.write(body)
+        return digest
+
+    def read_blob(self, digest: str) -> bytes:
+        """해시에 해당하는 본문을 읽습니다."""
+        with gzip.open(self._blob_path(digest), 'rb') as f:
+            return f.read()
+
+    def record_hook(self, response: requests.Response, *args, **kwargs):
+        """세션 response hook: 응답 본문 전체를 보관소에 기록합니다."""
+        try:
+            digest = self._write_blob(response.content)
+        except Exception as e:
+            logger.warning(f"응답 기록 실패 ({response.url}): {e}")
+            return response
+
+        entry = {
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': {k: response.headers[k] for k in RECORDED_HEADERS if k in response.headers},
+            'blob': digest,
+            'size': len(response.content),
+        }
+        with self._lock:
+            self.manifest[response.request.url] = entry
+            self.recorded += 1
+        return response
+
+    def build_response(self, request: requests.PreparedRequest) -> Response:
+        """보관된 응답으로 Response 객체를 만듭니다 (없으면 404)."""
+        with self._lock:
+            entry = self.manifest.get(request.url)
+
+        response = Response()
+        response.request = request
+        response.url = request.url
+
+        if entry is None:
+            with self._lock:
+                self.missing += 1
+            response.status_code = 404
+            response.reason = 'Not In Archive'
+            body = b""
+        else:
+            with self._lock:
+                self.replayed += 1
+            response.status_code = entry['status']
+            response.reason = entry.get('reason', '')
+            response.headers = CaseInsensitiveDict(entry.get('headers', {}))
+            body = self.read_blob(entry['blob'])
+
+        response.headers['Content-Length'] = str(len(body))
+        response.raw = io.BytesIO(body)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        return response
+
+    def attach(self, session: requests.Session):
+        """모드에 맞게 세션에 기록 hook 또는 재생 어댑터를 연결합니다."""
+        if self.mode == MODE_RECORD:
+            session.hooks['response'].append(self.record_hook)
+        elif self.mode == MODE_REPLAY:
+            adapter = ReplayAdapter(self)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+
+    def log_stats(self):
+        """기록/재생 건수를 로그로 출력합니다."""
+        if self.mode == MODE_RECORD:
+            logger.info(f"응답 기록: {self.recorded}건 → {self.archive_dir}")
+        else:
+            logger.info(f"응답 재생: {self.replayed}건, 보관소에 없음 {self.missing}건 ({self.archive_dir})")
+
+
+class ReplayAdapter(HTTPAdapter):
+    """네트워크 대신 ResponseArchive에서 응답을 반환하는 어댑터"""
+
+    def __init__(self, archive: ResponseArchive):
+        super().__init__()
+        self.archive = archive
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        return self.archive.build_response(request)
+
+
+def read_run_info(archive_dir: str) -> Optional[Dict[str, str]]:
+    """
+    보관소를 기록한 실행의 날짜/시간대를 읽습니다.
+    run.json이 없으면 보관소 이름({날짜}_{시간대})에서 찾고, 둘 다 없으면 None입니다.
+    """
+    run_file = os.path.join(archive_dir, 'run.json')
+    if os.path.exists(run_file):
+        with open(run_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    match = ARCHIVE_NAME_PATTERN.search(os.path.basename(os.path.normpath(archive_dir)))
+    if match:
+        return {'date': match.group(1), 'slot': match.group(2)}
+    return None
+
+
+def open_archive(record_dir: Optional[str] = None, replay_dir: Optional[str] = None) -> Optional[ResponseArchive]:
+    """
+    명령행 옵션에 맞는 보관소를 엽니다.
+
+    Args:
+        record_dir: 기록할 디렉토리 (record 모드)
+        replay_dir: 재생할 디렉토리 (replay 모드)
+
+    Returns:
+        ResponseArchive 또는 두 옵션 모두 없으면 None
+    """
+    if record_dir and replay_dir:
+        raise ValueError("--record와 --replay는 함께 사용할 수 없습니다")
+    if replay_dir:
+        return ResponseArchive(replay_dir, MODE_REPLAY)
+    if record_dir:
+        return ResponseArchive(record_dir, MODE_RECORD)
+    return None
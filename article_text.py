@@ -0,0 +1,192 @@
+"""
+기사 본문 수집 단계 (선택 기능: ARTICLE_FULL_TEXT 또는 python crawler.py --full-text)
+섹션 페이지에서 새로 발견한 기사만 제한된 작업자 풀에서 가져와 본문을 추출하고,
+소스별 목록 JSON 옆에 gzip으로 압축한 JSON Lines 파일로 저장합니다.
+
+    data/{category}/{source}/articles_{date}.jsonl.gz    # 한 줄에 기사 하나 (gzip member 단위로 추가)
+    data/article_text_index.tsv                          # 본문을 저장한 기사 URL\t본문 파일 경로
+
+기사마다 받는 즉시 파일에 추가하고 결과를 들고 있지 않으므로 기사 수와 관계없이 메모리가 일정하며,
+색인에 있는 기사는 다른 시간대/날짜 실행에서도 다시 요청하지 않습니다.
+"""
+
+import gzip
+import json
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from config import (
+    ARTICLE_TEXT_INDEX_FILE, ARTICLE_TEXT_WORKERS, IMAGE_RATE_LIMITS, DEFAULT_IMAGE_RATE_LIMIT, IMAGE_RATE_BURST
+)
+from fetch_engine import get_host
+from image_cache import canonicalize_url
+from image_resolver import TokenBucket
+from metrics import run_metrics
+from news_item import NewsItem
+
+logger = logging.getLogger(__name__)
+
+
+class ArticleTextStore:
+    """
+    압축 본문 파일과 수집 색인.
+
+    색인은 URL(정규화)만 메모리에 두고, 본문은 파일에 바로 추가합니다.
+    """
+
+    def __init__(self, index_file: str = ARTICLE_TEXT_INDEX_FILE):
+        self.index_file = index_file
+        self.fetched = set()
+        self.pending = set()
+        self.saved = 0
+        self._lock = threading.Lock()
+
+    def load(self):
+        """디스크에서 수집 색인을 로드합니다."""
+        if not os.path.exists(self.index_file):
+            return
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    url = line.split('\t', 1)[0].strip()
+                    if url:
+                        self.fetched.add(url)
+            logger.info(f"기사 본문 색인 {len(self.fetched)}개 로드됨")
+        except OSError as e:
+            logger.warning(f"기사 본문 색인 로드 실패: {e}")
+
+    def claim(self, url: str) -> bool:
+        """
+        아직 저장하지 않았고 다른 작업자가 가져오는 중도 아닌 기사이면 예약합니다.
+
+        Returns:
+            이번에 가져와야 하면 True
+        """
+        key = canonicalize_url(url)
+        with self._lock:
+            if key in self.fetched or key in self.pending:
+                return False
+            self.pending.add(key)
+            return True
+
+    def release(self, url: str):
+        """가져오지 못한 기사의 예약을 취소합니다 (다음 실행에서 다시 시도)."""
+        with self._lock:
+            self.pending.discard(canonicalize_url(url))
+
+    def append(self, path: str, record: Dict[str, object]):
+        """
+        기사 본문을 path에 추가하고 색인에 기록합니다.
+
+        gzip 파일은 member를 이어 붙여도 하나의 스트림으로 읽히므로 기존 내용을 다시 쓰지 않습니다.
+        """
+        key = canonicalize_url(record['url'])
+        line = json.dumps(record, ensure_ascii=False) + '\n'
+        with self._lock:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with gzip.open(path, 'at', encoding='utf-8') as f:
+                f.write(line)
+            os.makedirs(os.path.dirname(self.index_file) or '.', exist_ok=True)
+            with open(self.index_file, 'a', encoding='utf-8') as f:
+                f.write(f"{key}\t{path}\n")
+            self.pending.discard(key)
+            self.fetched.add(key)
+            self.saved += 1
+
+
+def iter_article_texts(path: str):
+    """본문 파일의 기사를 한 줄씩 읽습니다 (파일 전체를 메모리에 올리지 않음)."""
+    with gzip.open(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class ArticleTextFetcher:
+    """
+    기사 본문 수집 단계.
+
+    submit()은 기다리지 않고 작업자 풀에 넘기며, shutdown()에서 남은 작업이 끝날 때까지 기다립니다.
+    fetch_func(url)는 본문을 추출한 딕셔너리(title, content, full_content_length)나 실패 시 None을 반환합니다.
+    호스트별 요청 속도는 이미지 조회와 같은 IMAGE_RATE_LIMITS로 제한합니다 (throttle=False이면 제한 없음).
+    """
+
+    def __init__(self, fetch_func: Callable[[str], Optional[Dict[str, object]]], store: ArticleTextStore,
+                 workers: int = ARTICLE_TEXT_WORKERS, throttle: bool = True):
+        self.fetch_func = fetch_func
+        self.store = store
+        self.throttle = throttle
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='article-text')
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.requested = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+
+    def _get_bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            if host not in self.buckets:
+                rate = IMAGE_RATE_LIMITS.get(host, DEFAULT_IMAGE_RATE_LIMIT)
+                self.buckets[host] = TokenBucket(rate, IMAGE_RATE_BURST)
+            return self.buckets[host]
+
+    def _fetch(self, path: str, item: NewsItem, scope: str):
+        url = item['url']
+        try:
+            if self.throttle:
+                self._get_bucket(get_host(url)).acquire()
+            with run_metrics.stage('article_text', scope):
+                article = self.fetch_func(url)
+        except Exception as e:
+            logger.debug(f"기사 본문 수집 실패 ({url}): {e}")
+            article = None
+
+        with self._lock:
+            self.requested += 1
+            self.failed += 0 if article else 1
+        if not article:
+            self.store.release(url)
+            return
+
+        self.store.append(path, {
+            'url': url,
+            'title': item.get('title') or article['title'],
+            'content': article['content'],
+            'full_content_length': article['full_content_length'],
+            'fetched_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        })
+        run_metrics.add('article_texts_saved', scope=scope)
+
+    def submit(self, path: str, news_items: List[NewsItem], scope: Optional[str] = None) -> int:
+        """
+        본문을 아직 저장하지 않은 기사만 작업자 풀에 넘깁니다.
+
+        Args:
+            path: 본문을 추가할 파일 (소스/날짜별)
+            news_items: 새로 발견한 뉴스 항목
+            scope: 실행 지표 집계 단위
+
+        Returns:
+            넘긴 기사 수
+        """
+        submitted = 0
+        for item in news_items:
+            if self.store.claim(item['url']):
+                self.executor.submit(self._fetch, path, item, scope)
+                submitted += 1
+        run_metrics.add('article_texts_requested', submitted, scope)
+        return submitted
+
+    def shutdown(self):
+        """남은 본문 수집이 끝날 때까지 기다린 뒤 작업자 풀을 종료합니다."""
+        self.executor.shutdown(wait=True)
+
+    def log_stats(self):
+        """본문 수집 결과를 로그로 출력합니다."""
+        if not self.requested:
+            return
+        logger.info(f"기사 본문 수집: 요청 {self.requested}건, 저장 {self.store.saved}건, 실패 {self.failed}건 "
+                    f"(색인 {len(self.store.fetched)}개)")
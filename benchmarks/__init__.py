@@ -0,0 +1,14 @@
+"""
+파서 성능 벤치마크
+
+저장된 섹션 페이지 HTML(fixture)로 parse_* 함수의 처리량과 메모리 사용량을 측정합니다.
+
+    python -m benchmarks.capture_fixtures            # 실제 페이지로 fixture 저장/갱신 (네트워크 필요)
+    python -m benchmarks.capture_fixtures --from-archive archive/2026-10-17_09-00
+    python -m benchmarks.capture_fixtures --synthetic  # 가상 섹션 페이지로 fixture 생성 (커밋된 fixture/baseline.json)
+    python -m benchmarks.parser_bench                 # 오프라인 측정 + 기준값(baseline.json) 비교
+    python -m benchmarks.parser_bench --update-baseline
+    python -m benchmarks.scaling_bench                # 링크 수 대비 파싱 비용이 선형인지 확인
+    python -m benchmarks.decode_bench                 # response.text 디코딩 대비 바이트 전달의 CPU 비교
+    python -m benchmarks.memory_bench                 # data/ 기록을 dict와 NewsItem으로 들고 있을 때의 메모리 비교
+"""
@@ -0,0 +1,98 @@
+"""
+벤치마크 fixture 저장/갱신 도구
+
+실제 섹션 페이지(네트워크 필요), crawler.py --record로 기록한 보관소,
+또는 가상 섹션 페이지(benchmarks/synthetic_pages)에서 소스별 HTML을 가져와 benchmarks/fixtures/에 저장합니다.
+저장소에는 가상 페이지로 만든 fixture와 그 기준값(baseline.json)이 커밋되어 있습니다.
+
+    python -m benchmarks.capture_fixtures
+    python -m benchmarks.capture_fixtures --only donga_politics chosun_culture
+    python -m benchmarks.capture_fixtures --from-archive archive/2026-10-17_09-00
+    python -m benchmarks.capture_fixtures --synthetic    # 네트워크 없이 가상 페이지로 (커밋된 fixture)
+"""
+
+import argparse
+import sys
+import time
+from typing import Optional, Tuple
+
+import requests
+
+from archive import ResponseArchive, MODE_REPLAY
+from benchmarks.synthetic_pages import section_page
+from benchmarks.fixture_store import iter_sources, load_index, save_index, save_fixture, load_fixture, run_parser
+from config import REQUEST_TIMEOUT, REQUEST_DELAY
+from http_session import get_declared_encoding, get_session
+
+
+def fetch_live(url: str) -> Tuple[bytes, Optional[str]]:
+    """실제 페이지를 가져와 (본문, 선언된 인코딩)을 반환합니다."""
+    response = get_session(url).get(url, timeout=REQUEST_TIMEOUT)
+    response.raise_for_status()
+    return response.content, get_declared_encoding(response.headers)
+
+
+def fetch_archived(archive: ResponseArchive, url: str) -> Optional[Tuple[bytes, Optional[str]]]:
+    """보관소에 기록된 응답을 (본문, 선언된 인코딩)으로 반환합니다 (없으면 None)."""
+    entry = archive.manifest.get(url)
+    if entry is None or entry['status'] != 200:
+        return None
+    return archive.read_blob(entry['blob']), get_declared_encoding(entry.get('headers', {}))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='파서 벤치마크 fixture 저장/갱신')
+    source = arg_parser.add_mutually_exclusive_group()
+    source.add_argument('--from-archive', metavar='DIR', help='crawler.py --record로 기록한 보관소에서 가져오기')
+    source.add_argument('--synthetic', action='store_true', help='가상 섹션 페이지로 만들기 (네트워크 불필요)')
+    arg_parser.add_argument('--only', nargs='+', metavar='PARSER', help='갱신할 파서 이름 (기본: 전체)')
+    args = arg_parser.parse_args()
+
+    archive = ResponseArchive(args.from_archive, MODE_REPLAY) if args.from_archive else None
+    index = load_index()
+    failed = 0
+
+    print("=" * 60)
+    origin = '보관소: ' + args.from_archive if archive else ('가상 페이지' if args.synthetic else '실제 페이지')
+    print(f"📥 fixture 저장 ({origin})")
+    print("=" * 60)
+
+    for i, (category, source_config) in enumerate(iter_sources(args.only)):
+        parser_name = source_config['parser']
+        url = source_config['url']
+
+        try:
+            if args.synthetic:
+                fetched = section_page(category, source_config), 'utf-8'
+            elif archive:
+                fetched = fetch_archived(archive, url)
+                if fetched is None:
+                    print(f"  ⚠️ [{parser_name}] 보관소에 없음: {url}")
+                    failed += 1
+                    continue
+            else:
+                if i > 0:
+                    time.sleep(REQUEST_DELAY)
+                fetched = fetch_live(url)
+        except requests.exceptions.RequestException as e:
+            print(f"  ❌ [{parser_name}] 가져오기 실패: {e}")
+            failed += 1
+            continue
+
+        body, encoding = fetched
+        entry = save_fixture(parser_name, url, body, encoding)
+        # 레이아웃이 바뀌어 파서가 아무것도 찾지 못하는 페이지는 벤치마크 의미가 없으므로 표시
+        entry['items'] = len(run_parser(source_config, load_fixture(parser_name, entry)))
+        index[parser_name] = entry
+
+        mark = "✓" if entry['items'] else "⚠️ 파싱 결과 없음"
+        print(f"  {mark} [{category}/{source_config['name']}] {parser_name}: "
+              f"{entry['bytes'] / 1024:.1f}KB, 뉴스 {entry['items']}개")
+
+    save_index(index)
+    print(f"\n저장 완료: {len(index)}개 fixture (실패 {failed}개)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+섹션 페이지 디코딩 벤치마크
+저장된 fixture로 페이지 한 건을 파싱 작업자에게 넘겨 파싱하기까지의 CPU 시간을 두 방식으로 측정합니다.
+
+    python -m benchmarks.decode_bench
+    python -m benchmarks.decode_bench --only donga_politics chosun_culture joongang_sports
+
+    text:  response.text로 디코딩한 문자열을 작업 프로세스로 전송(pickle)해 파싱 (이전 방식)
+    bytes: 응답 바이트와 선언된 인코딩을 전송해 작업 프로세스에서 한 번만 디코딩 (crawler.fetch_page)
+
+응답 헤더는 두 경우로 만듭니다.
+    선언:   Content-Type에 charset이 있음 (response.text는 그 인코딩으로 디코딩)
+    미선언: Content-Type이 없음 (response.text는 본문 전체로 문자셋을 추정하고,
+            bytes 방식은 <meta charset> → UTF-8 순서로 인코딩을 정함)
+"""
+
+import argparse
+import pickle
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+import parser
+from benchmarks.fixture_store import iter_sources, load_index, read_fixture
+from benchmarks.parser_bench import comparable
+from http_session import get_declared_encoding
+from news_item import NewsItem
+from parse_worker import parse_section
+
+DEFAULT_REPEAT = 10
+
+
+def build_response(body: bytes, headers: Dict[str, str]) -> requests.Response:
+    """HTTPAdapter.build_response와 같은 방식으로 인코딩을 정한 응답 객체"""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+def parse_text(parser_name: str, body: bytes, headers: Dict[str, str], max_articles: int) -> List[NewsItem]:
+    """이전 방식: 수집 스레드에서 response.text → 작업자로 문자열 전송 → 파싱"""
+    html_content = pickle.loads(pickle.dumps(build_response(body, headers).text))
+    return parser.get_parser_info(parser_name).parse(html_content, max_articles)
+
+
+def parse_bytes(parser_name: str, body: bytes, headers: Dict[str, str], max_articles: int) -> List[NewsItem]:
+    """현재 방식: (바이트, 선언된 인코딩) 전송 → 작업자에서 디코딩 + 파싱"""
+    page = pickle.loads(pickle.dumps((body, get_declared_encoding(headers))))
+    return parse_section(parser_name, page, max_articles)
+
+
+def measure(func: Callable, parser_name: str, body: bytes, headers: Dict[str, str],
+            max_articles: int, repeat: int) -> Dict:
+    """func의 페이지당 CPU 시간(중앙값, ms)과 결과"""
+    items = func(parser_name, body, headers, max_articles)  # 워밍업
+    timings = []
+    for _ in range(repeat):
+        started = time.process_time()
+        func(parser_name, body, headers, max_articles)
+        timings.append((time.process_time() - started) * 1000)
+    return {'items': items, 'cpu_ms': statistics.median(timings)}
+
+
+def run(index: Dict[str, Dict], only: Optional[List[str]], repeat: int) -> List[str]:
+    """
+    fixture마다 두 헤더 경우의 text / bytes 방식 CPU 시간을 출력합니다.
+
+    Returns:
+        헤더에 charset이 선언된 경우 두 방식의 파싱 결과가 다른 파서 이름 리스트
+    """
+    print(f"{'파서':<26}{'헤더':<6}{'text ms':>10}{'bytes ms':>10}{'절약 ms':>10}{'결과':>6}")
+    print("-" * 68)
+
+    mismatched = []
+    totals = {'선언': [0.0, 0.0], '미선언': [0.0, 0.0]}
+    for _, source_config in iter_sources(only):
+        parser_name = source_config['parser']
+        entry = index.get(parser_name)
+        if entry is None:
+            print(f"{parser_name:<26} fixture 없음")
+            continue
+
+        body = read_fixture(parser_name)
+        max_articles = source_config.get('max_articles', 20)
+        cases = {'선언': {'Content-Type': f"text/html; charset={entry.get('encoding') or 'utf-8'}"},
+                 '미선언': {}}
+        for case, headers in cases.items():
+            text = measure(parse_text, parser_name, body, headers, max_articles, repeat)
+            binary = measure(parse_bytes, parser_name, body, headers, max_articles, repeat)
+            same = comparable(text['items']) == comparable(binary['items'])
+            if case == '선언' and not same:
+                mismatched.append(parser_name)
+            totals[case][0] += text['cpu_ms']
+            totals[case][1] += binary['cpu_ms']
+            print(f"{parser_name:<26}{case:<6}{text['cpu_ms']:>10.2f}{binary['cpu_ms']:>10.2f}"
+                  f"{text['cpu_ms'] - binary['cpu_ms']:>10.2f}{'같음' if same else '다름':>6}")
+
+    print("-" * 68)
+    for case, (text_ms, bytes_ms) in totals.items():
+        if text_ms:
+            print(f"{case}: text {text_ms:.1f}ms → bytes {bytes_ms:.1f}ms "
+                  f"(페이지 합계 {text_ms - bytes_ms:.1f}ms, {(1 - bytes_ms / text_ms) * 100:.1f}% 절약)")
+    return mismatched
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='섹션 페이지 디코딩 벤치마크 (response.text vs 바이트 전달)')
+    arg_parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help=f'페이지당 반복 횟수 (기본 {DEFAULT_REPEAT})')
+    arg_parser.add_argument('--only', nargs='+', metavar='PARSER', help='측정할 파서 이름 (기본: 전체)')
+    args = arg_parser.parse_args()
+
+    index = load_index()
+    if not index:
+        print("⚠️ fixture가 없습니다. 먼저 python -m benchmarks.capture_fixtures 를 실행하세요.")
+        sys.exit(1)
+
+    mismatched = run(index, args.only, args.repeat)
+    if mismatched:
+        print(f"\n❌ 인코딩이 선언된 페이지에서 파싱 결과가 다른 파서: {', '.join(mismatched)}")
+        sys.exit(1)
+    print("\n✅ 인코딩이 선언된 페이지의 파싱 결과가 두 방식에서 같습니다")
+
+
+if __name__ == "__main__":
+    main()
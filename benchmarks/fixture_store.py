@@ -0,0 +1,103 @@
+"""
+벤치마크 fixture 저장소
+소스별 섹션 페이지 원본(gzip)과 메타데이터(index.json)를 관리합니다.
+
+    benchmarks/fixtures/index.json          # {파서 이름: {url, encoding, bytes, sha256, items, captured_at}}
+    benchmarks/fixtures/{파서 이름}.html.gz
+"""
+
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import parser
+from config import NEWS_SOURCES
+from html_tree import decode_html
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+FIXTURE_DIR = os.path.join(BENCHMARK_DIR, 'fixtures')
+FIXTURE_INDEX = os.path.join(FIXTURE_DIR, 'index.json')
+
+
+def iter_sources(only: Optional[List[str]] = None) -> Iterator[Tuple[str, Dict]]:
+    """
+    NEWS_SOURCES의 (카테고리, 소스 설정)을 순서대로 반환합니다.
+
+    Args:
+        only: 지정하면 이 파서 이름들만 반환
+    """
+    for category, sources in NEWS_SOURCES.items():
+        for source_config in sources:
+            if only and source_config['parser'] not in only:
+                continue
+            yield category, source_config
+
+
+def load_index() -> Dict[str, Dict]:
+    """fixture 메타데이터를 로드합니다 (없으면 빈 딕셔너리)."""
+    if not os.path.exists(FIXTURE_INDEX):
+        return {}
+    with open(FIXTURE_INDEX, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_index(index: Dict[str, Dict]):
+    """fixture 메타데이터를 저장합니다."""
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    with open(FIXTURE_INDEX, 'w', encoding='utf-8') as f:
+        json.dump(dict(sorted(index.items())), f, ensure_ascii=False, indent=2)
+
+
+def fixture_path(parser_name: str) -> str:
+    return os.path.join(FIXTURE_DIR, f"{parser_name}.html.gz")
+
+
+def save_fixture(parser_name: str, url: str, body: bytes, encoding: Optional[str]) -> Dict:
+    """
+    섹션 페이지 원본을 저장하고 메타데이터를 반환합니다.
+
+    Args:
+        parser_name: NEWS_SOURCES의 parser 값
+        url: 페이지 URL
+        body: 응답 본문 (바이트)
+        encoding: Content-Type에 선언된 인코딩 (없으면 None, crawler.fetch_page와 같음)
+    """
+    os.makedirs(FIXTURE_DIR, exist_ok=True)
+    with gzip.open(fixture_path(parser_name), 'wb') as f:
+        f.write(body)
+    return {
+        'url': url,
+        'encoding': encoding,
+        'bytes': len(body),
+        'sha256': hashlib.sha256(body).hexdigest(),
+        'captured_at': datetime.now().isoformat(timespec='seconds'),
+    }
+
+
+def read_fixture(parser_name: str) -> bytes:
+    """저장된 fixture 원본(응답 본문 바이트)을 읽습니다."""
+    with gzip.open(fixture_path(parser_name), 'rb') as f:
+        return f.read()
+
+
+def load_fixture(parser_name: str, entry: Dict) -> str:
+    """저장된 fixture를 파싱 작업자(parse_worker.parse_section)가 디코딩하는 것과 같은 문자열로 읽습니다."""
+    return decode_html(read_fixture(parser_name), entry.get('encoding'))
+
+
+def run_parser(source_config: Dict, html_content: str, engine: Optional[str] = None,
+               region: Optional[bool] = None) -> List[Dict[str, str]]:
+    """
+    crawler.process_source와 같은 인자로 소스의 파서를 실행합니다.
+
+    Args:
+        engine: 지정하면 규칙의 engine 대신 이 파서 엔진('lxml'/'bs4')으로 실행
+        region: 지정하면 SECTION_REGION_PARSE 대신 이 값으로 섹션 조각 파싱 여부 결정
+    """
+    max_articles = source_config.get('max_articles', 20)
+    if engine or region is not None:
+        return parser.parse_with_spec(source_config['parser'], html_content, max_articles, engine, region)
+    return parser.get_parser_info(source_config['parser']).parse(html_content, max_articles)
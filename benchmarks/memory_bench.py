@@ -0,0 +1,85 @@
+"""
+뉴스 항목 메모리 벤치마크
+data/에 쌓인 기록(시간대별 JSON 파일과 일별 로그)을 모두 불러왔을 때
+항목을 딕셔너리로 들고 있는 경우와 NewsItem(__slots__)으로 들고 있는 경우의 메모리를 tracemalloc으로 비교합니다.
+
+    python -m benchmarks.memory_bench
+    python -m benchmarks.memory_bench --repeat 4     # 기록을 4배로 늘려 측정 (몇 달치 분석 가정)
+
+항목 JSON 문자열(저장소 news.item 열과 같음)을 먼저 메모리에 올린 뒤,
+json.loads만 한 결과와 NewsItem.from_dict까지 한 결과를 각각 리스트로 들고 있을 때의
+남은 메모리(current)와 최대 메모리(peak)를 측정합니다.
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from config import DATA_DIR
+from news_item import NewsItem
+from news_log import iter_log_files, iter_news_files, read_log
+
+
+def load_records(data_dir: str) -> List[str]:
+    """data/의 모든 시간대 항목을 항목별 JSON 문자열로 (파일/로그 읽기는 측정에서 제외)"""
+    records = []
+    for _, path in iter_news_files(data_dir):
+        with open(path, 'r', encoding='utf-8') as f:
+            records.extend(json.dumps(item, ensure_ascii=False) for item in json.load(f))
+    for _, path in iter_log_files(data_dir):
+        news_log = read_log(path)
+        for slot in news_log.slots:
+            records.extend(json.dumps(item, ensure_ascii=False) for item in news_log.slot_items(slot))
+    return records
+
+
+def as_dicts(records: List[str]) -> list:
+    return [json.loads(record) for record in records]
+
+
+def as_news_items(records: List[str]) -> list:
+    return [NewsItem.from_dict(json.loads(record)) for record in records]
+
+
+def measure(func: Callable[[List[str]], list], records: List[str]) -> Dict[str, float]:
+    """func 결과를 들고 있을 때의 메모리 (current/peak, bytes)와 변환 시간"""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    items = func(records)
+    elapsed = time.perf_counter() - started
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return {'current': current, 'peak': peak, 'seconds': elapsed}
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='뉴스 항목 메모리 벤치마크 (dict vs NewsItem)')
+    arg_parser.add_argument('--data-dir', default=DATA_DIR, help=f'기록 폴더 (기본 {DATA_DIR})')
+    arg_parser.add_argument('--repeat', type=int, default=1, help='기록을 몇 배로 늘려 측정할지 (기본 1)')
+    args = arg_parser.parse_args()
+
+    records = load_records(args.data_dir) * args.repeat
+    if not records:
+        print(f"⚠️ {args.data_dir}에 뉴스 기록이 없습니다.")
+        sys.exit(1)
+
+    results = {'dict': measure(as_dicts, records), 'NewsItem': measure(as_news_items, records)}
+
+    print(f"항목 {len(records):,}개 ({args.data_dir}, {args.repeat}배)")
+    print(f"{'형식':<10}{'current MB':>12}{'peak MB':>10}{'항목당 B':>10}{'변환 s':>9}")
+    print("-" * 51)
+    for name, result in results.items():
+        print(f"{name:<10}{result['current'] / 2 ** 20:>12.2f}{result['peak'] / 2 ** 20:>10.2f}"
+              f"{result['current'] / len(records):>10.0f}{result['seconds']:>9.2f}")
+    saved = 1 - results['NewsItem']['current'] / results['dict']['current']
+    print(f"\n✅ NewsItem: 남은 메모리 {saved * 100:.1f}% 감소")
+
+
+if __name__ == "__main__":
+    main()
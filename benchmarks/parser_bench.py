@@ -0,0 +1,227 @@
+"""
+파서 벤치마크
+저장된 fixture로 parse_* 함수의 처리량(pages/sec, ms/page)과 최대 메모리(tracemalloc)를 측정하고
+benchmarks/baseline.json과 비교해 비용이 threshold배 이상 늘어난 파서를 표시합니다.
+
+    python -m benchmarks.parser_bench
+    python -m benchmarks.parser_bench --repeat 50 --only joongang_politics
+    python -m benchmarks.parser_bench --update-baseline   # 현재 측정값을 기준값으로 저장
+    python -m benchmarks.parser_bench --engine bs4 lxml   # 파서 엔진별 비교 (결과가 다르면 표시)
+    python -m benchmarks.parser_bench --full-parse        # 섹션 조각 파싱 없이 페이지 전체 파싱
+
+기준값은 측정한 기계에 따라 달라지므로 같은 환경에서 비교해야 합니다.
+tracemalloc은 파이썬 객체 메모리만 측정하므로 lxml 엔진의 peak KB에는
+libxml2 트리(C 메모리)가 포함되지 않습니다 (BeautifulSoup 트리는 파이썬 객체라 포함).
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from benchmarks.fixture_store import BENCHMARK_DIR, iter_sources, load_index, load_fixture, run_parser
+from html_tree import ENGINES
+
+BASELINE_FILE = os.path.join(BENCHMARK_DIR, 'baseline.json')
+DEFAULT_REPEAT = 20
+DEFAULT_THRESHOLD = 2.0
+
+
+def measure(source_config: Dict, html_content: str, repeat: int, engine: Optional[str] = None,
+            region: Optional[bool] = None) -> Dict:
+    """
+    한 파서를 repeat번 실행해 소요 시간과 최대 메모리를 측정합니다.
+
+    시간 측정과 메모리 측정은 따로 실행합니다 (tracemalloc이 실행 속도를 늦추므로).
+    """
+    items = run_parser(source_config, html_content, engine, region)  # 워밍업 (정규식 컴파일 캐시 등)
+
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run_parser(source_config, html_content, engine, region)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    tracemalloc.start()
+    run_parser(source_config, html_content, engine, region)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    ms_per_page = statistics.median(timings)
+    return {
+        'items': len(items),
+        'ms_per_page': round(ms_per_page, 3),
+        'ms_min': round(min(timings), 3),
+        'pages_per_sec': round(1000 / ms_per_page, 2) if ms_per_page else 0.0,
+        'peak_kb': round(peak / 1024, 1),
+    }
+
+
+def comparable(items: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """실행 시각(scraped_at)을 뺀 파싱 결과"""
+    return [{k: v for k, v in item.items() if k != 'scraped_at'} for item in items]
+
+
+def compare_engines(index: Dict[str, Dict], only: Optional[List[str]], repeat: int, engines: List[str],
+                    region: Optional[bool] = None):
+    """
+    같은 fixture를 파서 엔진별로 측정해 속도/메모리와 결과 일치 여부를 출력합니다.
+
+    Returns:
+        결과가 엔진마다 다른 파서 이름 리스트
+    """
+    first, rest = engines[0], engines[1:]
+    header = ''.join(f"{engine + ' ms':>10}" for engine in engines)
+    header += ''.join(f"{engine + ' KB':>10}" for engine in engines)
+    print(f"{'파서':<26}{'뉴스':>5}{header}{'속도 비':>9}{'결과':>6}")
+    print("-" * (46 + 20 * len(engines)))
+
+    mismatched = []
+    totals = {engine: 0.0 for engine in engines}
+    for _, source_config in iter_sources(only):
+        parser_name = source_config['parser']
+        entry = index.get(parser_name)
+        if entry is None:
+            continue
+
+        html_content = load_fixture(parser_name, entry)
+        results = {engine: measure(source_config, html_content, repeat, engine, region) for engine in engines}
+        expected = comparable(run_parser(source_config, html_content, first, region))
+        same = all(comparable(run_parser(source_config, html_content, engine, region)) == expected
+                   for engine in rest)
+        if not same:
+            mismatched.append(parser_name)
+
+        for engine in engines:
+            totals[engine] += results[engine]['ms_per_page']
+        fastest = min(results[engine]['ms_per_page'] for engine in rest)
+        speedup = results[first]['ms_per_page'] / fastest if fastest else 0.0
+        print(f"{parser_name:<26}{len(expected):>5}"
+              + ''.join(f"{results[engine]['ms_per_page']:>10.2f}" for engine in engines)
+              + ''.join(f"{results[engine]['peak_kb']:>10.0f}" for engine in engines)
+              + f"{speedup:>8.1f}x{'같음' if same else '다름':>6}")
+
+    print("-" * (46 + 20 * len(engines)))
+    print("합계: " + ", ".join(f"{engine} {totals[engine]:.1f}ms" for engine in engines))
+    return mismatched
+
+
+def load_baseline() -> Dict[str, Dict]:
+    if not os.path.exists(BASELINE_FILE):
+        return {}
+    with open(BASELINE_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f).get('parsers', {})
+
+
+def save_baseline(results: Dict[str, Dict], repeat: int):
+    with open(BASELINE_FILE, 'w', encoding='utf-8') as f:
+        json.dump({
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'repeat': repeat,
+            'parsers': results,
+        }, f, ensure_ascii=False, indent=2)
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """
+    기준값 대비 시간/메모리가 threshold배 이상이거나 파싱 결과 수가 달라진 파서를 찾습니다.
+
+    Returns:
+        문제 설명 문자열 리스트
+    """
+    problems = []
+    for parser_name, result in results.items():
+        base = baseline.get(parser_name)
+        if not base:
+            continue
+        if result['ms_per_page'] >= base['ms_per_page'] * threshold:
+            problems.append(f"{parser_name}: 시간 {base['ms_per_page']:.2f} → {result['ms_per_page']:.2f}ms/page "
+                            f"({result['ms_per_page'] / base['ms_per_page']:.1f}배)")
+        if result['peak_kb'] >= base['peak_kb'] * threshold:
+            problems.append(f"{parser_name}: 메모리 {base['peak_kb']:.0f} → {result['peak_kb']:.0f}KB "
+                            f"({result['peak_kb'] / base['peak_kb']:.1f}배)")
+        if result['items'] != base['items']:
+            problems.append(f"{parser_name}: 뉴스 개수 {base['items']} → {result['items']}")
+    return problems
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='파서 벤치마크')
+    arg_parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help=f'파서별 반복 횟수 (기본 {DEFAULT_REPEAT})')
+    arg_parser.add_argument('--only', nargs='+', metavar='PARSER', help='측정할 파서 이름 (기본: 전체)')
+    arg_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                            help=f'기준값 대비 이 배수 이상이면 회귀로 표시 (기본 {DEFAULT_THRESHOLD})')
+    arg_parser.add_argument('--update-baseline', action='store_true', help='측정 결과를 기준값으로 저장')
+    arg_parser.add_argument('--output', metavar='FILE', help='측정 결과를 JSON으로 저장')
+    arg_parser.add_argument('--engine', nargs='+', choices=ENGINES, metavar='ENGINE',
+                            help=f"파서 엔진 ({'/'.join(ENGINES)}) - 하나면 그 엔진으로 측정, 여럿이면 엔진별 비교")
+    arg_parser.add_argument('--full-parse', action='store_true',
+                            help="'많이 본 뉴스' 섹션 조각 파싱 없이 페이지 전체를 파싱")
+    args = arg_parser.parse_args()
+    region = False if args.full_parse else None
+
+    index = load_index()
+    if not index:
+        print("⚠️ fixture가 없습니다. 먼저 python -m benchmarks.capture_fixtures 를 실행하세요.")
+        sys.exit(1)
+
+    if args.engine and len(args.engine) > 1:
+        mismatched = compare_engines(index, args.only, args.repeat, args.engine, region)
+        if mismatched:
+            print(f"\n❌ 엔진별 파싱 결과가 다른 파서: {', '.join(mismatched)}")
+            sys.exit(1)
+        print("\n✅ 모든 파서의 엔진별 결과가 같습니다")
+        return
+    engine = args.engine[0] if args.engine else None
+
+    baseline = load_baseline()
+    results = {}
+
+    print(f"{'파서':<26}{'뉴스':>5}{'ms/page':>10}{'pages/s':>10}{'peak KB':>10}{'기준 대비':>10}")
+    print("-" * 71)
+    for _, source_config in iter_sources(args.only):
+        parser_name = source_config['parser']
+        entry = index.get(parser_name)
+        if entry is None:
+            print(f"{parser_name:<26} fixture 없음")
+            continue
+
+        result = measure(source_config, load_fixture(parser_name, entry), args.repeat, engine, region)
+        results[parser_name] = result
+
+        base = baseline.get(parser_name)
+        ratio = f"{result['ms_per_page'] / base['ms_per_page']:.2f}x" if base else "-"
+        print(f"{parser_name:<26}{result['items']:>5}{result['ms_per_page']:>10.2f}"
+              f"{result['pages_per_sec']:>10.1f}{result['peak_kb']:>10.0f}{ratio:>10}")
+
+    total_ms = sum(r['ms_per_page'] for r in results.values())
+    print("-" * 71)
+    print(f"전체 {len(results)}개 페이지: {total_ms:.1f}ms ({len(results) / total_ms * 1000:.1f} pages/s)"
+          if total_ms else "측정 결과 없음")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if args.update_baseline:
+        save_baseline(results, args.repeat)
+        print(f"\n✅ 기준값 저장: {BASELINE_FILE}")
+        return
+
+    problems = compare(results, baseline, args.threshold)
+    if problems:
+        print(f"\n❌ 기준값 대비 회귀 ({args.threshold}배 이상 또는 결과 변경):")
+        for problem in problems:
+            print(f"  - {problem}")
+        sys.exit(1)
+    if baseline:
+        print("\n✅ 기준값 대비 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
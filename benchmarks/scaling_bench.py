@@ -0,0 +1,108 @@
+"""
+파서 규모 벤치마크
+기사 링크 수를 늘린 가상 중앙일보 섹션 페이지로 페이지 전체 보충(fill_items) 경로를 측정해
+링크 수에 비례하는 비용(선형)인지 확인합니다.
+
+    python -m benchmarks.scaling_bench
+    python -m benchmarks.scaling_bench --sizes 1000 4000 16000 --engine bs4
+
+가상 페이지는 '많이 본 기사' 순위가 비어 있어 페이지 전체 링크를 주변 요소로 분류해야 하며,
+카테고리와 무관한 링크 수천 개 뒤에 카테고리 링크가 있어 모든 링크를 확인합니다.
+    shared: 링크 전체가 하나의 큰 <div> 안에 있음 (상위 요소 HTML을 링크마다 만들면 제곱 비용)
+    items:  링크마다 작은 <div><li>로 감싸져 있음
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from typing import Dict, List, Optional
+
+from html_tree import ENGINES
+from parser import parse_with_spec
+
+PARSER_NAME = 'joongang_sports'
+CONTEXT_LINKS = 5
+LAYOUTS = ('shared', 'items')
+DEFAULT_SIZES = [500, 1000, 2000, 4000]
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 2.0
+
+
+def synthetic_page(links: int, layout: str) -> str:
+    """카테고리와 무관한 링크 links개 + 스포츠 링크 CONTEXT_LINKS개가 있는 섹션 페이지"""
+    if layout == 'shared':
+        other = '<div class="list">' + ''.join(
+            f'<span><a href="/article/{10000 + i}">오늘의 주요 기사 제목 {i}</a></span>' for i in range(links)) + '</div>'
+    else:
+        other = ''.join(
+            f'<div class="list"><li><a href="/article/{10000 + i}">오늘의 주요 기사 제목 {i}</a></li></div>'
+            for i in range(links))
+    context = ''.join(
+        f'<div class="sports"><li><a href="/article/{i}">스포츠 기사 제목 {i}</a></li></div>'
+        for i in range(1, CONTEXT_LINKS + 1))
+    return ('<html><head><title>스포츠</title></head><body>'
+            '<section class="chart"><header><div><strong class="title">스포츠 많이 본 기사</strong></div></header>'
+            '<ul></ul></section>'
+            f'{other}{context}</body></html>')
+
+
+def measure(html_content: str, repeat: int, engine: Optional[str]) -> Dict:
+    items = parse_with_spec(PARSER_NAME, html_content, CONTEXT_LINKS, engine, region=False)  # 워밍업
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        parse_with_spec(PARSER_NAME, html_content, CONTEXT_LINKS, engine, region=False)
+        timings.append((time.perf_counter() - started) * 1000)
+    return {'items': len(items), 'ms_per_page': statistics.median(timings)}
+
+
+def check_scaling(sizes: List[int], repeat: int, engine: Optional[str], threshold: float) -> List[str]:
+    """
+    배치별로 링크 수를 늘려 가며 링크당 시간을 측정합니다.
+
+    Returns:
+        가장 큰 페이지의 링크당 시간이 가장 작은 페이지의 threshold배 이상인 배치 설명 리스트
+    """
+    problems = []
+    print(f"{'배치':<8}{'링크 수':>8}{'뉴스':>6}{'ms/page':>10}{'µs/link':>10}{'증가':>8}")
+    print("-" * 50)
+    for layout in LAYOUTS:
+        first_per_link = None
+        for size in sizes:
+            result = measure(synthetic_page(size, layout), repeat, engine)
+            per_link = result['ms_per_page'] * 1000 / size
+            if first_per_link is None:
+                first_per_link = per_link
+            growth = per_link / first_per_link if first_per_link else 0.0
+            print(f"{layout:<8}{size:>8}{result['items']:>6}{result['ms_per_page']:>10.2f}"
+                  f"{per_link:>10.2f}{growth:>7.1f}x")
+            if result['items'] != CONTEXT_LINKS:
+                problems.append(f"{layout} {size}개: 뉴스 개수 {result['items']} (예상 {CONTEXT_LINKS})")
+        if growth >= threshold:
+            problems.append(f"{layout}: 링크당 시간 {first_per_link:.2f} → {per_link:.2f}µs ({growth:.1f}배)")
+    print("-" * 50)
+    return problems
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='파서 규모 벤치마크 (링크 수 대비 선형 여부)')
+    arg_parser.add_argument('--sizes', nargs='+', type=int, default=DEFAULT_SIZES, metavar='N',
+                            help=f"페이지당 링크 수 (기본 {' '.join(map(str, DEFAULT_SIZES))})")
+    arg_parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help=f'크기별 반복 횟수 (기본 {DEFAULT_REPEAT})')
+    arg_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                            help=f'링크당 시간이 이 배수 이상 늘면 실패 (기본 {DEFAULT_THRESHOLD})')
+    arg_parser.add_argument('--engine', choices=ENGINES, help='파서 엔진 (기본: 규칙의 engine 값)')
+    args = arg_parser.parse_args()
+
+    problems = check_scaling(sorted(args.sizes), args.repeat, args.engine, args.threshold)
+    if problems:
+        print(f"\n❌ 링크 수에 비례하지 않는 파싱 비용 ({args.threshold}배 이상 또는 결과 변경):")
+        for problem in problems:
+            print(f"  - {problem}")
+        sys.exit(1)
+    print("\n✅ 링크 수에 비례하는 파싱 비용")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+가상 섹션 페이지
+언론사 사이트 구조('많이 본 뉴스' 블록 + 다른 기사 링크 + 광고/본문 영역)를 흉내 낸 HTML을 만듭니다.
+실제 페이지를 저장하지 않은 새 체크아웃에서도 parser_bench를 실행할 수 있도록
+capture_fixtures --synthetic이 이 페이지로 fixture를 만듭니다 (기사 제목/URL은 모두 가상).
+
+    python -m benchmarks.capture_fixtures --synthetic
+"""
+
+from typing import Dict
+
+ITEMS = 10           # '많이 본 뉴스' 기사 수
+OTHER_LINKS = 150    # 카테고리와 무관한 링크 수 (메뉴, 다른 섹션 기사 등)
+FILLER_BLOCKS = 200  # 광고/본문 영역 블록 수
+
+DONGA_SECTIONS = {'정치': 'Politics', '스포츠': 'Sports', '경제': 'Economy',
+                  '사회': 'Society', '국제': 'Inter', '문화': 'Culture'}
+CHOSUN_HEADINGS = {'정치': '정치', '스포츠': '스포츠', '경제': '조선경제',
+                   '사회': '사회', '국제': '국제', '문화': '문화·라이프'}
+CHOSUN_PATHS = {'정치': 'politics', '스포츠': 'sports', '경제': 'economy',
+                '사회': 'national', '국제': 'international', '문화': 'culture-life'}
+
+
+def filler(prefix: str) -> str:
+    return ''.join(f'<div class="{prefix}-block"><p>광고 및 본문 영역 {i} 입니다. 가상 페이지 채움 문장.</p></div>'
+                   for i in range(FILLER_BLOCKS))
+
+
+def other_links(base_url: str) -> str:
+    return '<nav class="gnb"><ul>' + ''.join(
+        f'<li><a href="{base_url}/etc/{90000 + i}">다른 섹션의 가상 기사 제목 {i} 입니다</a></li>'
+        for i in range(OTHER_LINKS)) + '</ul></nav>'
+
+
+def donga_block(category: str) -> str:
+    section = DONGA_SECTIONS[category]
+    items = []
+    for i in range(ITEMS):
+        image = f'<img src="/img/{section.lower()}/{i}.jpg">' if i % 2 == 0 else ''
+        items.append(f'<li><div class="thumb">{image}</div>'
+                     f'<a href="https://www.donga.com/news/{section}/article/all/20261017/{130000 + i}/1">'
+                     f'동아 {category} 가상 기사 제목 {i} 입니다</a></li>')
+    return f'<div class="sec_trend"><h2 class="sec_tit">많이 본 {category} 뉴스</h2><ul>{"".join(items)}</ul></div>'
+
+
+def chosun_block(category: str) -> str:
+    path = CHOSUN_PATHS[category]
+    items = []
+    for i in range(ITEMS):
+        image = f'<img data-src="https://www.chosun.com/resizer/{path}/{i}.jpg">' if i % 3 == 0 else ''
+        items.append(f'<li>{image}<a href="/{path}/sub/2026/10/17/SYNTH{i:02d}ARTICLE/">'
+                     f'<h3>조선 {category} 가상 기사 제목 {i} 입니다</h3></a></li>')
+    return (f'<section class="flex-chain"><div><div class="flex-chain__heading-title">'
+            f'{CHOSUN_HEADINGS[category]} 많이 본 뉴스</div></div><ul>{"".join(items)}</ul></section>')
+
+
+def joongang_block(category: str) -> str:
+    items = ''.join(f'<li><span class="num">{i + 1}</span><a href="https://www.joongang.co.kr/article/{25000000 + i}">'
+                    f'중앙 {category} 가상 기사 제목 {i} 입니다</a></li>' for i in range(ITEMS))
+    return (f'<section class="chart"><header><div><strong class="title">{category} 많이 본 기사</strong></div>'
+            f'</header><ul>{items}</ul></section>')
+
+
+BLOCKS = {'동아일보': donga_block, '조선일보': chosun_block, '중앙일보': joongang_block}
+
+
+def section_page(category: str, source_config: Dict) -> bytes:
+    """NEWS_SOURCES의 소스 설정에 해당하는 가상 섹션 페이지 (UTF-8 바이트)"""
+    source = source_config['name']
+    base_url = '/'.join(source_config['url'].split('/')[:3])
+    html = (f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{source} {category}</title></head>'
+            f'<body>{other_links(base_url)}{filler("top")}{BLOCKS[source](category)}{filler("bottom")}</body></html>')
+    return html.encode('utf-8')
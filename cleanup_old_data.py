@@ -1,6 +1,6 @@
 """
 오래된 뉴스 데이터 정리 스크립트
-1개월(30일) 이상 지난 JSON 파일을 자동으로 삭제합니다.
+1개월(30일) 이상 지난 JSON 파일/일별 로그를 자동으로 삭제합니다.
 """
 
 import os
@@ -9,6 +9,8 @@ from datetime import datetime, timezone, timedelta
 from pathlib import Path
 import re
 
+from news_store import NewsStore
+
 # 한국 시간대 (KST = UTC+9)
 KST = timezone(timedelta(hours=9))
 
@@ -42,6 +44,8 @@ def parse_date_from_filename(filename: str) -> datetime | None:
     파일명에서 날짜를 추출합니다.
     파일명 형식:
     - 신 형식: news_2025-12-16_09-20.json
+    - 일별 로그: log_2025-12-16.jsonl
+    - 기사 본문: articles_2025-12-16.jsonl.gz
     - 구 형식: news_2025-12-16.json
 
     Args:
@@ -63,6 +67,30 @@ def parse_date_from_filename(filename: str) -> datetime | None:
             logger.error(f"날짜 파싱 실패: {date_str}")
             return None
 
+    # 일별 로그: log_2025-12-16.jsonl
+    pattern_log = r'log_(\d{4}-\d{2}-\d{2})\.jsonl'
+    match = re.match(pattern_log, filename)
+
+    if match:
+        date_str = match.group(1)
+        try:
+            return datetime.strptime(date_str, '%Y-%m-%d').replace(tzinfo=KST)
+        except ValueError:
+            logger.error(f"날짜 파싱 실패: {date_str}")
+            return None
+
+    # 기사 본문 (--full-text): articles_2025-12-16.jsonl.gz
+    pattern_articles = r'articles_(\d{4}-\d{2}-\d{2})\.jsonl\.gz'
+    match = re.match(pattern_articles, filename)
+
+    if match:
+        date_str = match.group(1)
+        try:
+            return datetime.strptime(date_str, '%Y-%m-%d').replace(tzinfo=KST)
+        except ValueError:
+            logger.error(f"날짜 파싱 실패: {date_str}")
+            return None
+
     # 구 형식 (시간대 없음): news_2025-12-16.json
     pattern_old = r'news_(\d{4}-\d{2}-\d{2})\.json'
     match = re.match(pattern_old, filename)
@@ -102,7 +130,10 @@ def cleanup_old_files(folder_path: str, retention_days: int) -> tuple[int, int]:
     # 모든 하위 폴더를 순회하며 JSON 파일 찾기
     for root, dirs, files in os.walk(folder_path):
         for filename in files:
-            if not filename.startswith('news_') or not filename.endswith('.json'):
+            is_news = filename.startswith('news_') and filename.endswith('.json')
+            is_log = filename.startswith('log_') and filename.endswith('.jsonl')
+            is_articles = filename.startswith('articles_') and filename.endswith('.jsonl.gz')
+            if not is_news and not is_log and not is_articles:
                 continue
 
             total_count += 1
@@ -174,6 +205,13 @@ def main():
         total_files += total
         logger.info(f"  - 전체 파일: {total}개, 삭제: {deleted}개")
 
+    # 뉴스 저장소(SQLite)의 오래된 항목 정리 (파일과 같은 보관 기간)
+    cutoff = (get_kst_now() - timedelta(days=DATA_RETENTION_DAYS)).strftime('%Y-%m-%d')
+    store = NewsStore()
+    store_deleted = store.delete_before(cutoff)
+    store.close()
+    logger.info(f"\n뉴스 저장소 정리: {cutoff} 이전 항목 {store_deleted}개 삭제")
+
     # 빈 디렉토리 정리
     logger.info("\n빈 디렉토리 정리 중...")
     empty_dirs_deleted = 0
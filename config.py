@@ -37,19 +37,19 @@ NEWS_SOURCES = {
         {
             'name': '동아일보',
             'url': 'https://www.donga.com/news/Politics',
-            'parser': 'donga_politics',  # parser.py의 parse_donga_politics 함수 사용
+            'parser': 'donga_politics',  # PARSER_SPECS['donga_politics'] 규칙 사용
             'max_articles': 5
         },
         {
             'name': '조선일보',
             'url': 'https://www.chosun.com/politics/',
-            'parser': 'chosun_politics',  # parser.py의 parse_chosun_politics 함수 사용
+            'parser': 'chosun_politics',  # PARSER_SPECS['chosun_politics'] 규칙 사용
             'max_articles': 5
         },
         {
             'name': '중앙일보',
             'url': 'https://www.joongang.co.kr/politics',
-            'parser': 'joongang_politics',  # parser.py의 parse_joongang_politics 함수 사용
+            'parser': 'joongang_politics',  # PARSER_SPECS['joongang_politics'] 규칙 사용
             'max_articles': 5
         },
         # 추가 정치 뉴스 소스는 여기에 추가
@@ -156,6 +156,206 @@ NEWS_SOURCES = {
     ]
 }
 
+# 섹션 페이지 파싱 규칙 (parser.py의 선택자 엔진이 import 시 한 번 컴파일해 실행)
+# NEWS_SOURCES의 'parser' 값이 키이며, 새 소스는 여기에 규칙을 추가하면 됩니다.
+#
+#   category / source        뉴스 항목에 기록할 카테고리와 소스 이름
+#   base_url                 상대 URL을 절대 URL로 바꿀 때 붙일 주소
+#   heading_tag / heading_class
+#                            '많이 본 뉴스' 제목 요소
+#   heading_text             제목 문자열 정규식 (요소의 .string과 비교)
+#   heading_text_contains    제목 텍스트에 모두 포함되어야 하는 단어 (heading_text 대신 사용)
+#   heading_text_fallback    제목 요소를 못 찾으면 페이지 전체 문자열에서 heading_text 검색
+#   container_parent / container_class
+#                            제목에서 위로 올라가 찾을 섹션 컨테이너 태그 (및 클래스)
+#   container_hops           태그와 무관하게 위로 올라갈 단계 수 (container_parent 대신 사용)
+#   link_pattern             기사 링크 href 정규식
+#   link_match               'search'(기본, 어디든 일치) / 'start'(href 앞부분부터 일치)
+#   rank_parent              지정하면 컨테이너에서 순위 번호(1, 2, ...) 텍스트를 찾아
+#                            그 상위 요소(이 태그들) 안의 첫 기사 링크를 순서대로 사용
+#   title_tags               링크 안에서 제목으로 쓸 태그 (없으면 링크 텍스트)
+#   min_title_length         이보다 짧은 제목은 제외 (기본 10)
+#   reject_numeric_title     숫자로만 된 제목 제외
+#   page_fallback            섹션에서 부족할 때 페이지 전체 링크 사용 방식
+#                            'if_empty'   링크를 하나도 못 찾으면 페이지 전체 링크로 대체
+#                            'fill_links' 링크가 max_articles보다 적으면 페이지 전체 링크로 보충
+#                            'fill_items' 항목이 max_articles보다 적으면 페이지 전체 링크로 보충
+#                                         (context_* 조건을 만족하는 링크만)
+#   context_markup           링크 상위 요소 HTML(소문자)에 이 중 하나가 있으면 같은 카테고리로 판단
+#   context_text / context_exclude
+#                            아니면 가까운 div/li 텍스트에 context_text가 있고 context_exclude가 없을 때
+#   date                     'url_yyyymmdd'(/20251201/) / 'url_ymd_path'(/2025/12/01/) / 'today'
+#                            URL에서 날짜를 못 찾으면 오늘 날짜
+#   image                    목록 페이지에서 이미지 URL 추출 여부 (기본 True - 섹션 컨테이너를 한 번 훑어
+#                            링크 → 가장 가까운 이미지(src, data-src, data-lazy-src, srcset) 맵을 만듦)
+#   article_images           목록에서 못 찾은 이미지를 기사 페이지에서 조회 (기본 True,
+#                            목록 이미지가 항상 있는 소스는 False로 이미지 조회 단계를 건너뜀)
+#   extra_fields             항목에 추가할 고정 필드
+#   engine                   'lxml'(XPath 탐색) / 'bs4'(BeautifulSoup) - 생략 시 PARSER_ENGINE
+#                            두 엔진의 결과는 같으며, 문제가 생긴 소스만 'bs4'로 되돌릴 수 있음
+PARSER_ENGINE = 'lxml'
+SECTION_REGION_PARSE = True  # '많이 본 뉴스' 섹션 조각만 먼저 파싱 (못 찾으면 페이지 전체 파싱)
+
+DONGA_SPEC = {
+    'source': '동아일보',
+    'base_url': 'https://www.donga.com',
+    'heading_tag': 'h2',
+    'heading_class': 'sec_tit',
+    'heading_text_fallback': True,
+    'container_parent': ['div', 'section', 'article'],
+    'date': 'url_yyyymmdd',
+}
+
+CHOSUN_SPEC = {
+    'source': '조선일보',
+    'base_url': 'https://www.chosun.com',
+    'heading_tag': 'div',
+    'heading_class': 'flex-chain__heading-title',
+    'container_hops': 2,
+    'page_fallback': 'if_empty',
+    'date': 'url_ymd_path',
+}
+
+JOONGANG_SPEC = {
+    'source': '중앙일보',
+    'base_url': 'https://www.joongang.co.kr',
+    'heading_tag': 'strong',
+    'heading_class': 'title',
+    'container_hops': 3,
+    'link_pattern': r'/article/\d+',
+    'rank_parent': ['li', 'div', 'article'],
+    'reject_numeric_title': True,
+    'page_fallback': 'fill_items',
+    'date': 'today',
+}
+
+PARSER_SPECS = {
+    # 정치
+    'donga_politics': {
+        **DONGA_SPEC,
+        'category': '정치',
+        'heading_text': r'많이 본 정치 뉴스',
+        'link_pattern': r'/news/Politics/article/all/\d+/\d+/\d+',
+    },
+    'chosun_politics': {
+        **CHOSUN_SPEC,
+        'category': '정치',
+        'heading_text': r'정치\s*많이\s*본\s*뉴스',
+        'link_pattern': r'/politics/[^/]+/\d{4}/\d{2}/\d{2}/[A-Z0-9]+/?',
+    },
+    'joongang_politics': {
+        **JOONGANG_SPEC,
+        'category': '정치',
+        'heading_text': r'정치\s*많이\s*본\s*기사',
+        'context_markup': ['politics'],
+        'context_text': '정치',
+        'context_exclude': ['경제', '스포츠', '문화', '연예', '사회', '국제'],
+    },
+    # 스포츠
+    'joongang_sports': {
+        **JOONGANG_SPEC,
+        'category': '스포츠',
+        'heading_text': r'스포츠\s*많이\s*본\s*기사',
+        'context_markup': ['sports', 'sport'],
+        'context_text': '스포츠',
+    },
+    'donga_sports': {
+        **DONGA_SPEC,
+        'category': '스포츠',
+        'heading_text': r'많이 본 스포츠 뉴스',
+        'link_pattern': r'/news/Sports/article/all/\d+/\d+/\d+',
+    },
+    'chosun_sports': {
+        **CHOSUN_SPEC,
+        'category': '스포츠',
+        'heading_text': r'스포츠\s*많이\s*본\s*뉴스',
+        'link_pattern': r'/sports/[^/]+/\d{4}/\d{2}/\d{2}/[A-Z0-9]+/?',
+    },
+    # 경제
+    'joongang_economy': {
+        **JOONGANG_SPEC,
+        'category': '경제',
+        'heading_text': r'경제\s*많이\s*본\s*기사',
+        'context_markup': ['economy'],
+        'context_text': '경제',
+        'extra_fields': {'main_category': '경제'},
+    },
+    'donga_economy': {
+        **DONGA_SPEC,
+        'category': '경제',
+        'heading_text': r'많이 본 경제 뉴스',
+        'link_pattern': r'/news/Economy/article/all/\d+/\d+/\d+',
+        'extra_fields': {'main_category': '경제'},
+    },
+    'chosun_economy': {
+        **CHOSUN_SPEC,
+        'category': '경제',
+        'heading_text': r'조선경제\s*많이\s*본\s*뉴스',
+        'link_pattern': r'/economy/[^/]+/\d{4}/\d{2}/\d{2}/[A-Z0-9]+/?',
+        'extra_fields': {'main_category': '경제'},
+    },
+    # 사회
+    'chosun_society': {
+        **CHOSUN_SPEC,
+        'category': '사회',
+        'heading_text': r'사회\s*많이\s*본\s*뉴스',
+        'link_pattern': r'/national/[^/]+/\d{4}/\d{2}/\d{2}/[A-Z0-9]+/?',
+    },
+    'joongang_society': {
+        **JOONGANG_SPEC,
+        'category': '사회',
+        'heading_text': r'사회\s*많이\s*본\s*기사',
+    },
+    'donga_society': {
+        **DONGA_SPEC,
+        'category': '사회',
+        'heading_text': r'많이 본 사회 뉴스',
+        'link_pattern': r'/news/Society/article/all/\d+/\d+/\d+',
+    },
+    # 국제
+    'chosun_international': {
+        **CHOSUN_SPEC,
+        'category': '국제',
+        'heading_text': r'국제\s*많이\s*본\s*뉴스',
+        'link_pattern': r'/international/[^/]+/\d{4}/\d{2}/\d{2}/[A-Z0-9]+/?',
+    },
+    'joongang_international': {
+        **JOONGANG_SPEC,
+        'category': '국제',
+        'heading_text': r'국제\s*많이\s*본\s*기사',
+    },
+    'donga_international': {
+        **DONGA_SPEC,
+        'category': '국제',
+        'heading_text': r'많이 본 국제 뉴스',
+        'link_pattern': r'/news/Inter/article/all/\d+/\d+/\d+',
+    },
+    # 문화 (조선일보는 '문화·라이프' 섹션 + 연예 기사 포함)
+    'chosun_culture': {
+        **CHOSUN_SPEC,
+        'category': '문화',
+        'heading_text_contains': ['문화', '라이프', '많이'],
+        'container_hops': 0,
+        'container_parent': 'section',
+        'container_class': 'flex-chain',
+        'link_pattern': r'/(culture-life|entertainments)/[^/]+/\d{4}/\d{2}/\d{2}/[A-Z0-9]+/?',
+        'link_match': 'start',
+        'title_tags': ['h2', 'h3', 'h4', 'h5', 'h6'],
+        'page_fallback': 'fill_links',
+    },
+    'joongang_culture': {
+        **JOONGANG_SPEC,
+        'category': '문화',
+        'heading_text': r'문화\s*많이\s*본\s*기사',
+    },
+    'donga_culture': {
+        **DONGA_SPEC,
+        'category': '문화',
+        'heading_text': r'많이 본 문화 뉴스',
+        'link_pattern': r'/news/Culture/article/all/\d+/\d+/\d+',
+    },
+}
+
 # HTTP 요청 설정
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -163,18 +363,82 @@ HEADERS = {
     'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
 }
 
-# 요청 간 대기 시간 (초)
+# 같은 호스트에 대한 요청 간 대기 시간 (초)
+# 호스트별로 독립 적용되므로 서로 다른 언론사 요청은 기다리지 않음
 REQUEST_DELAY = 2
 
+# 호스트별 최대 동시 요청 수 (섹션 페이지 비동기 수집)
+HOST_CONCURRENCY = {
+    'www.donga.com': 2,
+    'www.chosun.com': 2,
+    'www.joongang.co.kr': 2,
+}
+DEFAULT_HOST_CONCURRENCY = 1  # HOST_CONCURRENCY에 없는 호스트
+
+# 기사 이미지 추출 설정 (호스트별 token bucket)
+IMAGE_WORKERS_PER_HOST = 2  # 호스트별 이미지 조회 작업자 수
+IMAGE_RATE_LIMITS = {  # 호스트별 초당 기사 요청 수
+    'www.donga.com': 2.0,
+    'www.chosun.com': 2.0,
+    'www.joongang.co.kr': 2.0,
+}
+DEFAULT_IMAGE_RATE_LIMIT = 2.0  # IMAGE_RATE_LIMITS에 없는 호스트
+IMAGE_RATE_BURST = 2  # 한 번에 몰아서 보낼 수 있는 최대 요청 수
+ARTICLE_HEAD_ONLY = True  # 기사 페이지는 <head>까지만 스트리밍으로 읽기 (og:image 추출용)
+ARTICLE_CHUNK_SIZE = 16 * 1024  # 스트리밍 읽기 청크 크기 (바이트)
+ARTICLE_DRAIN_LIMIT = 64 * 1024  # head 이후 남은 본문이 이보다 작으면 마저 읽어 연결 재사용
+
+# 기사 본문 수집 (선택 기능, python crawler.py --full-text로도 켤 수 있음)
+ARTICLE_FULL_TEXT = False  # 새로 발견한 기사의 본문을 가져와 압축 저장
+ARTICLE_TEXT_WORKERS = 4  # 본문 수집 작업자 수 (호스트별 속도는 IMAGE_RATE_LIMITS)
+
+# 파싱 프로세스 풀 (섹션 페이지 파싱 + 기사 이미지 추출)
+PARSE_WORKERS = None  # 작업 프로세스 수 (None: CPU 코어 수, 0: 프로세스 풀 없이 수집 스레드에서 파싱)
+
+# 크롤링 간 공유되는 캐시 저장 경로
+CACHE_DIR = "cache"
+
+# 기사 URL → 이미지 URL 캐시 설정
+IMAGE_CACHE_FILE = f"{CACHE_DIR}/image_cache.json"
+IMAGE_CACHE_TTL = 7 * 24 * 3600  # 이미지를 찾은 기사 (초)
+IMAGE_CACHE_NEGATIVE_TTL = 6 * 3600  # 이미지가 없었던 기사 (초)
+IMAGE_CACHE_MAX_ENTRIES = 5000  # 초과 시 가장 오래 사용하지 않은 항목부터 제거
+
+# 섹션 페이지 조건부 요청 캐시 (ETag / Last-Modified + 본문)
+HTTP_CACHE_DIR = f"{CACHE_DIR}/http"
+
+# 응답 기록/재생 (python crawler.py --record / --replay <dir>)
+ARCHIVE_DIR = "archive"  # --record에 디렉토리를 주지 않으면 archive/{날짜}_{시간대}에 기록
+# 재생 결과를 쓰는 폴더 (보관소 안, 재생할 때마다 비우고 다시 만듦)
+# 재생은 실제 data/, docs/data, db/, reports/를 건드리지 않고 이 폴더 아래에 같은 구조로 씁니다
+REPLAY_OUTPUT_DIR = "output"
+
 # 타임아웃 설정 (초)
 REQUEST_TIMEOUT = 30
 
+# 호스트별 keep-alive 세션 설정
+HTTP_POOL_SIZE = 4  # 호스트별 최대 유지 연결 수 (섹션 + 이미지 동시 요청 수 이상)
+HTTP_ADAPTER_RETRIES = 1  # 끊어진 연결 재접속 시도 횟수 (상태 코드 재시도는 MAX_RETRIES)
+
+# 뉴스 저장소 (SQLite, WAL 모드) - 기준 저장소이며 일별 로그/시간대별 JSON 파일은 여기 저장할 때 함께 씀
+DB_DIR = "db"
+NEWS_DB_FILE = f"{DB_DIR}/news.sqlite3"
+SEEN_URL_RETENTION_DAYS = 7  # 기사 URL 색인 보관 기간 (마지막으로 본 날부터, 일)
+
 # 데이터 저장 경로
 DATA_DIR = "data"
-# 카테고리/소스별 JSON 파일: data/{category}/{source}/news_{date}_{time}.json
-NEWS_JSON_TEMPLATE = f"{DATA_DIR}/{{category}}/{{source}}/news_{{date}}_{{time}}.json"
+# 카테고리/소스별 일별 로그 (추가 전용 JSON Lines, 바뀐 항목만 압축 기록): data/{category}/{source}/log_{date}.jsonl
+NEWS_LOG_TEMPLATE = f"{DATA_DIR}/{{category}}/{{source}}/log_{{date}}.jsonl"
+# GitHub Pages가 읽는 시간대별 JSON 파일: docs/data/{category}/{source}/news_{date}_{time}.json
+SITE_DATA_DIR = "docs/data"
+NEWS_JSON_TEMPLATE = f"{SITE_DATA_DIR}/{{category}}/{{source}}/news_{{date}}_{{time}}.json"
+# 기사 본문 (gzip JSON Lines): data/{category}/{source}/articles_{date}.jsonl.gz
+ARTICLE_TEXT_TEMPLATE = f"{DATA_DIR}/{{category}}/{{source}}/articles_{{date}}.jsonl.gz"
+ARTICLE_TEXT_INDEX_FILE = f"{DATA_DIR}/article_text_index.tsv"  # 본문을 저장한 기사 URL (다시 요청하지 않음)
 LOGS_DIR = "logs"
 LOG_FILE = f"{LOGS_DIR}/crawler.log"
+# 실행별 단계 소요 시간/카운터 요약 (JSON)
+RUN_METRICS_TEMPLATE = f"{LOGS_DIR}/run_metrics_{{date}}_{{time}}.json"
 
 # 보고서 저장 경로
 REPORT_DIR = "reports"
@@ -190,6 +454,12 @@ CRAWL_TIME = "09:00"  # 매일 오전 9시에 실행
 # 보고서 자동 생성 설정
 AUTO_GENERATE_REPORT = True  # 크롤링 후 자동으로 보고서 생성
 
-# 재시도 설정
+# 재시도 설정 (지수 백오프 + jitter)
 MAX_RETRIES = 3
-RETRY_DELAY = 5  # 재시도 전 대기 시간 (초)
+RETRY_DELAY = 2  # 재시도 기본 대기 시간 (초), 시도마다 2배씩 늘어난 범위에서 무작위 대기
+RETRY_MAX_DELAY = 30  # 재시도 대기 시간 상한 (초)
+RETRYABLE_STATUSES = (429, 500, 502, 503, 504)  # 재시도할 HTTP 상태 코드
+
+# 호스트별 회로 차단기 설정
+CIRCUIT_BREAKER_THRESHOLD = 3  # 연속 실패 횟수가 이 값에 도달하면 해당 호스트 요청 차단
+CIRCUIT_BREAKER_RESET_TIMEOUT = 60  # 차단 후 시험 요청을 허용하기까지의 시간 (초)
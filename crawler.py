@@ -1,17 +1,21 @@
 """
 멀티 카테고리 뉴스 크롤러 메인 모듈
-여러 뉴스 소스를 카테고리별로 크롤링하고 JSON 파일로 저장합니다.
+여러 뉴스 소스를 카테고리별로 크롤링하고 뉴스 저장소(SQLite)와 JSON 파일로 저장합니다.
 """
 
 import requests
-import json
+import argparse
 import time
 import os
+import asyncio
+import threading
+import sqlite3
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Iterator
 import logging
-from bs4 import BeautifulSoup
 import re
+import shutil
+from contextlib import contextmanager
 
 # 한국 시간대 (KST = UTC+9)
 KST = timezone(timedelta(hours=9))
@@ -21,13 +25,31 @@ def get_kst_now():
     return datetime.now(KST)
 
 from config import (
-    NEWS_SOURCES, HEADERS, REQUEST_DELAY, REQUEST_TIMEOUT,
-    DATA_DIR, NEWS_JSON_TEMPLATE, LOGS_DIR, LOG_FILE,
-    MAX_RETRIES, RETRY_DELAY, AUTO_GENERATE_REPORT,
-    CATEGORY_EN_MAP, SOURCE_EN_MAP, COMBINED_REPORT_TEMPLATE
+    NEWS_SOURCES, REQUEST_TIMEOUT, REQUEST_DELAY, ARCHIVE_DIR,
+    DATA_DIR, SITE_DATA_DIR, NEWS_JSON_TEMPLATE, LOGS_DIR, LOG_FILE,
+    AUTO_GENERATE_REPORT,
+    CATEGORY_EN_MAP, SOURCE_EN_MAP, COMBINED_REPORT_TEMPLATE, RUN_METRICS_TEMPLATE,
+    ARTICLE_HEAD_ONLY, ARTICLE_CHUNK_SIZE, ARTICLE_DRAIN_LIMIT, ARTICLE_FULL_TEXT, ARTICLE_TEXT_TEMPLATE,
+    SEEN_URL_RETENTION_DAYS, REPLAY_OUTPUT_DIR
 )
 import parser
-from parser import get_crawl_time_str
+from parser import get_crawl_date_str, get_crawl_time_str, set_crawl_slot
+from fetch_engine import fetch_as_completed
+from image_resolver import ImageResolver
+from image_cache import ImageCache
+from http_session import get_session, get_declared_encoding, log_connection_stats, set_archive
+from http_cache import HttpCache, items_hash
+from fetch_engine import get_host
+from retry_policy import RetryPolicy, CircuitBreakerRegistry
+from archive import open_archive, read_run_info, MODE_RECORD, MODE_REPLAY
+from metrics import run_metrics
+from parse_pool import ParsePool
+from article_text import ArticleTextStore, ArticleTextFetcher
+from news_store import classify_seen, close_news_store, get_news_store, get_source_key, write_slot_json
+from news_log import append_slot, get_log_path
+from news_item import NewsItem, to_dicts
+from output_writer import output_writer
+from html_tree import ArticleTextExtractor
 
 
 # 로깅 설정
@@ -46,45 +68,112 @@ def setup_logging():
     return logging.getLogger(__name__)
 
 
-logger = setup_logging()
+# 파싱 작업 프로세스(forkserver/spawn)가 실행 스크립트를 __mp_main__으로 다시 불러올 때는 로그 파일을 열지 않음
+logger = setup_logging() if __name__ != '__mp_main__' else logging.getLogger(__name__)
 
+# 섹션/기사 요청 공통 재시도 정책과 호스트별 회로 차단기 (crawl_news 실행마다 초기화)
+retry_policy = RetryPolicy()
+circuit_breakers = CircuitBreakerRegistry()
+# 섹션/기사 페이지 파싱 프로세스 풀 (run_crawl 시작 때 띄우고 끝에 종료)
+parse_pool = ParsePool()
 
-def extract_article_image(article_url: str, source: str) -> str:
+
+# 기사 페이지 <head> 스트리밍 읽기용 패턴
+HEAD_END_PATTERN = re.compile(rb'</head\s*>', re.IGNORECASE)
+OG_IMAGE_META_PATTERN = re.compile(rb'<meta[^>]+property\s*=\s*["\']og:image["\'][^>]*>', re.IGNORECASE)
+
+# 기사 페이지 다운로드 통계 (실행 요약에 출력)
+article_fetch_stats = {
+    'requests': 0,
+    'head_only': 0,      # <head>만 읽고 연결을 닫은 요청
+    'bytes_read': 0,     # 실제로 전송받은 바이트 (압축 기준)
+    'bytes_saved': 0,    # Content-Length 대비 읽지 않은 바이트
+}
+article_fetch_stats_lock = threading.Lock()
+
+# 소스별 처리 결과 (실행 요약/보고서 재생성 판단에 사용, run_crawl 시작 시 초기화)
+saved_sources = set()   # 뉴스 파일을 저장한 (카테고리, 소스)
+skipped_sources = {}    # 목록 변경 없음으로 건너뛴 '카테고리/소스' → 이전 이미지/병합/저장 시간 (초)
+source_stats_lock = threading.Lock()
+
+
+def read_article_head(response: requests.Response) -> Tuple[bytes, bytes, Iterator[bytes]]:
+    """
+    응답 본문을 청크 단위로 읽다가 og:image 메타 태그나 </head>를 만나면 멈춥니다.
+
+    Args:
+        response: stream=True로 요청한 응답 객체
+
+    Returns:
+        (head 부분 바이트, 이미 읽었지만 head 이후인 바이트, 남은 청크 이터레이터)
+    """
+    buffer = bytearray()
+    chunks = response.iter_content(chunk_size=ARTICLE_CHUNK_SIZE)
+    for chunk in chunks:
+        # 청크 경계에 걸친 태그도 찾도록 이전 청크 끝부분부터 다시 검색
+        search_from = max(0, len(buffer) - 1024)
+        buffer.extend(chunk)
+        match = (OG_IMAGE_META_PATTERN.search(buffer, search_from)
+                 or HEAD_END_PATTERN.search(buffer, search_from))
+        if match:
+            return bytes(buffer[:match.end()]), bytes(buffer[match.end():]), chunks
+    return bytes(buffer), b"", iter(())
+
+
+def extract_article_image(article_url: str, source: str) -> Optional[str]:
     """
     기사 URL에서 대표 이미지를 추출합니다.
     
+    ARTICLE_HEAD_ONLY가 켜져 있으면 <head>까지만 내려받아 파싱하고,
+    head에 이미지 메타 태그가 없을 때만 본문 전체를 이어서 읽습니다.
+    
     Args:
         article_url: 기사 URL
         source: 뉴스 소스 이름
         
     Returns:
-        이미지 URL 문자열 (없으면 빈 문자열)
+        이미지 URL 문자열 (페이지에 이미지가 없으면 빈 문자열,
+        요청 실패/차단으로 확인하지 못했으면 None - 이미지 캐시에 저장하지 않음)
     """
+    # 섹션 페이지 요청이 연속 실패한 호스트는 기사 요청도 보내지 않음
+    if circuit_breakers.get(get_host(article_url)).is_open():
+        return None
+    
     try:
-        response = requests.get(article_url, headers=HEADERS, timeout=REQUEST_TIMEOUT)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'lxml')
-        
-        image_url = ""
-        
-        # Open Graph 이미지 메타 태그 (가장 일반적)
-        og_image = soup.find('meta', property='og:image')
-        if og_image:
-            image_url = og_image.get('content', '')
-        
-        # Twitter 카드 이미지
-        if not image_url:
-            twitter_image = soup.find('meta', attrs={'name': 'twitter:image'})
-            if twitter_image:
-                image_url = twitter_image.get('content', '')
+        session = get_session(article_url)
+        with session.get(article_url, timeout=REQUEST_TIMEOUT, stream=ARTICLE_HEAD_ONLY) as response:
+            response.raise_for_status()
+            head_only = False
+            
+            if ARTICLE_HEAD_ONLY:
+                html_bytes, rest, chunks = read_article_head(response)
+                image_url = parse_pool.find_article_image(html_bytes)
+                if image_url:
+                    head_only = True
+                    # 남은 본문이 작으면 마저 읽어 keep-alive 연결을 풀에 돌려줌
+                    # (읽지 않고 닫으면 다음 요청에서 TCP/TLS 연결을 새로 맺어야 함)
+                    content_length = int(response.headers.get('Content-Length') or 0)
+                    if 0 < content_length - response.raw.tell() <= ARTICLE_DRAIN_LIMIT:
+                        for _ in chunks:
+                            pass
+                else:
+                    # head에 메타 태그가 없으면 본문 첫 이미지를 찾기 위해 끝까지 읽기
+                    html_bytes = html_bytes + rest + b"".join(chunks)
+                    image_url = parse_pool.find_article_image(html_bytes)
+            else:
+                image_url = parse_pool.find_article_image(response.content)
+            
+            bytes_read = response.raw.tell()
+            content_length = int(response.headers.get('Content-Length') or 0)
         
-        # 기사 본문의 첫 번째 이미지
-        if not image_url:
-            article_body = soup.find(['article', 'div'], class_=re.compile(r'article|content|body'))
-            if article_body:
-                img_tag = article_body.find('img')
-                if img_tag:
-                    image_url = img_tag.get('src', '') or img_tag.get('data-src', '')
+        run_metrics.add('article_requests')
+        run_metrics.add('article_bytes', bytes_read)
+        with article_fetch_stats_lock:
+            article_fetch_stats['requests'] += 1
+            article_fetch_stats['bytes_read'] += bytes_read
+            if head_only:
+                article_fetch_stats['head_only'] += 1
+                article_fetch_stats['bytes_saved'] += max(0, content_length - bytes_read)
         
         # 상대 URL을 절대 URL로 변환
         if image_url and image_url.startswith('/'):
@@ -97,46 +186,187 @@ def extract_article_image(article_url: str, source: str) -> str:
         
     except Exception as e:
         logger.debug(f"이미지 추출 실패 ({article_url}): {e}")
-        return ""
+        return None
+
+
+def fetch_article_text(article_url: str) -> Optional[Dict[str, object]]:
+    """
+    기사 페이지를 스트리밍으로 받으면서 본문을 추출합니다 (기사 본문 수집 모드).
+
+    받은 청크를 바로 ArticleTextExtractor에 넘기므로 페이지 전체나 트리 전체를 메모리에 두지 않습니다.
+
+    Args:
+        article_url: 기사 URL
+
+    Returns:
+        {'title', 'content', 'full_content_length'} 또는 실패/본문 없음 시 None
+    """
+    # 섹션 페이지와 같은 회로 차단기로 결과를 기록 (반열림 상태에서는 시험 요청 하나만 보냄)
+    breaker = circuit_breakers.get(get_host(article_url))
+    if not breaker.allow_request():
+        return None
+
+    try:
+        session = get_session(article_url)
+        with session.get(article_url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            extractor = ArticleTextExtractor(get_declared_encoding(response.headers))
+            for chunk in response.iter_content(chunk_size=ARTICLE_CHUNK_SIZE):
+                extractor.feed(chunk)
+            bytes_read = response.raw.tell()
+    except requests.exceptions.RequestException as e:
+        if retry_policy.is_retryable(e):
+            breaker.record_failure()
+        else:
+            breaker.release()
+        raise
+    except Exception:
+        breaker.release()
+        raise
+    breaker.record_success()
+    run_metrics.add('article_text_bytes', bytes_read)
+
+    article = extractor.close()
+    return article if article['content'] else None
+
+
+def log_article_fetch_stats():
+    """기사 페이지 다운로드량과 head-only 읽기로 절약한 바이트를 로그로 출력합니다."""
+    stats = article_fetch_stats
+    if not stats['requests']:
+        return
+    logger.info(
+        f"기사 페이지 요청 {stats['requests']}건 (head만 읽음 {stats['head_only']}건), "
+        f"수신 {stats['bytes_read'] / 1024:.1f}KB, 절약 {stats['bytes_saved'] / 1024:.1f}KB"
+    )
+
+
+def log_region_parse_stats():
+    """'많이 본 뉴스' 조각 파싱 성공/전체 파싱 전환 횟수를 로그로 출력합니다."""
+    parsed = run_metrics.counters.get('region_parses', 0)
+    fallbacks = run_metrics.counters.get('region_fallbacks', 0)
+    if not parsed + fallbacks:
+        return
+    logger.info(
+        f"섹션 조각 파싱 {parsed}건, 전체 파싱 전환 {fallbacks}건 "
+        f"(전환율 {fallbacks / (parsed + fallbacks) * 100:.1f}%)"
+    )
+
+
+def log_new_items():
+    """소스별로 이번 실행에서 처음 본 기사 수(오늘/이전에 본 기사 제외)를 로그로 출력합니다."""
+    names = ('items_new', 'items_seen_today', 'items_seen_earlier')
+    totals = [run_metrics.counters.get(name, 0) for name in names]
+    if not sum(totals):
+        return
+    logger.info(f"\n새 기사 {totals[0]}개 (오늘 본 기사 {totals[1]}개, 이전 날짜에 본 기사 {totals[2]}개 제외):")
+    for scope, source in sorted(run_metrics.sources.items()):
+        new, seen_today, seen_earlier = (source['counters'].get(name, 0) for name in names)
+        if new + seen_today + seen_earlier:
+            logger.info(f"  - {scope}: 새 기사 {new}개 / 오늘 본 기사 {seen_today}개 / 이전에 본 기사 {seen_earlier}개")
+
+
+def log_skipped_sources():
+    """파싱한 목록이 이전과 같아 이미지/병합/저장을 건너뛴 소스와 절약한 시간을 로그로 출력합니다."""
+    if not skipped_sources:
+        return
+    logger.info(f"\n목록 변경 없음으로 건너뛴 소스 {len(skipped_sources)}개 "
+                f"(이전 처리 시간 기준 약 {sum(skipped_sources.values()):.2f}초 절약):")
+    for name, seconds in sorted(skipped_sources.items()):
+        logger.info(f"  - {name}: {seconds:.2f}초")
 
 
-def fetch_page(url: str, retries: int = MAX_RETRIES) -> Optional[str]:
+def fetch_page(url: str, retries: Optional[int] = None,
+               http_cache: Optional[HttpCache] = None) -> Optional[Tuple[bytes, Optional[str]]]:
     """
     URL에서 HTML 페이지를 가져옵니다.
     
+    본문은 디코딩하지 않고 바이트와 Content-Type에 선언된 인코딩을 그대로 반환합니다.
+    (response.text의 디코딩/문자셋 추정 없이 파싱 작업자가 parse_pool에서 한 번만 디코딩)
+    재시도는 retry_policy에 따라 지수 백오프 + jitter로 대기하며 재시도 가능한 오류만 재시도합니다.
+    호스트의 회로 차단기가 열려 있으면 요청하지 않고 즉시 실패합니다.
+    http_cache가 주어지면 If-None-Match / If-Modified-Since 조건부 요청을 보내고,
+    304 응답이면 캐시된 HTML을 반환합니다.
+    
     Args:
         url: 크롤링할 URL
-        retries: 재시도 횟수
+        retries: 최대 시도 횟수 (생략 시 retry_policy.max_attempts)
+        http_cache: 섹션 페이지 HTTP 캐시 (선택)
         
     Returns:
-        HTML 문자열 또는 실패 시 None
+        (HTML 바이트, 선언된 인코딩) 또는 실패 시 None
     """
+    retries = retries or retry_policy.max_attempts
+    session = get_session(url)
+    breaker = circuit_breakers.get(get_host(url))
+    started = time.monotonic()
+    
     for attempt in range(retries):
+        if not breaker.allow_request():
+            logger.warning(f"회로 차단기 열림 ({breaker.host}) - 요청 생략: {url}")
+            if attempt > 0:
+                # 재시도 도중 차단된 요청도 실패한 요청으로 집계
+                breaker.record_failed_fetch(time.monotonic() - started)
+            return None
+        
         try:
             logger.info(f"페이지 가져오기 시도 ({attempt + 1}/{retries}): {url}")
-            response = requests.get(
-                url,
-                headers=HEADERS,
-                timeout=REQUEST_TIMEOUT
-            )
+            run_metrics.add('section_requests')
+            headers = http_cache.conditional_headers(url) if http_cache else {}
+            response = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            logger.info(f"페이지 가져오기 성공: {url}")
-            return response.text
+            if http_cache:
+                page = http_cache.handle_response(url, response)
+                if page is None:
+                    # 304인데 캐시 본문이 사라진 경우 조건 없이 다시 요청
+                    response = session.get(url, timeout=REQUEST_TIMEOUT)
+                    response.raise_for_status()
+                    page = http_cache.handle_response(url, response)
+            else:
+                page = response.content, get_declared_encoding(response.headers)
+            
+            breaker.record_success()
+            run_metrics.add('section_bytes', len(response.content))
+            logger.info(f"페이지 가져오기 성공 ({response.status_code}): {url}")
+            return page
             
         except requests.exceptions.RequestException as e:
+            retryable = retry_policy.is_retryable(e)
             logger.warning(f"요청 실패 (시도 {attempt + 1}/{retries}): {e}")
             
-            if attempt < retries - 1:
-                logger.info(f"{RETRY_DELAY}초 후 재시도...")
-                time.sleep(RETRY_DELAY)
+            if retryable:
+                breaker.record_failure()
+            else:
+                breaker.release()
+            
+            if retryable and attempt < retries - 1:
+                delay = retry_policy.get_delay(attempt, e)
+                logger.info(f"{delay:.1f}초 후 재시도...")
+                time.sleep(delay)
             else:
-                logger.error(f"최대 재시도 횟수 초과: {url}")
+                if retryable:
+                    breaker.record_failed_fetch(time.monotonic() - started)
+                    logger.error(f"최대 재시도 횟수 초과: {url}")
+                else:
+                    logger.error(f"재시도하지 않는 오류: {url}")
                 return None
-    
+
+        except Exception:
+            # 요청 외 오류(캐시 저장 실패 등)로 끝난 시험 요청도 반납해 반열림 상태에 묶이지 않도록 함
+            breaker.release()
+            raise
+
     return None
 
 
+def get_metrics_scope(category: str, source: str) -> str:
+    """실행 지표에서 소스 단위로 집계할 때 사용하는 scope ('politics/donga' 형식)"""
+    category_en = CATEGORY_EN_MAP.get(category, category.lower())
+    source_en = SOURCE_EN_MAP.get(source, source.lower().replace(' ', '_'))
+    return f"{category_en}/{source_en}"
+
+
 def get_category_source_path(category: str, source: str, date: str, time: str = None, is_report: bool = False) -> str:
     """
     카테고리와 소스에 따른 파일 경로를 생성합니다.
@@ -163,16 +393,23 @@ def get_category_source_path(category: str, source: str, date: str, time: str =
         return NEWS_JSON_TEMPLATE.format(category=category_en, source=source_en, date=date, time=time)
 
 
+def get_article_text_path(category: str, source: str, date: str) -> str:
+    """소스별 기사 본문 파일 경로 (목록 JSON과 같은 폴더)"""
+    category_en = CATEGORY_EN_MAP.get(category, category.lower())
+    source_en = SOURCE_EN_MAP.get(source, source.lower().replace(' ', '_'))
+    return ARTICLE_TEXT_TEMPLATE.format(category=category_en, source=source_en, date=date)
+
+
 def get_today_json_file():
     """오늘 날짜의 통합 JSON 파일 경로를 반환합니다 (하위 호환성)."""
-    today = datetime.now().strftime('%Y-%m-%d')
+    today = get_crawl_date_str()
     # 통합 JSON은 더 이상 사용하지 않지만, 하위 호환성을 위해 유지
     return f"{DATA_DIR}/news_{today}.json"
 
 
-def load_existing_news_by_source(category: str, source: str) -> List[Dict[str, str]]:
+def load_existing_news_by_source(category: str, source: str) -> List[NewsItem]:
     """
-    특정 카테고리/소스의 기존 뉴스 데이터를 로드합니다.
+    특정 카테고리/소스의 현재 시간대 뉴스를 저장소에서 로드합니다.
     
     Args:
         category: 카테고리
@@ -181,75 +418,97 @@ def load_existing_news_by_source(category: str, source: str) -> List[Dict[str, s
     Returns:
         기존 뉴스 항목 리스트
     """
-    today = datetime.now().strftime('%Y-%m-%d')
-    json_file = get_category_source_path(category, source, today)
+    today = get_crawl_date_str()
     
-    if os.path.exists(json_file):
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                logger.info(f"[{source}] 기존 뉴스 {len(data)}개 로드됨")
-                return data
-        except Exception as e:
-            logger.error(f"[{source}] 기존 데이터 로드 실패: {e}")
-            return []
+    try:
+        data = get_news_store().load_slot(*get_source_key(category, source), today, get_crawl_time_str())
+    except sqlite3.Error as e:
+        logger.error(f"[{source}] 기존 데이터 로드 실패: {e}")
+        return []
+    
+    if data:
+        logger.info(f"[{source}] 기존 뉴스 {len(data)}개 로드됨")
     else:
         logger.info(f"[{source}] 기존 뉴스 데이터 없음")
-        return []
+    return data
 
 
-def save_news_by_source(category: str, source: str, news_items: List[Dict[str, str]]):
+def save_news_by_source(category: str, source: str, news_items: List[NewsItem]):
     """
-    특정 카테고리/소스의 뉴스 데이터를 JSON 파일로 저장합니다.
+    특정 카테고리/소스의 뉴스 데이터를 저장소에 저장하고,
+    바뀐 항목만 일별 로그에 덧붙인 뒤 시간대별 JSON 파일(GitHub Pages용)로 내보냅니다.
     
     Args:
         category: 카테고리
         source: 소스 이름
         news_items: 저장할 뉴스 항목 리스트
     """
-    today = datetime.now().strftime('%Y-%m-%d')
+    today = get_crawl_date_str()
+    slot = get_crawl_time_str()
+    category_en, source_en = get_source_key(category, source)
     json_file = get_category_source_path(category, source, today)
     
-    # 디렉토리 생성
-    os.makedirs(os.path.dirname(json_file), exist_ok=True)
-    
     try:
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump(news_items, f, ensure_ascii=False, indent=2)
+        records = to_dicts(news_items)  # JSON으로 쓰는 세 곳에서 같은 딕셔너리 사용
+        store = get_news_store()
+        store.save_slot(category_en, source_en, today, slot, records)
+        log_path = get_log_path(category_en, source_en, today)
+        log_bytes = append_slot(log_path, slot, records)
+        if log_bytes:
+            store.record_file(log_path)
+        write_slot_json(json_file, records)
         
-        logger.info(f"[{source}] 뉴스 {len(news_items)}개를 {json_file}에 저장 완료")
+        logger.info(f"[{source}] 뉴스 {len(news_items)}개를 {json_file}에 저장 완료 (일별 로그 +{log_bytes} bytes)")
+        with source_stats_lock:
+            saved_sources.add((category, source))
         
     except Exception as e:
         logger.error(f"[{source}] 데이터 저장 실패: {e}")
 
 
-def load_all_news() -> List[Dict[str, str]]:
+def load_all_news() -> List[NewsItem]:
     """
-    모든 카테고리/소스의 뉴스를 로드하여 통합합니다.
+    모든 카테고리/소스의 현재 시간대 뉴스를 저장소에서 로드하여 통합합니다.
     
     Returns:
         통합된 뉴스 항목 리스트
     """
     all_news = []
-    today = datetime.now().strftime('%Y-%m-%d')
+    today = get_crawl_date_str()
+    store = get_news_store()
     
     for category, sources in NEWS_SOURCES.items():
         for source_config in sources:
-            source_name = source_config['name']
-            json_file = get_category_source_path(category, source_name, today)
-            
-            if os.path.exists(json_file):
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        all_news.extend(data)
-                except Exception as e:
-                    logger.error(f"[{source_name}] 데이터 로드 실패: {e}")
+            all_news.extend(store.load_slot(*get_source_key(category, source_config['name']),
+                                            today, get_crawl_time_str()))
     
     return all_news
 
 
-def merge_news(existing_news: List[Dict[str, str]], new_news: List[Dict[str, str]]) -> List[Dict[str, str]]:
+def classify_seen_items(news_items: List[NewsItem], date: str, scope: str) -> Dict[str, str]:
+    """
+    파싱한 항목을 기사 URL 색인과 비교해 새 기사 / 오늘 본 기사 / 이전에 본 기사로 나누고
+    소스별 실행 지표(items_new, items_seen_today, items_seen_earlier)에 집계합니다.
+    
+    Args:
+        news_items: 파싱한 뉴스 항목
+        date: 오늘 날짜 (YYYY-MM-DD)
+        scope: 실행 지표 집계 단위
+    
+    Returns:
+        이미 본 기사 중 이미지를 기록해 둔 기사의 URL → 이미지 URL
+    """
+    seen = get_news_store().lookup_seen([item['url'] for item in news_items])
+    known_images = {}
+    for item in news_items:
+        entry = seen.get(item['url'])
+        run_metrics.add(f"items_{classify_seen(entry, date)}", scope=scope)
+        if entry and entry[2]:
+            known_images[item['url']] = entry[2]
+    return known_images
+
+
+def merge_news(existing_news: List[NewsItem], new_news: List[NewsItem]) -> List[NewsItem]:
     """
     기존 뉴스와 새 뉴스를 병합합니다 (중복 제거).
     
@@ -281,9 +540,307 @@ def merge_news(existing_news: List[Dict[str, str]], new_news: List[Dict[str, str
     return merged_news
 
 
-def crawl_news() -> bool:
+def process_source(category: str, source_config: Dict, parser_info: parser.ParserInfo,
+                   page: Tuple[bytes, Optional[str]], image_resolver: ImageResolver,
+                   http_cache: Optional[HttpCache] = None,
+                   article_texts: Optional[ArticleTextFetcher] = None) -> int:
     """
-    모든 카테고리의 뉴스를 크롤링합니다.
+    가져온 섹션 페이지를 파싱하고 이미지 추출, 병합, 저장까지 처리합니다.
+
+    Args:
+        category: 카테고리
+        source_config: NEWS_SOURCES의 소스 설정 딕셔너리
+        parser_info: 소스의 파서 (시작 시 레지스트리에서 조회)
+        page: 섹션 페이지 (HTML 바이트, 선언된 인코딩) - fetch_page의 반환값
+        image_resolver: 기사 이미지 추출 단계
+        http_cache: 처리 결과를 기록할 섹션 페이지 HTTP 캐시 (선택)
+        article_texts: 기사 본문 수집 단계 (본문 수집 모드에서만, 기다리지 않고 넘김)
+
+    Returns:
+        저장된 뉴스 개수
+    """
+    source_name = source_config['name']
+    max_articles = source_config.get('max_articles', 20)
+    scope = get_metrics_scope(category, source_name)
+
+    # 2. HTML 파싱 (프로세스 풀에서 실행, 이 스레드는 결과를 기다리는 동안 GIL을 놓음)
+    logger.info(f"[{category}/{source_name}] HTML 파싱 중... (파서: {parser_info.name})")
+
+    with run_metrics.stage('parse', scope):
+        new_news = parse_pool.parse_section(parser_info.name, page, max_articles)
+    run_metrics.add('items_parsed', len(new_news), scope)
+
+    logger.info(f"[{category}/{source_name}] 파싱 완료: {len(new_news)}개 뉴스 항목 발견")
+
+    # 본문은 바뀌었어도(광고, 시각 등) 파싱한 목록이 이전과 같으면 이전에 찾은 이미지만 가져와 사용
+    news_items_hash = items_hash(new_news)
+    if http_cache:
+        previous = http_cache.get_same_items(source_config['url'], news_items_hash)
+        if previous is not None:
+            cached_items, process_time = previous
+            cached_images = {item['url']: item['image_url'] for item in cached_items if 'image_url' in item}
+            for item in new_news:
+                if item['url'] in cached_images:
+                    item['image_url'] = cached_images[item['url']]
+            add_source_info(new_news, category, source_name)
+            run_metrics.add('sections_same_items', scope=scope)
+            with source_stats_lock:
+                skipped_sources[scope] = process_time
+            return reuse_source_items(category, source_config, new_news, reason='목록 변경 없음')
+
+    started = time.perf_counter()
+    today = get_crawl_date_str()
+
+    # 기사 URL 색인으로 새 기사 / 오늘 본 기사 / 이전에 본 기사 분류
+    with run_metrics.stage('seen', scope):
+        known_images = classify_seen_items(new_news, today, scope)
+
+    # 각 뉴스 항목의 기사 URL에서 이미지 추출 (호스트별 속도 제한, 이미 본 기사는 기록한 이미지 사용)
+    # 목록 이미지만 쓰는 파서(article_images=False)는 기사 페이지를 조회하지 않음
+    if parser_info.article_images:
+        with run_metrics.stage('images', scope):
+            image_resolver.resolve(new_news, source_name, known_images)
+
+    # 카테고리와 소스 정보 추가
+    add_source_info(new_news, category, source_name)
+
+    with run_metrics.stage('merge', scope):
+        # 4. 기존 뉴스 로드 (소스별)
+        existing_news = load_existing_news_by_source(category, source_name)
+
+        # 5. 병합
+        merged_news = merge_news(existing_news, new_news)
+
+    # 6. 소스별로 저장
+    with run_metrics.stage('save', scope):
+        save_news_by_source(category, source_name, merged_news)
+        get_news_store().mark_seen(new_news, today)
+    run_metrics.add('items_saved', len(merged_news), scope)
+
+    # 본문을 아직 저장하지 않은 기사만 본문 수집 단계로 넘김 (run_crawl 끝에서 완료 대기)
+    if article_texts:
+        path = get_article_text_path(category, source_name, get_crawl_date_str())
+        article_texts.submit(path, new_news, scope)
+
+    # 페이지 본문이나 파싱한 목록이 바뀌지 않은 다음 실행에서 재사용
+    if http_cache:
+        http_cache.set_items(source_config['url'], new_news, today, news_items_hash,
+                             time.perf_counter() - started)
+
+    return len(merged_news)
+
+
+def add_source_info(news_items: List[NewsItem], category: str, source_name: str):
+    """뉴스 항목에 카테고리와 소스 정보를 채웁니다."""
+    for item in news_items:
+        item['main_category'] = category
+        if 'source' not in item:
+            item['source'] = source_name
+
+
+def reuse_source_items(category: str, source_config: Dict, news_items: List[NewsItem],
+                       reason: str = '페이지 변경 없음') -> int:
+    """
+    섹션 페이지(또는 파싱한 목록)가 이전과 같을 때 이미지 추출 없이 이전 처리 결과를 사용합니다.
+
+    현재 시간대 파일에 이미 모든 항목이 있으면 저장도 건너뛰고,
+    새 시간대라서 파일에 없으면 이전 결과를 병합해 저장합니다.
+
+    Args:
+        category: 카테고리
+        source_config: NEWS_SOURCES의 소스 설정 딕셔너리
+        news_items: 캐시된 이전 처리 결과 (또는 이전 이미지를 채운 이번 파싱 결과)
+        reason: 로그에 표시할 재사용 이유
+
+    Returns:
+        현재 시간대 파일의 뉴스 개수
+    """
+    source_name = source_config['name']
+    scope = get_metrics_scope(category, source_name)
+    run_metrics.add('sections_reused', scope=scope)
+    today = get_crawl_date_str()
+
+    # 이전 실행의 수집 시각 대신 이번 실행 시각으로 저장
+    scraped_at = get_kst_now().isoformat()
+    for item in news_items:
+        item['scraped_at'] = scraped_at
+
+    with run_metrics.stage('seen', scope):
+        classify_seen_items(news_items, today, scope)
+        get_news_store().mark_seen(news_items, today)
+
+    with run_metrics.stage('merge', scope):
+        existing_news = load_existing_news_by_source(category, source_name)
+        existing_urls = {item['url'] for item in existing_news}
+
+    if all(item['url'] in existing_urls for item in news_items):
+        logger.info(f"[{category}/{source_name}] {reason} - 이미지 추출/병합/저장 건너뜀")
+        run_metrics.add('items_saved', len(existing_news), scope)
+        return len(existing_news)
+
+    logger.info(f"[{category}/{source_name}] {reason} - 이전 결과를 현재 시간대에 저장")
+    with run_metrics.stage('merge', scope):
+        merged_news = merge_news(existing_news, news_items)
+    with run_metrics.stage('save', scope):
+        save_news_by_source(category, source_name, merged_news)
+    run_metrics.add('items_saved', len(merged_news), scope)
+    return len(merged_news)
+
+
+async def crawl_all_sources(jobs: List[Dict], category_stats: Dict[str, int],
+                            image_resolver: ImageResolver, http_cache: Optional[HttpCache],
+                            request_delay: float = REQUEST_DELAY,
+                            article_texts: Optional[ArticleTextFetcher] = None) -> int:
+    """
+    모든 소스의 섹션 페이지를 동시에 가져오고, 도착하는 순서대로 처리합니다.
+
+    Args:
+        jobs: {'category', 'source', 'url'} 작업 리스트
+        category_stats: 카테고리별 뉴스 개수 (갱신됨)
+        image_resolver: 기사 이미지 추출 단계
+        http_cache: 섹션 페이지 HTTP 캐시 (기록/재생 모드에서는 None)
+        request_delay: 같은 호스트 요청 간 최소 간격
+        article_texts: 기사 본문 수집 단계 (본문 수집 모드에서만)
+
+    Returns:
+        저장된 전체 뉴스 개수
+    """
+    tasks = []
+    scopes = {job['url']: get_metrics_scope(job['category'], job['source']['name']) for job in jobs}
+
+    def timed_fetch(url: str) -> Optional[Tuple[bytes, Optional[str]]]:
+        with run_metrics.stage('fetch', scopes[url]):
+            return fetch_page(url, http_cache=http_cache)
+
+    # 1. 페이지 가져오기 (호스트별 동시성 제한, 조건부 요청)
+    async for job, page in fetch_as_completed(jobs, timed_fetch, request_delay):
+        source_name = job['source']['name']
+
+        if not page or not page[0]:
+            logger.error(f"{source_name} 페이지를 가져올 수 없습니다")
+            continue
+
+        # 파싱/이미지/저장은 스레드에서 실행해 나머지 페이지 수집과 다른 소스 처리가 계속 진행되도록 함
+        # (소스마다 저장 파일이 달라 동시에 처리해도 안전)
+        cached_items = None
+        if http_cache and http_cache.is_unchanged(job['url']):
+            cached_items = http_cache.get_items(job['url'], get_crawl_date_str())
+        if cached_items is not None:
+            work = asyncio.to_thread(reuse_source_items, job['category'], job['source'], cached_items)
+        else:
+            work = asyncio.to_thread(process_source, job['category'], job['source'], job['parser'],
+                                     page, image_resolver, http_cache, article_texts)
+        tasks.append((job, asyncio.create_task(work)))
+
+    all_news_count = 0
+    for job, task in tasks:
+        try:
+            count = await task
+        except Exception as e:
+            logger.error(f"[{job['source']['name']}] 처리 중 오류 발생: {e}", exc_info=True)
+            continue
+        all_news_count += count
+        category_stats[job['category']] += count
+
+    return all_news_count
+
+
+@contextmanager
+def replay_output_root(replay_dir: str) -> Iterator[str]:
+    """
+    재생 모드의 작업 폴더를 보관소 안의 REPLAY_OUTPUT_DIR 폴더로 바꿉니다.
+    
+    저장소(db/), 일별 로그(data/), 시간대별 JSON(docs/data), 보고서, 트렌드, 실행 지표가
+    모두 이 폴더 아래에 쓰이므로 실제 출력과 기사 URL 색인은 바뀌지 않습니다.
+    날짜/시간대는 보관소를 기록한 실행의 값으로 고정합니다.
+    
+    Yields:
+        보관소의 절대 경로
+    """
+    archive_dir = os.path.abspath(replay_dir)
+    output_dir = os.path.join(archive_dir, REPLAY_OUTPUT_DIR)
+    run_info = read_run_info(archive_dir)
+    if run_info:
+        set_crawl_slot(run_info['date'], run_info.get('slot'))
+    else:
+        logger.warning(f"보관소에 기록한 날짜/시간대가 없어 현재 시각 기준으로 저장합니다: {archive_dir}")
+    
+    # 재생할 때마다 같은 결과가 나오도록 이전 재생 결과를 지우고 빈 폴더에서 시작
+    shutil.rmtree(output_dir, ignore_errors=True)
+    os.makedirs(output_dir)
+    cwd = os.getcwd()
+    close_news_store()
+    os.chdir(output_dir)
+    logger.info(f"재생 결과 폴더: {output_dir} ({get_crawl_date_str()} {get_crawl_time_str()} 시간대)")
+    try:
+        yield archive_dir
+    finally:
+        close_news_store()
+        os.chdir(cwd)
+        set_crawl_slot(None)
+
+
+def crawl_news(record_dir: Optional[str] = None, replay_dir: Optional[str] = None,
+               full_text: bool = ARTICLE_FULL_TEXT) -> bool:
+    """
+    모든 카테고리의 뉴스를 크롤링하고, 단계별 실행 지표를
+    RUN_METRICS_TEMPLATE 경로에 JSON으로 저장합니다.
+    
+    replay_dir가 주어지면 실제 출력 대신 보관소 안의 REPLAY_OUTPUT_DIR 폴더에
+    보관소를 기록한 날짜/시간대로 저장합니다 (replay_output_root 참고).
+    
+    Args:
+        record_dir: 응답을 기록할 디렉토리 (선택)
+        replay_dir: 응답을 재생할 디렉토리 (선택)
+        full_text: 새로 발견한 기사의 본문도 수집할지 여부
+    
+    Returns:
+        성공 여부
+    """
+    if replay_dir:
+        with replay_output_root(replay_dir) as archive_dir:
+            return crawl_with_metrics(None, archive_dir, full_text)
+    return crawl_with_metrics(record_dir, None, full_text)
+
+
+def crawl_with_metrics(record_dir: Optional[str], replay_dir: Optional[str], full_text: bool) -> bool:
+    """run_crawl을 실행하고 출력 파일 fsync와 실행 지표 저장까지 합니다."""
+    run_metrics.reset()
+    output_writer.reset()
+    success = False
+    try:
+        success = run_crawl(record_dir, replay_dir, full_text)
+        return success
+    finally:
+        # 이번 실행에서 쓴 출력 파일을 한 번에 fsync
+        with run_metrics.stage('sync'):
+            output_writer.sync()
+        output_writer.log_stats()
+        run_metrics.set_info(success=success)
+        run_metrics.log_stats()
+        metrics_file = RUN_METRICS_TEMPLATE.format(
+            date=get_crawl_date_str(), time=get_crawl_time_str()
+        )
+        run_metrics.save(metrics_file)
+
+
+def run_crawl(record_dir: Optional[str] = None, replay_dir: Optional[str] = None,
+              full_text: bool = ARTICLE_FULL_TEXT) -> bool:
+    """
+    크롤링 파이프라인 본체 (수집 → 파싱 → 이미지 → 병합/저장 → [본문] → 보고서 → 트렌드).
+    
+    record_dir가 주어지면 받은 섹션/기사 응답을 모두 보관소에 기록하고,
+    replay_dir가 주어지면 네트워크 대신 보관소의 응답으로 실행합니다.
+    두 모드 모두 이미지/HTTP 캐시를 사용하지 않습니다
+    (기록에는 모든 응답 본문이 필요하고, 재생은 실행할 때마다 같은 결과를 내야 하므로).
+    
+    full_text가 켜져 있으면 새로 발견한 기사의 본문을 별도 작업자 풀에서 가져와 저장하며,
+    본문을 이미 저장한 기사는 다시 요청하지 않습니다.
+    
+    Args:
+        record_dir: 응답을 기록할 디렉토리 (선택)
+        replay_dir: 응답을 재생할 디렉토리 (선택)
+        full_text: 기사 본문 수집 여부
     
     Returns:
         성공 여부
@@ -295,84 +852,108 @@ def crawl_news() -> bool:
     logger.info(f"실행 시간대: {kst_now.strftime('%p %I시')} KST".replace('AM', '오전').replace('PM', '오후'))
     logger.info("=" * 60)
     
+    circuit_breakers.reset()
+    saved_sources.clear()
+    skipped_sources.clear()
+    
     try:
-        all_news_count = 0
+        archive = open_archive(record_dir, replay_dir)
+        set_archive(archive)
+        replaying = archive is not None and archive.mode == MODE_REPLAY
+        if archive is not None and archive.mode == MODE_RECORD:
+            # 재생할 때 같은 날짜/시간대로 저장하도록 기록
+            archive.run_info = {'date': get_crawl_date_str(), 'slot': get_crawl_time_str()}
+        run_metrics.set_info(
+            date=get_crawl_date_str(),
+            slot=get_crawl_time_str(),
+            mode=archive.mode if archive else 'live'
+        )
+        if archive:
+            logger.info(f"응답 {'재생' if replaying else '기록'} 모드: {archive.archive_dir}")
+        
         category_stats = {}
+        jobs = []
         
-        # 각 카테고리별로 크롤링
+        # 각 카테고리별 크롤링 작업 구성
         for category, sources in NEWS_SOURCES.items():
             if not sources:  # 소스가 없는 카테고리는 건너뛰기
                 logger.info(f"'{category}' 카테고리: 설정된 뉴스 소스 없음")
                 continue
             
-            logger.info(f"\n{'='*60}")
-            logger.info(f"카테고리: {category}")
-            logger.info(f"{'='*60}")
-            
             category_stats[category] = 0
             
             for source_config in sources:
-                source_name = source_config['name']
-                url = source_config['url']
-                parser_name = source_config['parser']
-                max_articles = source_config.get('max_articles', 20)
-                
-                logger.info(f"\n크롤링 소스: {source_name}")
-                logger.info(f"URL: {url}")
-                
-                # 1. 페이지 가져오기
-                html_content = fetch_page(url)
-                if not html_content:
-                    logger.error(f"{source_name} 페이지를 가져올 수 없습니다")
-                    continue
-                
-                # 2. 적절한 파서 함수 가져오기
+                logger.info(f"크롤링 소스: [{category}] {source_config['name']} - {source_config['url']}")
+                # 파서는 시작 시 한 번 조회 (등록되지 않은 파서의 소스는 요청하지 않음)
                 try:
-                    parser_func = getattr(parser, f'parse_{parser_name}')
-                except AttributeError:
-                    logger.error(f"파서 함수 'parse_{parser_name}'를 찾을 수 없습니다")
+                    parser_info = parser.get_parser_info(source_config['parser'])
+                except AttributeError as e:
+                    logger.error(f"[{category}/{source_config['name']}] {e}")
                     continue
-                
-                # 3. HTML 파싱
-                logger.info(f"HTML 파싱 중... (파서: {parser_name})")
-                
-                # max_articles 인자를 받는 파서들
-                if parser_name in ['donga_politics', 'chosun_politics', 'joongang_politics',
-                                    'donga_sports', 'chosun_sports', 'joongang_sports',
-                                    'donga_economy', 'chosun_economy', 'joongang_economy']:
-                    new_news = parser_func(html_content, max_articles)
-                else:
-                    new_news = parser_func(html_content)
-                    
-                logger.info(f"파싱 완료: {len(new_news)}개 뉴스 항목 발견")
-                
-                # 각 뉴스 항목의 기사 URL에서 이미지 추출
-                for item in new_news:
-                    if not item.get('image_url'):  # 이미지 URL이 없는 경우에만
-                        image_url = extract_article_image(item['url'], source_name)
-                        item['image_url'] = image_url
-                        time.sleep(0.5)  # 과도한 요청 방지
-                
-                # 카테고리와 소스 정보 추가
-                for item in new_news:
-                    item['main_category'] = category
-                    if 'source' not in item:
-                        item['source'] = source_name
-                
-                # 4. 기존 뉴스 로드 (소스별)
-                existing_news = load_existing_news_by_source(category, source_name)
-                
-                # 5. 병합
-                merged_news = merge_news(existing_news, new_news)
-                
-                # 6. 소스별로 저장
-                save_news_by_source(category, source_name, merged_news)
-                
-                all_news_count += len(merged_news)
-                category_stats[category] += len(merged_news)
-                
-                # Rate limiting
-                time.sleep(REQUEST_DELAY)
+                if parser_info.host and parser_info.host != get_host(source_config['url']):
+                    logger.warning(f"[{category}/{source_config['name']}] 파서 '{parser_info.name}'의 호스트"
+                                   f"({parser_info.host})가 URL과 다릅니다: {source_config['url']}")
+                jobs.append({
+                    'category': category,
+                    'source': source_config,
+                    'parser': parser_info,
+                    'url': source_config['url']
+                })
+        
+        image_cache = None
+        http_cache = None
+        if archive is None:
+            image_cache = ImageCache()
+            image_cache.load()
+            http_cache = HttpCache()
+            http_cache.load()
+        # 작업 프로세스는 크롤링 시작 전에 띄움 (수집 날짜/시간대 고정 이후)
+        parse_pool.start()
+        # 저장소가 비어 있으면 data/의 일별 로그를 가져오고, 오래 보지 않은 기사 URL은 색인에서 삭제
+        seen_cutoff = (kst_now - timedelta(days=SEEN_URL_RETENTION_DAYS)).strftime('%Y-%m-%d')
+        expired = get_news_store().expire_seen(seen_cutoff)
+        if expired:
+            logger.info(f"기사 URL 색인: {seen_cutoff} 이전에 마지막으로 본 URL {expired}개 삭제")
+        image_resolver = ImageResolver(extract_article_image, cache=image_cache, throttle=not replaying)
+        article_texts = None
+        if full_text:
+            article_text_store = ArticleTextStore()
+            article_text_store.load()
+            article_texts = ArticleTextFetcher(fetch_article_text, article_text_store, throttle=not replaying)
+        request_delay = 0 if replaying else REQUEST_DELAY
+        try:
+            with run_metrics.stage('crawl'):
+                all_news_count = asyncio.run(
+                    crawl_all_sources(jobs, category_stats, image_resolver, http_cache, request_delay,
+                                      article_texts)
+                )
+        finally:
+            image_resolver.shutdown()
+            if article_texts:
+                article_texts.shutdown()
+            parse_pool.shutdown()
+            if image_cache:
+                image_cache.save()
+            if http_cache:
+                http_cache.save()
+            if archive:
+                archive.save()
+        if http_cache:
+            http_cache.log_stats({job['url']: f"{job['category']}/{job['source']['name']}" for job in jobs})
+        image_resolver.log_stats()
+        if article_texts:
+            article_texts.log_stats()
+        if image_cache:
+            image_cache.log_stats()
+        if archive:
+            archive.log_stats()
+        circuit_breakers.log_stats()
+        parse_pool.log_stats()
+        log_article_fetch_stats()
+        log_region_parse_stats()
+        log_skipped_sources()
+        log_connection_stats()
+        set_archive(None)
         
         if all_news_count == 0:
             logger.warning("파싱된 뉴스가 없습니다")
@@ -387,19 +968,25 @@ def crawl_news() -> bool:
         for cat, count in sorted(category_stats.items()):
             if count > 0:
                 logger.info(f"  - {cat}: {count}개")
+        log_new_items()
         
         logger.info("=" * 60)
         
         # 자동 보고서 생성
-        if AUTO_GENERATE_REPORT:
+        # 저장한 소스가 없고 오늘 보고서가 이미 있으면 다시 만들지 않음
+        today = get_crawl_date_str()
+        if AUTO_GENERATE_REPORT and not saved_sources and os.path.exists(COMBINED_REPORT_TEMPLATE.format(date=today)):
+            logger.info("저장된 뉴스 변경 없음 - 보고서 재생성 건너뜀")
+        elif AUTO_GENERATE_REPORT:
             try:
                 logger.info("=" * 60)
                 logger.info("📝 통합 보고서 자동 생성 시작")
                 logger.info("=" * 60)
                 
                 from report_generator import generate_combined_report
-                today = datetime.now().strftime('%Y-%m-%d')
-                report_file = generate_combined_report(today)
+                with run_metrics.stage('report'):
+                    # 소스별 보고서는 이번 실행에서 저장한 소스만 다시 생성
+                    report_file = generate_combined_report(today, changed_sources=saved_sources)
                 
                 logger.info(f"✅ 통합 보고서 생성 완료: {report_file}")
                 logger.info("=" * 60)
@@ -414,8 +1001,9 @@ def crawl_news() -> bool:
             logger.info("=" * 60)
             
             from analyzer import save_trend_data
-            today = get_kst_now().strftime('%Y-%m-%d')
-            trend_file = save_trend_data(today)
+            today = get_crawl_date_str()
+            with run_metrics.stage('trend'):
+                trend_file = save_trend_data(today)
             
             if trend_file:
                 logger.info(f"✅ 트렌드 데이터 생성 완료: {trend_file}")
@@ -433,11 +1021,28 @@ def crawl_news() -> bool:
 
 def main():
     """메인 함수 - 단일 실행용"""
-    success = crawl_news()
+    arg_parser = argparse.ArgumentParser(description='멀티 카테고리 뉴스 크롤러')
+    mode = arg_parser.add_mutually_exclusive_group()
+    mode.add_argument('--record', nargs='?', const='', metavar='DIR',
+                      help=f'섹션/기사 응답을 기록 (기본: {ARCHIVE_DIR}/{{날짜}}_{{시간대}})')
+    mode.add_argument('--replay', metavar='DIR',
+                      help='기록한 응답으로 네트워크 없이 실행')
+    arg_parser.add_argument('--full-text', action='store_true', default=ARTICLE_FULL_TEXT,
+                            help='새로 발견한 기사의 본문도 수집해 압축 저장')
+    args = arg_parser.parse_args()
+    
+    record_dir = args.record
+    if record_dir == '':
+        record_dir = f"{ARCHIVE_DIR}/{get_kst_now().strftime('%Y-%m-%d')}_{get_crawl_time_str()}"
+    
+    success = crawl_news(record_dir=record_dir, replay_dir=args.replay, full_text=args.full_text)
     
-    if success:
+    if success and args.replay:
+        print(f"\n✓ 재생 성공! 결과는 {os.path.join(args.replay, REPLAY_OUTPUT_DIR)}/ 아래에 저장되었습니다 (실제 데이터는 그대로).")
+    elif success:
         print(f"\n✓ 크롤링 성공! 데이터는 카테고리/소스별 폴더에 저장되었습니다.")
-        print(f"  - 데이터: {DATA_DIR}/{{category}}/{{source}}/")
+        print(f"  - 일별 로그: {DATA_DIR}/{{category}}/{{source}}/")
+        print(f"  - 시간대별 JSON: {SITE_DATA_DIR}/{{category}}/{{source}}/")
         print(f"  - 보고서: {COMBINED_REPORT_TEMPLATE.split('/')[0]}/combined/")
     else:
         print("\n✗ 크롤링 실패. 로그를 확인하세요.")
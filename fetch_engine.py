@@ -0,0 +1,103 @@
+"""
+비동기 페이지 수집 엔진
+asyncio로 여러 섹션 페이지를 동시에 가져오되, 호스트별 동시 요청 수와 요청 간격을 제한합니다.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from config import HOST_CONCURRENCY, DEFAULT_HOST_CONCURRENCY, REQUEST_DELAY
+
+logger = logging.getLogger(__name__)
+
+
+def get_host(url: str) -> str:
+    """URL에서 호스트 이름을 반환합니다."""
+    return urlparse(url).netloc
+
+
+class HostLimiter:
+    """
+    단일 호스트에 대한 동시 요청 수와 요청 간 최소 간격을 제한합니다.
+
+    전역 sleep 대신 호스트마다 독립적으로 예의(politeness)를 지키므로
+    전체 수집 시간은 가장 느린 호스트에 의해 결정됩니다.
+    """
+
+    def __init__(self, concurrency: int, delay: float):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.delay = delay
+        self._lock = asyncio.Lock()
+        self._last_request = 0.0
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        # 같은 호스트의 요청 시작 시점이 delay 이상 벌어지도록 대기
+        async with self._lock:
+            wait = self._last_request + self.delay - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._last_request = time.monotonic()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.semaphore.release()
+        return False
+
+
+def build_host_limiters(urls: List[str], delay: float = REQUEST_DELAY) -> Dict[str, HostLimiter]:
+    """
+    URL 목록에 등장하는 호스트별 제한기를 생성합니다.
+
+    Args:
+        urls: 요청할 URL 리스트
+        delay: 같은 호스트 요청 간 최소 간격 (초)
+
+    Returns:
+        {호스트: HostLimiter} 딕셔너리
+    """
+    limiters = {}
+    for url in urls:
+        host = get_host(url)
+        if host not in limiters:
+            concurrency = HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY)
+            limiters[host] = HostLimiter(concurrency, delay)
+    return limiters
+
+
+async def fetch_as_completed(
+    jobs: List[Dict[str, Any]],
+    fetch_func: Callable[[str], Optional[str]],
+    request_delay: float = REQUEST_DELAY
+) -> AsyncIterator[Tuple[Dict[str, Any], Optional[str]]]:
+    """
+    모든 작업의 페이지를 동시에 가져오고, 완료되는 순서대로 결과를 반환합니다.
+
+    fetch_func는 블로킹 함수(예: crawler.fetch_page)이며 스레드에서 실행됩니다.
+
+    Args:
+        jobs: 'url' 키를 가진 작업 딕셔너리 리스트
+        fetch_func: URL을 받아 HTML 문자열(실패 시 None)을 반환하는 함수
+        request_delay: 같은 호스트 요청 간 최소 간격 (재생 모드에서는 0)
+
+    Yields:
+        (작업, HTML 문자열 또는 None) 튜플
+    """
+    limiters = build_host_limiters([job['url'] for job in jobs], request_delay)
+
+    async def run(job):
+        async with limiters[get_host(job['url'])]:
+            try:
+                html_content = await asyncio.to_thread(fetch_func, job['url'])
+            except Exception as e:
+                # 한 소스의 실패가 다른 소스 수집을 중단시키지 않도록 함
+                logger.error(f"페이지 수집 중 예외 발생 ({job['url']}): {e}")
+                html_content = None
+        return job, html_content
+
+    tasks = [asyncio.create_task(run(job)) for job in jobs]
+    for next_done in asyncio.as_completed(tasks):
+        yield await next_done
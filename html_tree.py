@@ -0,0 +1,641 @@
+"""
+HTML 문서 탐색 모듈
+섹션 파서(parser.SelectorSpec)와 기사 이미지 추출이 사용하는 탐색 연산을
+BeautifulSoup('bs4')과 lxml + XPath('lxml') 두 가지 엔진으로 제공합니다.
+
+lxml 엔진은 BeautifulSoup 트리를 만들지 않고 libxml2 트리를 미리 컴파일한 XPath로 탐색하며,
+같은 입력에 대해 bs4 엔진과 같은 결과를 내도록 BeautifulSoup의 규칙을 따릅니다.
+    - .string: 자식이 하나뿐일 때만 그 문자열 (자식 태그면 재귀)
+    - get_text(): script/style/template/rt/rp 안의 문자열과 주석은 제외
+    - find(string=...): 주석을 포함한 모든 문자열 노드 검색
+    - class_: 공백으로 나눈 클래스 중 하나와 일치
+"""
+
+import codecs
+import re
+import threading
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Union
+
+from bs4 import BeautifulSoup, NavigableString
+from bs4.dammit import EncodingDetector
+from lxml import etree
+
+ENGINE_BS4 = 'bs4'
+ENGINE_LXML = 'lxml'
+ENGINES = (ENGINE_BS4, ENGINE_LXML)
+
+# BeautifulSoup이 일반 문자열(NavigableString)이 아닌 별도 타입으로 만드는 태그
+# (이 태그 안의 문자열은 get_text()에서 제외됨)
+STRING_CONTAINER_TAGS = ('script', 'style', 'template', 'rt', 'rp')
+
+# 요소 기준 XPath와 문서 전체 XPath ('/'로 시작 - ElementTree에 상대 경로를 쓰면
+# 루트 요소 기준이 되어 <html> 자신과 <html> 밖의 주석이 빠지므로 구분해서 사용)
+XPATH_LINKS = etree.XPath('descendant::a[@href]')
+XPATH_DOCUMENT_LINKS = etree.XPath('/descendant::a[@href]')
+XPATH_STRINGS = etree.XPath('descendant::text() | descendant::comment()')
+XPATH_DOCUMENT_STRINGS = etree.XPath('/descendant::text() | /descendant::comment()')
+XPATH_FIRST_IMG = etree.XPath('descendant::img[1]')
+XPATH_IMAGES = etree.XPath('descendant::img')
+XPATH_TEXT = etree.XPath(
+    'descendant::text()[not(ancestor::%s)]' % ' or ancestor::'.join(STRING_CONTAINER_TAGS),
+    smart_strings=False)
+XPATH_OG_IMAGE = etree.XPath("/descendant::meta[@property='og:image'][1]")
+XPATH_TWITTER_IMAGE = etree.XPath("/descendant::meta[@name='twitter:image'][1]")
+XPATH_ARTICLE_BODY = etree.XPath(
+    "/descendant::*[self::article or self::div]"
+    "[contains(@class, 'article') or contains(@class, 'content') or contains(@class, 'body')][1]")
+
+ARTICLE_BODY_CLASS = re.compile(r'article|content|body')
+
+# 문자열 단계에서 요소 경계를 찾기 위한 태그 토큰 (주석, script/style 내용은 통째로 건너뜀)
+TAG_TOKEN = re.compile(
+    r'<!--.*?-->'
+    r'|<(script|style)\b(?:"[^"]*"|\'[^\']*\'|[^\'">])*>.*?</\1\s*>'
+    r'|<(/?)([a-zA-Z][^\s/>]*)((?:"[^"]*"|\'[^\']*\'|[^\'">])*)>',
+    re.S | re.I)
+VOID_TAGS = frozenset(('area', 'base', 'basefont', 'br', 'col', 'embed', 'frame', 'hr', 'img', 'input',
+                       'keygen', 'link', 'meta', 'param', 'source', 'track', 'wbr'))
+# 닫는 태그를 생략할 수 있는 요소 (상위 요소가 닫힐 때 함께 닫힘)
+OPTIONAL_END_TAGS = frozenset(('li', 'p', 'dt', 'dd', 'option', 'optgroup', 'tr', 'td', 'th',
+                               'thead', 'tbody', 'tfoot', 'colgroup', 'caption', 'rb', 'rt', 'rp'))
+
+# lxml 파서 객체는 스레드 간에 공유하지 않음 (섹션 파싱은 스레드 풀에서 동시에 실행)
+_parsers = threading.local()
+
+
+def get_html_parser() -> etree.HTMLParser:
+    parser = getattr(_parsers, 'html', None)
+    if parser is None:
+        parser = _parsers.html = etree.HTMLParser()
+    return parser
+
+
+def decode_undeclared(html_bytes: bytes) -> Union[str, bytes]:
+    """
+    BOM이나 meta charset 선언이 없는 바이트는 UTF-8로 디코딩합니다.
+
+    libxml2는 선언이 없으면 ISO-8859-1로 읽지만 BeautifulSoup은 UTF-8을 먼저 시도하므로,
+    같은 결과를 내려면 미리 디코딩해야 합니다. 선언이 있으면 libxml2가 그대로 처리합니다.
+    """
+    if EncodingDetector.find_declared_encoding(html_bytes, is_html=True) or html_bytes.startswith(
+            (b'\xef\xbb\xbf', b'\xff\xfe', b'\xfe\xff')):
+        return html_bytes
+    try:
+        return html_bytes.decode('utf-8')
+    except UnicodeDecodeError:
+        return html_bytes
+
+
+def is_known_encoding(encoding: Optional[str]) -> bool:
+    if not encoding:
+        return False
+    try:
+        codecs.lookup(encoding)
+    except LookupError:
+        return False
+    return True
+
+
+def decode_html(html_bytes: bytes, declared_encoding: Optional[str] = None) -> str:
+    """
+    HTML 바이트를 정한 인코딩으로 한 번만 디코딩합니다.
+
+    HTTP 헤더(Content-Type charset)에 선언된 인코딩 → BOM → <meta charset> 선언 → UTF-8 순서로
+    인코딩을 정하고, UTF-8도 아니면 선언 없는 한국어 페이지로 보고 CP949로 읽습니다.
+    requests의 response.text와 달리 본문 전체로 문자셋을 추정하지 않으며,
+    잘못된 바이트는 response.text와 같이 U+FFFD로 바꿉니다.
+    """
+    if is_known_encoding(declared_encoding):
+        return html_bytes.decode(declared_encoding, errors='replace')
+
+    html_bytes, encoding = EncodingDetector.strip_byte_order_mark(html_bytes)
+    if not is_known_encoding(encoding):
+        encoding = EncodingDetector.find_declared_encoding(html_bytes, is_html=True)
+    if is_known_encoding(encoding):
+        return html_bytes.decode(encoding, errors='replace')
+    try:
+        return html_bytes.decode('utf-8')
+    except UnicodeDecodeError:
+        return html_bytes.decode('cp949', errors='replace')
+
+
+@lru_cache(maxsize=None)
+def tag_xpath(tags: tuple, document: bool = False) -> etree.XPath:
+    """태그 이름 목록에 해당하는 자손 요소 XPath (태그 조합별로 한 번만 컴파일)"""
+    axis = '/descendant::*' if document else 'descendant::*'
+    return etree.XPath('%s[%s]' % (axis, ' or '.join(f'self::{tag}' for tag in tags)))
+
+
+def as_tags(names: Union[str, List[str], None]) -> tuple:
+    if names is None:
+        return ()
+    return (names,) if isinstance(names, str) else tuple(names)
+
+
+def has_class(element, class_name: Optional[str]) -> bool:
+    """BeautifulSoup의 class_ 비교 (클래스 하나 또는 전체 문자열과 일치)"""
+    if not class_name:
+        return True
+    classes = (element.get('class') or '').split()
+    return class_name in classes or ' '.join(classes) == class_name
+
+
+def iter_tags(html_content: str, start: int = 0, end: Optional[int] = None):
+    """
+    (시작 위치, 끝 위치, 태그 이름, 닫는 태그 여부)를 순서대로 반환합니다.
+    빈 요소(img, br 등)와 '/>'로 닫힌 태그, 주석, script/style은 건너뜁니다.
+    """
+    for match in TAG_TOKEN.finditer(html_content, start, len(html_content) if end is None else end):
+        name = match.group(3)
+        if not name or match.group(4).endswith('/'):
+            continue
+        name = name.lower()
+        if name in VOID_TAGS:
+            continue
+        yield match.start(), match.end(), name, bool(match.group(2))
+
+
+def enclosing_tags(html_content: str, position: int, window: int = 512):
+    """
+    position을 감싸는 요소들의 시작 태그를 안쪽부터 하나씩 반환합니다 [(위치, 태그 이름, 시작 태그 문자열)].
+
+    position 앞부분을 window 크기씩 거꾸로 훑으므로 필요한 단계까지만 읽습니다.
+    닫는 태그가 생략된 요소(<li>, <p> 등)를 만나 짝이 맞지 않으면 거기서 멈춥니다.
+    """
+    pending = []
+    end = position
+    while end > 0:
+        # 구간 경계가 태그 중간에 걸리지 않도록 '<' 위치에서 자름
+        begin = max(0, html_content.rfind('<', 0, max(0, end - window)))
+        for start, tag_end, name, closing in reversed(list(iter_tags(html_content, begin, end))):
+            if closing:
+                pending.append(name)
+            elif pending:
+                if pending.pop() != name:
+                    return
+            else:
+                yield start, name, html_content[start:tag_end]
+        end = begin
+
+
+def element_end(html_content: str, start: int) -> Optional[int]:
+    """
+    start 위치의 시작 태그에 짝이 맞는 닫는 태그의 끝 위치를 반환합니다.
+
+    닫는 태그를 생략할 수 있는 요소(<li>, <p> 등) 외에 짝이 맞지 않는 태그가 있으면
+    파서마다 복구 방식이 달라 경계를 확신할 수 없으므로 None을 반환합니다.
+    """
+    stack = []
+    for _, tag_end, name, closing in iter_tags(html_content, start):
+        if not closing:
+            stack.append(name)
+            continue
+        while stack and stack[-1] != name and stack[-1] in OPTIONAL_END_TAGS:
+            stack.pop()
+        if not stack or stack[-1] != name:
+            return None
+        stack.pop()
+        if not stack:
+            return tag_end
+    return None
+
+
+# 링크 안에 이미지가 없을 때 이미지를 찾는 가장 가까운 상위 요소
+IMAGE_PARENT_TAGS = ('li', 'div', 'article')
+
+
+def image_from(img) -> str:
+    """img 요소의 이미지 URL (src → data-src → data-lazy-src → srcset 첫 후보)"""
+    if img is None:
+        return ""
+    image_url = img.get('src', '') or img.get('data-src', '') or img.get('data-lazy-src', '')
+    if not image_url:
+        srcset = (img.get('srcset') or '').strip()
+        image_url = srcset.split(',', 1)[0].split()[0] if srcset else ""
+    return image_url
+
+
+class ImageMap:
+    """
+    링크 → 가장 가까운 이미지 URL.
+
+    링크 안의 첫 이미지, 없으면 root 안에서 가장 가까운 li/div/article의 첫 이미지입니다.
+    만들 때 root의 img를 문서 순서로 한 번 훑으며 상위 요소마다 첫 이미지를 기록하고,
+    이미 기록된 상위 요소를 만나면 멈추므로 링크 수와 관계없이 요소 수에 비례하는 비용입니다.
+    """
+
+    def __init__(self, root, images, parent_of: Callable, name_of: Callable):
+        self.root = root
+        self.parent_of = parent_of
+        self.name_of = name_of
+        self.first_images = {}  # id(요소) → (요소, 첫 img) - 요소를 함께 보관해 id가 재사용되지 않게 함
+        for img in images:
+            element = parent_of(img)
+            while element is not None and id(element) not in self.first_images:
+                self.first_images[id(element)] = (element, img)
+                if element is root:
+                    break
+                element = parent_of(element)
+
+    def first_image(self, element) -> str:
+        entry = self.first_images.get(id(element))
+        return image_from(entry[1]) if entry else ""
+
+    def get(self, link) -> str:
+        image_url = self.first_image(link)
+        if image_url or link is self.root:
+            return image_url
+        element = self.parent_of(link)
+        while element is not None:
+            if self.name_of(element) in IMAGE_PARENT_TAGS:
+                return self.first_image(element)
+            if element is self.root:
+                break
+            element = self.parent_of(element)
+        return ""
+
+
+class SoupDocument:
+    """BeautifulSoup 트리 (기존 파서와 같은 방식)"""
+
+    engine = ENGINE_BS4
+
+    def __init__(self, html_content: Union[str, bytes]):
+        self.root = BeautifulSoup(html_content, 'lxml')
+        self.outside = ()
+        self.escaped = False
+
+    def limit_to_region(self) -> bool:
+        """
+        잘라낸 조각을 파싱한 문서이면 조각의 최상위 요소 바깥(body, html, 문서)을 표시합니다.
+        이후 find_parent가 바깥 요소에 닿으면 escaped가 켜집니다.
+
+        Returns:
+            body 안에 요소가 하나만 있으면 True (아니면 조각 경계가 잘못된 것)
+        """
+        html = self.root.html
+        body = html.body if html else None
+        if body is None:
+            return False
+        children = [child for child in body.children if not (isinstance(child, str) and not child.strip())]
+        if len(children) != 1 or isinstance(children[0], str):
+            return False
+        self.outside = (self.root, html, body)
+        return True
+
+    def checked(self, node):
+        if node is not None and any(node is outside for outside in self.outside):
+            self.escaped = True
+        return node
+
+    def find_all(self, tag: str, class_name: Optional[str] = None) -> List:
+        attrs = {'class_': class_name} if class_name else {}
+        return self.root.find_all(tag, **attrs)
+
+    def find_by_string(self, tag: str, class_name: Optional[str], pattern):
+        attrs = {'class_': class_name} if class_name else {}
+        return self.root.find(tag, string=pattern, **attrs)
+
+    def find_string(self, match, scope=None):
+        """문자열 노드 검색 (match: 정확히 같은 문자열 또는 정규식)"""
+        return (scope or self.root).find(string=match)
+
+    def find_strings(self, values, scope=None) -> dict:
+        """values 각각과 정확히 같은 첫 문자열 노드를 한 번의 순회로 찾습니다 {값: 노드}."""
+        wanted = set(values)
+        found = {}
+        for node in (scope or self.root).descendants:
+            if isinstance(node, NavigableString) and node in wanted and node not in found:
+                found[str(node)] = node
+                if len(found) == len(wanted):
+                    break
+        return found
+
+    def find_parent(self, node, names=None, class_name: Optional[str] = None):
+        attrs = {'class_': class_name} if class_name else {}
+        return self.checked(node.find_parent(names, **attrs))
+
+    def find_first(self, node, tags):
+        return node.find(tags)
+
+    def links(self, scope=None) -> List:
+        return (scope or self.root).find_all('a', href=True)
+
+    def text(self, node, strip: bool = True) -> str:
+        return node.get_text(strip=True) if strip else node.get_text()
+
+    def markup(self, node) -> str:
+        return str(node)
+
+    def image_map(self, scope=None) -> 'ImageMap':
+        """scope(None이면 문서 전체)의 링크 → 가장 가까운 이미지 URL 맵"""
+        root = scope or self.root
+        return ImageMap(root, root.find_all('img'), lambda element: element.parent, lambda element: element.name)
+
+    def meta_image(self) -> str:
+        og_image = self.root.find('meta', property='og:image')
+        image_url = og_image.get('content', '') if og_image else ""
+        if not image_url:
+            twitter_image = self.root.find('meta', attrs={'name': 'twitter:image'})
+            if twitter_image:
+                image_url = twitter_image.get('content', '')
+        return image_url
+
+    def body_image(self) -> str:
+        article_body = self.root.find(['article', 'div'], class_=ARTICLE_BODY_CLASS)
+        if article_body:
+            img_tag = article_body.find('img')
+            if img_tag:
+                return img_tag.get('src', '') or img_tag.get('data-src', '')
+        return ""
+
+
+class TextNode:
+    """lxml 트리의 문자열 노드 (BeautifulSoup의 NavigableString에 해당)"""
+
+    __slots__ = ('value', 'parent')
+
+    def __init__(self, value: str, parent):
+        self.value = value
+        self.parent = parent
+
+
+class LxmlDocument:
+    """
+    lxml 트리 + 미리 컴파일한 XPath.
+
+    문서 노드(BeautifulSoup 객체)는 ElementTree로 표현하며, <html>에서
+    위로 한 단계 더 올라가면 이 문서 노드가 됩니다.
+    """
+
+    engine = ENGINE_LXML
+
+    def __init__(self, html_content: Union[str, bytes]):
+        if isinstance(html_content, bytes):
+            html_content = decode_undeclared(html_content)
+        try:
+            root = etree.fromstring(html_content, get_html_parser())
+        except ValueError:
+            # 인코딩 선언(<?xml ... encoding=?>)이 있는 문자열은 바이트로 변환해 파싱
+            root = etree.fromstring(html_content.encode('utf-8'), etree.HTMLParser(encoding='utf-8'))
+        except etree.XMLSyntaxError:
+            root = None
+        self.root = root.getroottree() if root is not None else None
+        self.outside = ()
+        self.escaped = False
+
+    def limit_to_region(self) -> bool:
+        """SoupDocument.limit_to_region과 같음"""
+        if self.root is None:
+            return False
+        html = self.root.getroot()
+        body = html.find('body')
+        if body is None or len(body) != 1 or (body.text or '').strip() or (body[0].tail or '').strip():
+            return False
+        if not isinstance(body[0].tag, str):
+            return False
+        self.outside = (self.root, html, body)
+        return True
+
+    def checked(self, node):
+        if node is not None and any(node is outside for outside in self.outside):
+            self.escaped = True
+        return node
+
+    def find_all(self, tag: str, class_name: Optional[str] = None) -> List:
+        if self.root is None:
+            return []
+        return [element for element in tag_xpath((tag,), True)(self.root) if has_class(element, class_name)]
+
+    def find_by_string(self, tag: str, class_name: Optional[str], pattern):
+        for element in self.find_all(tag, class_name):
+            string = self.string(element)
+            if string is not None and pattern.search(string):
+                return element
+        return None
+
+    def string(self, element) -> Optional[str]:
+        """BeautifulSoup의 .string (자식이 문자열 하나 또는 태그 하나일 때만)"""
+        while True:
+            children = len(element)
+            if element.text:
+                if children:
+                    return None
+                return element.text
+            if children != 1:
+                return None
+            child = element[0]
+            if child.tail:
+                return None
+            if not isinstance(child.tag, str):
+                # 주석/처리 지시문도 BeautifulSoup에서는 문자열
+                return child.text
+            element = child
+
+    def string_nodes(self, scope=None):
+        """scope 안의 문자열 노드(텍스트, 주석)를 문서 순서대로 반환합니다 (값, 담은 요소)."""
+        if scope is None:
+            scope = self.root
+        if scope is None:
+            return
+        nodes = XPATH_DOCUMENT_STRINGS(scope) if scope is self.root else XPATH_STRINGS(scope)
+        for node in nodes:
+            if isinstance(node, str):
+                value = node
+                parent = node.getparent()
+                if node.is_tail:
+                    parent = parent.getparent()
+            else:
+                value = node.text or ''
+                parent = node.getparent()
+            # <html> 밖의 주석은 문서 노드에 속함
+            yield value, self.root if parent is None else parent
+
+    def find_string(self, match, scope=None) -> Optional[TextNode]:
+        """문자열 노드 검색 (match: 정확히 같은 문자열 또는 정규식)"""
+        exact = isinstance(match, str)
+        for value, parent in self.string_nodes(scope):
+            if (value == match) if exact else match.search(value):
+                return TextNode(value, parent)
+        return None
+
+    def find_strings(self, values, scope=None) -> dict:
+        """SoupDocument.find_strings와 같음"""
+        wanted = set(values)
+        found = {}
+        for value, parent in self.string_nodes(scope):
+            if value in wanted and value not in found:
+                found[value] = TextNode(value, parent)
+                if len(found) == len(wanted):
+                    break
+        return found
+
+    def find_parent(self, node, names=None, class_name: Optional[str] = None):
+        return self.checked(self.find_parent_node(node, names, class_name))
+
+    def find_parent_node(self, node, names=None, class_name: Optional[str] = None):
+        tags = as_tags(names)
+        if isinstance(node, TextNode):
+            # 문자열의 find_parent는 자신을 담은 요소부터 검사
+            element = node.parent
+            if isinstance(element, etree._ElementTree):
+                return element if not tags and not class_name else None
+            if not tags and not class_name:
+                return element
+            if (not tags or element.tag in tags) and has_class(element, class_name):
+                return element
+        elif isinstance(node, etree._ElementTree):
+            return None
+        else:
+            element = node
+
+        for ancestor in element.iterancestors(*tags):
+            if has_class(ancestor, class_name):
+                return ancestor
+        if not tags and not class_name:
+            # <html>의 부모는 문서 노드
+            return self.root
+        return None
+
+    def find_first(self, node, tags):
+        found = tag_xpath(as_tags(tags))(node)
+        return found[0] if found else None
+
+    def links(self, scope=None) -> List:
+        if scope is None:
+            scope = self.root
+        if scope is None:
+            return []
+        return XPATH_DOCUMENT_LINKS(scope) if scope is self.root else XPATH_LINKS(scope)
+
+    def text(self, node, strip: bool = True) -> str:
+        if strip:
+            return ''.join(string for string in (s.strip() for s in XPATH_TEXT(node)) if string)
+        return ''.join(XPATH_TEXT(node))
+
+    def markup(self, node) -> str:
+        return etree.tostring(node, encoding='unicode', method='html', with_tail=False)
+
+    def image_map(self, scope=None) -> 'ImageMap':
+        """SoupDocument.image_map과 같음"""
+        root = self.root.getroot() if scope is None and self.root is not None else scope
+        images = XPATH_IMAGES(root) if root is not None else []
+        return ImageMap(root, images, lambda element: element.getparent(), lambda element: element.tag)
+
+    def meta_image(self) -> str:
+        if self.root is None:
+            return ""
+        found = XPATH_OG_IMAGE(self.root)
+        image_url = found[0].get('content', '') if found else ""
+        if not image_url:
+            found = XPATH_TWITTER_IMAGE(self.root)
+            if found:
+                image_url = found[0].get('content', '')
+        return image_url
+
+    def body_image(self) -> str:
+        if self.root is None:
+            return ""
+        found = XPATH_ARTICLE_BODY(self.root)
+        if found:
+            img = XPATH_FIRST_IMG(found[0])
+            if img:
+                return img[0].get('src', '') or img[0].get('data-src', '')
+        return ""
+
+
+class ArticleTextExtractor:
+    """
+    기사 페이지를 청크 단위로 받아 제목(첫 <h1>)과 문단(<p>) 텍스트만 모으는 스트리밍 추출기.
+
+    lxml pull parser로 읽으면서 끝난 요소는 바로 비우고 앞선 형제 요소를 지우므로,
+    페이지 크기와 관계없이 트리 전체를 메모리에 두지 않습니다.
+    인코딩은 HTTP 헤더 선언 → 첫 청크의 BOM / <meta charset> → UTF-8 순서로 정합니다.
+    """
+
+    TEXT_TAGS = ('p', 'h1')
+
+    def __init__(self, declared_encoding: Optional[str] = None):
+        self.encoding = declared_encoding if is_known_encoding(declared_encoding) else None
+        self.parser: Optional[etree.HTMLPullParser] = None
+        self.title = ""
+        self.paragraphs: List[str] = []
+        self.depth = 0  # 열려 있는 <p>/<h1> 수 (안쪽 요소는 문단이 끝날 때까지 유지)
+
+    def _create_parser(self, first_chunk: bytes) -> etree.HTMLPullParser:
+        encoding = self.encoding
+        if encoding is None:
+            _, encoding = EncodingDetector.strip_byte_order_mark(first_chunk)
+        if not is_known_encoding(encoding):
+            encoding = EncodingDetector.find_declared_encoding(first_chunk, is_html=True, search_entire_document=True)
+        if not is_known_encoding(encoding):
+            encoding = 'utf-8'
+        return etree.HTMLPullParser(events=('start', 'end'), encoding=encoding)
+
+    def feed(self, chunk: bytes):
+        if not chunk:
+            return
+        if self.parser is None:
+            self.parser = self._create_parser(chunk)
+        self.parser.feed(chunk)
+        self._read_events()
+
+    def _read_events(self):
+        for event, element in self.parser.read_events():
+            if not isinstance(element.tag, str):
+                continue
+            tag = element.tag.lower()
+            if event == 'start':
+                if tag in self.TEXT_TAGS:
+                    self.depth += 1
+                continue
+
+            if tag in self.TEXT_TAGS:
+                self.depth -= 1
+                text = ''.join(XPATH_TEXT(element)).strip()
+                if text and tag == 'p':
+                    self.paragraphs.append(text)
+                elif text and not self.title:
+                    self.title = text
+            if self.depth == 0:
+                element.clear(keep_tail=True)
+                parent = element.getparent()
+                if parent is not None:
+                    while element.getprevious() is not None:
+                        del parent[0]
+
+    def close(self) -> Dict[str, object]:
+        """
+        남은 입력을 처리하고 추출 결과를 반환합니다.
+
+        Returns:
+            {'title': 제목, 'content': 문단을 빈 줄로 이은 본문, 'full_content_length': 본문 길이}
+        """
+        if self.parser is not None:
+            try:
+                self.parser.close()
+            except etree.XMLSyntaxError:
+                pass
+            self._read_events()
+        content = "\n\n".join(self.paragraphs)
+        return {'title': self.title, 'content': content, 'full_content_length': len(content)}
+
+
+DOCUMENT_CLASSES = {ENGINE_BS4: SoupDocument, ENGINE_LXML: LxmlDocument}
+
+
+def open_document(html_content: Union[str, bytes], engine: str = ENGINE_LXML):
+    """
+    지정한 엔진으로 HTML을 파싱합니다.
+
+    Args:
+        html_content: HTML 문자열 또는 바이트
+        engine: 'lxml' 또는 'bs4'
+
+    Raises:
+        ValueError: 알 수 없는 엔진
+    """
+    if engine not in DOCUMENT_CLASSES:
+        raise ValueError(f"알 수 없는 파서 엔진: {engine} (사용 가능: {', '.join(ENGINES)})")
+    return DOCUMENT_CLASSES[engine](html_content)
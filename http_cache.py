@@ -0,0 +1,253 @@
+"""
+섹션 페이지 조건부 요청(Conditional GET) 캐시
+ETag / Last-Modified 검증자와 본문을 디스크에 보관하고, 변경이 없는 페이지는 다시 처리하지 않도록 합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+from config import HTTP_CACHE_DIR
+from http_session import get_declared_encoding
+from metrics import run_metrics
+from news_item import NewsItem, from_dicts, to_dicts
+
+logger = logging.getLogger(__name__)
+
+# 페이지 상태 (이번 실행 기준)
+STATUS_NOT_MODIFIED = 'not_modified'  # 304 응답, 캐시된 본문 재사용
+STATUS_UNCHANGED = 'unchanged'        # 200 응답이지만 본문이 이전과 동일
+STATUS_CHANGED = 'changed'            # 본문이 변경됨
+STATUS_NEW = 'new'                    # 캐시에 없던 페이지
+
+STATUS_LABELS = {
+    STATUS_NOT_MODIFIED: '304 재사용',
+    STATUS_UNCHANGED: '200 동일',
+    STATUS_CHANGED: '200 변경',
+    STATUS_NEW: '신규',
+}
+
+
+def _url_key(url: str) -> str:
+    return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+
+def items_hash(news_items: List[NewsItem]) -> str:
+    """
+    뉴스 목록의 (URL, 제목) 순서 해시.
+    광고나 시각 표시로 본문 HTML이 바뀌어도 '많이 본 뉴스' 목록이 같으면 같은 값입니다.
+    """
+    digest = hashlib.sha1()
+    for item in news_items:
+        digest.update(item.get('url', '').encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(' '.join(item.get('title', '').split()).encode('utf-8'))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+class HttpCache:
+    """
+    섹션 페이지 HTTP 캐시.
+
+    index.json에 URL별 검증자(ETag, Last-Modified), 본문 해시와 선언된 인코딩, 마지막 처리 결과
+    (뉴스 항목과 목록 해시, 처리 시간)를 저장하고 본문은 받은 바이트 그대로 URL 해시 이름의 파일로 저장합니다.
+    """
+
+    def __init__(self, cache_dir: str = HTTP_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.index_file = os.path.join(cache_dir, 'index.json')
+        self.index: Dict[str, Dict] = {}
+        self.run_status: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def load(self):
+        """디스크에서 캐시 인덱스를 로드합니다."""
+        if not os.path.exists(self.index_file):
+            return
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        except Exception as e:
+            logger.warning(f"HTTP 캐시 로드 실패, 새로 시작합니다: {e}")
+            self.index = {}
+
+    def save(self):
+        """캐시 인덱스를 디스크에 저장합니다."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with self._lock:
+            snapshot = dict(self.index)
+        try:
+            with open(self.index_file, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+        except Exception as e:
+            logger.error(f"HTTP 캐시 저장 실패: {e}")
+
+    def _body_path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, f"{_url_key(url)}.html")
+
+    def _read_body(self, url: str) -> Optional[Tuple[bytes, Optional[str]]]:
+        with self._lock:
+            entry = self.index.get(url) or {}
+        # encoding 항목이 없는 이전 캐시는 본문을 UTF-8 텍스트로 저장했음
+        encoding = entry.get('encoding') if 'encoding' in entry else 'utf-8'
+        try:
+            with open(self._body_path(url), 'rb') as f:
+                return f.read(), encoding
+        except OSError:
+            return None
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        캐시된 검증자로 조건부 요청 헤더를 만듭니다.
+
+        Returns:
+            If-None-Match / If-Modified-Since 헤더 딕셔너리 (본문이 없으면 빈 딕셔너리)
+        """
+        with self._lock:
+            entry = self.index.get(url)
+        if not entry or not os.path.exists(self._body_path(url)):
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def handle_response(self, url: str, response: requests.Response) -> Optional[Tuple[bytes, Optional[str]]]:
+        """
+        응답을 캐시에 반영하고 사용할 HTML을 반환합니다.
+
+        Args:
+            url: 요청 URL
+            response: 200 또는 304 응답
+
+        Returns:
+            (HTML 바이트, 선언된 인코딩) (304인데 캐시 본문이 없으면 None)
+        """
+        if response.status_code == 304:
+            page = self._read_body(url)
+            if page is not None:
+                with self._lock:
+                    self.run_status[url] = STATUS_NOT_MODIFIED
+                run_metrics.add(f'http_cache_{STATUS_NOT_MODIFIED}')
+            return page
+
+        body = response.content
+        body_hash = hashlib.sha1(body).hexdigest()
+        encoding = get_declared_encoding(response.headers)
+
+        with self._lock:
+            entry = self.index.get(url)
+            if entry is None:
+                status = STATUS_NEW
+            elif entry.get('body_hash') == body_hash:
+                status = STATUS_UNCHANGED
+            else:
+                status = STATUS_CHANGED
+            self.run_status[url] = status
+
+            new_entry = {
+                'etag': response.headers.get('ETag', ''),
+                'last_modified': response.headers.get('Last-Modified', ''),
+                'body_hash': body_hash,
+                'encoding': encoding,
+            }
+            # 이전 처리 결과는 유지 (본문이 같으면 그대로 재사용, 바뀌었으면 파싱한 목록과 비교)
+            for key in ('items', 'items_hash', 'process_time'):
+                if entry and key in entry:
+                    new_entry[key] = entry[key]
+            self.index[url] = new_entry
+        run_metrics.add(f'http_cache_{status}')
+
+        body_path = self._body_path(url)
+        # 이전 형식(UTF-8 텍스트)으로 저장된 본문은 같은 내용이어도 바이트로 다시 저장
+        if status != STATUS_UNCHANGED or 'encoding' not in entry or not os.path.exists(body_path):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(body_path, 'wb') as f:
+                f.write(body)
+
+        return body, encoding
+
+    def is_unchanged(self, url: str) -> bool:
+        """이번 실행에서 페이지 본문이 이전과 같았는지 여부"""
+        with self._lock:
+            return self.run_status.get(url) in (STATUS_NOT_MODIFIED, STATUS_UNCHANGED)
+
+    def get_items(self, url: str, date: str) -> Optional[List[NewsItem]]:
+        """
+        페이지의 마지막 처리 결과(이미지까지 채워진 뉴스 항목)를 반환합니다.
+
+        다른 날짜에 처리한 결과는 date(파싱 날짜로 채운 값)가 지난 날짜라서 반환하지 않습니다.
+
+        Args:
+            date: 현재 수집 날짜 (YYYY-MM-DD)
+        """
+        with self._lock:
+            entry = self.index.get(url)
+            if not entry or entry.get('items_date') != date:
+                return None
+            items = entry.get('items')
+        return from_dicts(items) if items is not None else None
+
+    def get_same_items(self, url: str, news_items_hash: str) -> Optional[Tuple[List[NewsItem], float]]:
+        """
+        파싱한 목록이 마지막 처리 때와 같으면 그때의 처리 결과를 반환합니다.
+        호출하는 쪽은 찾아 둔 이미지(image_url)만 가져다 쓰고 날짜/수집 시각은 이번 파싱 결과를 씁니다.
+
+        Returns:
+            (이미지까지 채워진 뉴스 항목, 그때 이미지/병합/저장에 걸린 시간(초)) 또는 None
+        """
+        with self._lock:
+            entry = self.index.get(url)
+            if not entry or entry.get('items_hash') != news_items_hash or 'items' not in entry:
+                return None
+            return from_dicts(entry['items']), entry.get('process_time', 0.0)
+
+    def set_items(self, url: str, news_items: List[NewsItem], date: str, news_items_hash: Optional[str] = None,
+                  process_time: Optional[float] = None):
+        """
+        페이지의 처리 결과를 저장합니다 (다음 실행에서 본문이나 파싱한 목록이 같으면 재사용).
+
+        Args:
+            date: 처리한 수집 날짜 (YYYY-MM-DD)
+            news_items_hash: 파싱 직후 목록의 items_hash
+            process_time: 이미지/병합/저장에 걸린 시간 (초)
+        """
+        with self._lock:
+            if url in self.index:
+                self.index[url]['items'] = to_dicts(news_items)
+                self.index[url]['items_date'] = date
+                if news_items_hash is not None:
+                    self.index[url]['items_hash'] = news_items_hash
+                if process_time is not None:
+                    self.index[url]['process_time'] = round(process_time, 3)
+
+    def log_stats(self, source_names: Dict[str, str]):
+        """
+        소스별 재검증 결과를 로그로 출력합니다.
+
+        Args:
+            source_names: {URL: 표시할 소스 이름}
+        """
+        if not self.run_status:
+            return
+
+        logger.info("\n섹션 페이지 캐시 재검증 결과 (소스별):")
+        for url, name in source_names.items():
+            status = self.run_status.get(url)
+            if status:
+                logger.info(f"  - {name}: {STATUS_LABELS[status]}")
+
+        counts = {}
+        for status in self.run_status.values():
+            counts[status] = counts.get(status, 0) + 1
+        summary = ', '.join(f"{STATUS_LABELS[s]} {n}개" for s, n in counts.items())
+        logger.info(f"  합계: {summary}")
@@ -0,0 +1,190 @@
+"""
+호스트별 HTTP 세션 관리 모듈
+언론사 호스트마다 keep-alive 연결 풀을 가진 requests.Session을 하나씩 재사용합니다.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from typing import Dict, Mapping, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from archive import ResponseArchive
+from config import HEADERS, HTTP_POOL_SIZE, HTTP_ADAPTER_RETRIES
+from fetch_engine import get_host
+
+logger = logging.getLogger(__name__)
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+# 응답 기록/재생 보관소 (--record / --replay 실행 시에만 설정)
+_archive: Optional[ResponseArchive] = None
+
+# 실제로 맺은 TCP(+TLS) 연결 수 (호스트별)
+# 풀의 num_connections는 끊긴 연결을 같은 객체로 다시 맺는 경우를 세지 않으므로 직접 집계
+_connect_counts: Dict[str, int] = defaultdict(int)
+_connect_counts_lock = threading.Lock()
+
+
+def _count_connect(host: str):
+    with _connect_counts_lock:
+        _connect_counts[host] += 1
+
+
+class CountingHTTPConnection(HTTPConnection):
+    """connect() 호출 횟수를 집계하는 HTTP 연결"""
+
+    def connect(self):
+        super().connect()
+        _count_connect(self.host)
+
+
+class CountingHTTPSConnection(HTTPSConnection):
+    """connect() 호출 횟수를 집계하는 HTTPS 연결 (TLS 핸드셰이크 포함)"""
+
+    def connect(self):
+        super().connect()
+        _count_connect(self.host)
+
+
+class CountingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = CountingHTTPConnection
+
+
+class CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = CountingHTTPSConnection
+
+
+class CountingHTTPAdapter(HTTPAdapter):
+    """연결 수를 집계하는 커넥션 풀을 사용하는 어댑터"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': CountingHTTPConnectionPool,
+            'https': CountingHTTPSConnectionPool,
+        }
+
+
+def create_session() -> requests.Session:
+    """
+    공통 헤더, 연결 풀, 재시도 어댑터가 설정된 세션을 생성합니다.
+
+    어댑터 재시도는 끊어진 keep-alive 연결을 다시 맺는 용도로만 사용하고,
+    HTTP 상태 코드에 따른 재시도는 fetch_page에서 처리합니다.
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+
+    retry = Retry(
+        total=HTTP_ADAPTER_RETRIES,
+        status=0,
+        backoff_factor=0.3,
+        allowed_methods=['GET', 'HEAD'],
+        raise_on_status=False
+    )
+    adapter = CountingHTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+    if _archive is not None:
+        _archive.attach(session)
+    return session
+
+
+def set_archive(archive: Optional[ResponseArchive]):
+    """
+    이후 생성되는 세션에 응답 보관소를 연결합니다 (None이면 해제).
+
+    이미 만들어진 세션에는 적용되지 않으므로 크롤링 시작 전에 호출해야 합니다.
+    """
+    global _archive
+    close_sessions()
+    _archive = archive
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    URL의 호스트에 해당하는 공유 세션을 반환합니다 (없으면 생성).
+
+    Args:
+        url: 요청할 URL
+
+    Returns:
+        호스트 전용 requests.Session
+    """
+    host = get_host(url)
+    with _sessions_lock:
+        session = _sessions.get(host)
+        if session is None:
+            session = create_session()
+            _sessions[host] = session
+        return session
+
+
+def get_declared_encoding(headers: Mapping[str, str]) -> Optional[str]:
+    """
+    응답 헤더의 Content-Type에 선언된 charset을 반환합니다 (선언이 없으면 None).
+
+    requests.utils.get_encoding_from_headers와 달리 charset이 없는 text/* 응답을
+    ISO-8859-1로 보지 않으므로, 본문의 <meta charset> 선언을 사용할 수 있습니다.
+    """
+    headers = CaseInsensitiveDict(headers)
+    if 'charset' not in headers.get('Content-Type', '').lower():
+        return None
+    return requests.utils.get_encoding_from_headers(headers)
+
+
+def get_connection_stats() -> Dict[str, Tuple[int, int]]:
+    """
+    호스트별 연결 재사용 통계를 반환합니다.
+
+    Returns:
+        {호스트: (새 연결 수, 재사용 연결 수)} 딕셔너리
+    """
+    stats = {}
+    with _sessions_lock:
+        sessions = dict(_sessions)
+
+    for host, session in sessions.items():
+        requests_sent = 0
+        connect_hosts = set()
+        for adapter in set(session.adapters.values()):
+            pools = adapter.poolmanager.pools
+            for key in list(pools.keys()):
+                pool = pools.get(key)
+                if pool is not None:
+                    requests_sent += pool.num_requests
+                    connect_hosts.add(pool.host)
+        with _connect_counts_lock:
+            new_connections = sum(_connect_counts[h] for h in connect_hosts)
+        stats[host] = (new_connections, max(0, requests_sent - new_connections))
+    return stats
+
+
+def log_connection_stats():
+    """호스트별 새 연결/재사용 연결 수를 로그로 출력합니다."""
+    stats = get_connection_stats()
+    if not stats:
+        return
+
+    logger.info("\nHTTP 연결 재사용 통계 (호스트별):")
+    for host, (new_connections, reused) in sorted(stats.items()):
+        logger.info(f"  - {host}: 새 연결 {new_connections}개, 재사용 {reused}회")
+
+
+def close_sessions():
+    """모든 세션의 연결을 닫고 세션 목록을 비웁니다."""
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+    with _connect_counts_lock:
+        _connect_counts.clear()
@@ -0,0 +1,136 @@
+"""
+기사 URL → 이미지 URL 영구 캐시
+크롤링 시간대(09-00, 15-00, 19-00)와 날짜를 넘어 같은 기사의 이미지를 다시 조회하지 않도록 디스크에 저장합니다.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from config import (
+    IMAGE_CACHE_FILE, IMAGE_CACHE_TTL, IMAGE_CACHE_NEGATIVE_TTL, IMAGE_CACHE_MAX_ENTRIES
+)
+from news_item import NewsItem
+
+logger = logging.getLogger(__name__)
+
+
+# 기사와 무관한 유입 추적용 쿼리 파라미터 (utm_*는 접두사로 제거)
+TRACKING_PARAMS = frozenset({'fbclid', 'gclid'})
+
+
+def is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name.startswith('utm_') or name in TRACKING_PARAMS
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    캐시 키로 사용할 정규화된 기사 URL을 반환합니다.
+    (호스트 소문자화, 추적용 쿼리 파라미터/프래그먼트 및 끝 슬래시 제거)
+
+    기사 ID가 쿼리에 있는 사이트(예: view.php?id=123)가 있으므로 나머지 쿼리는 유지합니다.
+    """
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip('/') or '/'
+    query = urlencode([(name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                       if not is_tracking_param(name)])
+    return urlunsplit((parts.scheme.lower() or 'https', parts.netloc.lower(), path, query, ''))
+
+
+class ImageCache:
+    """
+    TTL과 최대 개수 제한(항목을 넣을 때 LRU 제거)이 있는 이미지 URL 캐시.
+
+    이미지가 없는 기사(빈 문자열)도 더 짧은 TTL로 캐시합니다.
+    """
+
+    def __init__(self, path: str = IMAGE_CACHE_FILE, ttl: float = IMAGE_CACHE_TTL,
+                 negative_ttl: float = IMAGE_CACHE_NEGATIVE_TTL,
+                 max_entries: int = IMAGE_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        # 최근에 사용한 항목일수록 뒤쪽에 위치 (LRU 순서)
+        self.entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def load(self):
+        """디스크에서 캐시를 로드합니다 (없거나 손상되었으면 빈 캐시로 시작)."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = OrderedDict(json.load(f))
+            logger.info(f"이미지 캐시 {len(self.entries)}개 로드됨")
+        except Exception as e:
+            logger.warning(f"이미지 캐시 로드 실패, 새로 시작합니다: {e}")
+            self.entries = OrderedDict()
+
+    def _is_expired(self, entry: Dict, now: float) -> bool:
+        ttl = self.ttl if entry['image_url'] else self.negative_ttl
+        return now - entry['stored_at'] > ttl
+
+    def get(self, article_url: str) -> Optional[str]:
+        """
+        캐시된 이미지 URL을 반환합니다.
+
+        Returns:
+            이미지 URL (이미지 없음으로 캐시된 경우 빈 문자열), 캐시에 없으면 None
+        """
+        key = canonicalize_url(article_url)
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None or self._is_expired(entry, time.time()):
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry['image_url']
+
+    def put(self, article_url: str, image_url: str):
+        """기사의 이미지 URL(없으면 빈 문자열)을 저장합니다."""
+        key = canonicalize_url(article_url)
+        with self._lock:
+            self.entries[key] = {'image_url': image_url or "", 'stored_at': time.time()}
+            self.entries.move_to_end(key)
+            # 실행 중에도 최대 개수를 넘지 않도록 가장 오래 사용하지 않은 항목부터 제거
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+
+    def put_listing_images(self, news_items: List[NewsItem]):
+        """파서가 목록 페이지에서 이미 찾은 이미지 URL을 캐시에 저장합니다."""
+        for item in news_items:
+            if item.get('image_url'):
+                self.put(item['url'], item['image_url'])
+
+    def save(self):
+        """만료 항목과 초과 항목(LRU)을 제거한 뒤 디스크에 저장합니다."""
+        with self._lock:
+            now = time.time()
+            for key in [k for k, entry in self.entries.items() if self._is_expired(entry, now)]:
+                del self.entries[key]
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+            snapshot = dict(self.entries)
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        try:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+        except Exception as e:
+            logger.error(f"이미지 캐시 저장 실패: {e}")
+
+    def log_stats(self):
+        """캐시 적중/실패 횟수를 로그로 출력합니다."""
+        total = self.hits + self.misses
+        hit_rate = (self.hits / total * 100) if total else 0.0
+        logger.info(f"이미지 캐시: 적중 {self.hits}회, 실패 {self.misses}회 (적중률 {hit_rate:.1f}%), 저장 {len(self.entries)}개")
@@ -0,0 +1,209 @@
+"""
+기사 이미지 추출 단계
+기사 페이지 이미지 조회를 호스트별 제한된 작업자 풀에서 실행하고, 호스트별 token bucket으로 요청 속도를 제한합니다.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from config import IMAGE_WORKERS_PER_HOST, IMAGE_RATE_LIMITS, DEFAULT_IMAGE_RATE_LIMIT, IMAGE_RATE_BURST
+from fetch_engine import get_host
+from image_cache import ImageCache
+from metrics import run_metrics
+from news_item import NewsItem
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    스레드 안전한 token bucket.
+
+    초당 rate개의 토큰이 채워지며 최대 capacity개까지 쌓입니다.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        토큰 하나를 얻을 때까지 대기합니다.
+
+        Returns:
+            대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+
+class HostStats:
+    """호스트별 이미지 조회 통계"""
+
+    def __init__(self):
+        self.requests = 0
+        self.found = 0
+        self.failed = 0            # 조회 실패 (캐시에 저장하지 않음)
+        self.queue_wait = 0.0      # 작업자 대기 시간 합계
+        self.throttle_wait = 0.0   # token bucket 대기 시간 합계
+        self.first_start = None
+        self.last_end = None
+
+
+class ImageResolver:
+    """
+    기사 이미지 조회 단계.
+
+    여러 소스가 동시에 resolve()를 호출할 수 있으며, 호스트마다 별도의 작업자 풀과
+    token bucket을 사용하므로 한 언론사의 요청이 다른 언론사를 기다리지 않습니다.
+    cache가 주어지면 기사 요청 전에 먼저 조회하고, 조회 결과를 다시 저장합니다.
+    resolve_func가 None을 반환하면(요청 실패) 캐시에 저장하지 않아 다음 실행에서 다시 조회합니다.
+    throttle이 False이면 속도 제한 없이 조회합니다 (네트워크를 쓰지 않는 재생 모드용).
+    """
+
+    def __init__(self, resolve_func: Callable[[str, str], Optional[str]], workers_per_host: int = IMAGE_WORKERS_PER_HOST,
+                 cache: Optional[ImageCache] = None, throttle: bool = True):
+        self.resolve_func = resolve_func
+        self.cache = cache
+        self.throttle = throttle
+        self.workers_per_host = workers_per_host
+        self.executors: Dict[str, ThreadPoolExecutor] = {}
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.stats: Dict[str, HostStats] = defaultdict(HostStats)
+        # 이미지 출처별 항목 수 (목록 페이지 / 이전 수집 / 캐시 / 기사 페이지 조회)
+        self.sources: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def _get_executor(self, host: str) -> ThreadPoolExecutor:
+        with self._lock:
+            if host not in self.executors:
+                self.executors[host] = ThreadPoolExecutor(
+                    max_workers=self.workers_per_host,
+                    thread_name_prefix=f'image-{host}'
+                )
+            return self.executors[host]
+
+    def _get_bucket(self, host: str) -> TokenBucket:
+        with self._lock:
+            if host not in self.buckets:
+                rate = IMAGE_RATE_LIMITS.get(host, DEFAULT_IMAGE_RATE_LIMIT)
+                self.buckets[host] = TokenBucket(rate, IMAGE_RATE_BURST)
+            return self.buckets[host]
+
+    def _lookup(self, host: str, article_url: str, source: str, submitted_at: float) -> str:
+        started = time.monotonic()
+        throttle_wait = self._get_bucket(host).acquire() if self.throttle else 0.0
+
+        image_url = self.resolve_func(article_url, source)
+        failed = image_url is None
+        if failed:
+            image_url = ""
+        elif self.cache is not None:
+            self.cache.put(article_url, image_url)
+
+        ended = time.monotonic()
+        with self._lock:
+            stats = self.stats[host]
+            stats.requests += 1
+            stats.found += 1 if image_url else 0
+            stats.failed += 1 if failed else 0
+            stats.queue_wait += started - submitted_at
+            stats.throttle_wait += throttle_wait
+            if stats.first_start is None or started < stats.first_start:
+                stats.first_start = started
+            if stats.last_end is None or ended > stats.last_end:
+                stats.last_end = ended
+        return image_url
+
+    def resolve(self, news_items: List[NewsItem], source: str,
+                known_images: Optional[Dict[str, str]] = None):
+        """
+        image_url이 비어 있는 항목의 이미지를 조회해 채웁니다 (완료될 때까지 대기).
+
+        Args:
+            news_items: 뉴스 항목 리스트 (제자리에서 수정됨)
+            source: 뉴스 소스 이름
+            known_images: 이전 실행에서 본 기사의 이미지 URL (기사 URL → 이미지 URL, 캐시보다 먼저 사용)
+        """
+        if self.cache is not None:
+            self.cache.put_listing_images(news_items)
+
+        pending = []
+        from_listing = from_seen = cache_hits = 0
+        for item in news_items:
+            if item.get('image_url'):
+                from_listing += 1
+                run_metrics.add('images_from_listing')
+            elif known_images and known_images.get(item['url']):
+                item['image_url'] = known_images[item['url']]
+                from_seen += 1
+                run_metrics.add('images_from_seen')
+            else:  # 이미지 URL이 없는 경우에만
+                if self.cache is not None:
+                    cached = self.cache.get(item['url'])
+                    if cached is not None:
+                        item['image_url'] = cached
+                        cache_hits += 1
+                        run_metrics.add('image_cache_hits')
+                        continue
+                host = get_host(item['url'])
+                future = self._get_executor(host).submit(
+                    self._lookup, host, item['url'], source, time.monotonic()
+                )
+                pending.append((item, future))
+        run_metrics.add('image_lookups', len(pending))
+        with self._lock:
+            self.sources['listing'] += from_listing
+            self.sources['seen'] += from_seen
+            self.sources['cache'] += cache_hits
+            self.sources['article'] += len(pending)
+
+        for item, future in pending:
+            try:
+                item['image_url'] = future.result()
+            except Exception as e:
+                logger.debug(f"이미지 조회 실패 ({item['url']}): {e}")
+                item['image_url'] = ""
+
+    def log_stats(self):
+        """이미지 출처별 항목 수와 호스트별 처리량/대기 시간을 로그로 출력합니다."""
+        total = sum(self.sources.values())
+        if total:
+            article = self.sources['article']
+            logger.info(f"\n이미지 출처: 목록 페이지 {self.sources['listing']}건, 이전 수집 {self.sources['seen']}건, "
+                        f"캐시 {self.sources['cache']}건, 기사 페이지 조회 필요 {article}건 (전체 {total}건 중 {article / total * 100:.1f}%)")
+        if not self.stats:
+            return
+
+        logger.info("\n이미지 추출 단계 통계 (호스트별):")
+        for host, stats in sorted(self.stats.items()):
+            elapsed = (stats.last_end - stats.first_start) if stats.requests else 0.0
+            throughput = stats.requests / elapsed if elapsed > 0 else 0.0
+            logger.info(
+                f"  - {host}: {stats.requests}건 (이미지 {stats.found}건, 실패 {stats.failed}건), "
+                f"{throughput:.2f}건/초, "
+                f"평균 큐 대기 {stats.queue_wait / stats.requests:.2f}초, "
+                f"평균 속도제한 대기 {stats.throttle_wait / stats.requests:.2f}초"
+            )
+
+    def shutdown(self):
+        """작업자 풀을 종료합니다."""
+        for executor in self.executors.values():
+            executor.shutdown(wait=True)
@@ -0,0 +1,152 @@
+"""
+크롤링 실행 지표(Run Metrics) 수집 모듈
+단계별 소요 시간과 카운터(바이트, 항목 수, 캐시 적중 등)를 소스별로 집계해 JSON 요약으로 저장합니다.
+
+사용 예:
+    with run_metrics.stage('parse', scope='politics/donga'):
+        ...
+        run_metrics.add('items_parsed', len(items))   # 현재 단계의 scope로 집계
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RunMetrics:
+    """
+    한 번의 크롤링 실행 지표.
+
+    stage()는 소요 시간을 기록하는 컨텍스트 매니저이며, 블록 안에서(같은 스레드) 호출한
+    add()는 별도 지정이 없으면 해당 단계의 scope(카테고리/소스)와 전체 합계에 함께 집계됩니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self):
+        """새 실행을 위해 모든 지표를 초기화합니다."""
+        with self._lock:
+            self.started_at = datetime.now().isoformat(timespec='seconds')
+            self._started = time.perf_counter()
+            self.info: Dict[str, Any] = {}
+            self.stages: Dict[str, float] = defaultdict(float)
+            self.counters: Dict[str, int] = defaultdict(int)
+            self.sources: Dict[str, Dict[str, Dict]] = {}
+
+    def _current_scope(self) -> Optional[str]:
+        return getattr(self._local, 'scope', None)
+
+    def _source(self, scope: str) -> Dict[str, Dict]:
+        if scope not in self.sources:
+            self.sources[scope] = {'stages': defaultdict(float), 'counters': defaultdict(int)}
+        return self.sources[scope]
+
+    @contextmanager
+    def stage(self, name: str, scope: Optional[str] = None) -> Iterator[None]:
+        """
+        블록의 소요 시간을 name 단계로 기록합니다.
+
+        Args:
+            name: 단계 이름 (fetch, parse, images, merge, save, report, trend 등)
+            scope: 소스 단위 단계이면 '카테고리/소스', 실행 전체 단계이면 None
+        """
+        scope = scope or self._current_scope()
+        previous = self._current_scope()
+        self._local.scope = scope
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self._local.scope = previous
+            with self._lock:
+                if scope:
+                    self._source(scope)['stages'][name] += elapsed
+                else:
+                    self.stages[name] += elapsed
+
+    def add(self, name: str, value: int = 1, scope: Optional[str] = None):
+        """
+        카운터를 증가시킵니다 (전체 합계 + scope별).
+
+        Args:
+            name: 카운터 이름
+            value: 증가량
+            scope: 집계할 '카테고리/소스' (생략 시 현재 단계의 scope)
+        """
+        scope = scope or self._current_scope()
+        with self._lock:
+            self.counters[name] += value
+            if scope:
+                self._source(scope)['counters'][name] += value
+
+    def set_info(self, **info):
+        """실행 정보(모드, 성공 여부 등)를 기록합니다."""
+        with self._lock:
+            self.info.update(info)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON으로 저장할 실행 요약을 반환합니다."""
+        with self._lock:
+            # 소스 단위 단계는 동시에 실행되므로 합계는 실행 시간이 아니라 누적 작업 시간
+            source_stage_totals = defaultdict(float)
+            for source in self.sources.values():
+                for name, elapsed in source['stages'].items():
+                    source_stage_totals[name] += elapsed
+
+            return {
+                'started_at': self.started_at,
+                'wall_time': round(time.perf_counter() - self._started, 3),
+                **self.info,
+                'stages': {name: round(elapsed, 3) for name, elapsed in self.stages.items()},
+                'source_stage_totals': {name: round(elapsed, 3) for name, elapsed in source_stage_totals.items()},
+                'counters': dict(self.counters),
+                'sources': {
+                    scope: {
+                        'stages': {name: round(elapsed, 3) for name, elapsed in source['stages'].items()},
+                        'counters': dict(source['counters']),
+                    }
+                    for scope, source in sorted(self.sources.items())
+                },
+            }
+
+    def save(self, path: str) -> Dict[str, Any]:
+        """
+        실행 요약을 JSON 파일로 저장합니다.
+
+        Returns:
+            저장한 요약 딕셔너리
+        """
+        summary = self.to_dict()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, ensure_ascii=False, indent=2)
+            logger.info(f"실행 지표 저장: {path}")
+        except Exception as e:
+            logger.error(f"실행 지표 저장 실패: {e}")
+        return summary
+
+    def log_stats(self):
+        """단계별 소요 시간을 로그로 출력합니다."""
+        summary = self.to_dict()
+        logger.info(f"\n단계별 소요 시간 (전체 {summary['wall_time']:.2f}초):")
+        for name, elapsed in summary['stages'].items():
+            logger.info(f"  - {name}: {elapsed:.2f}초")
+        for name, elapsed in summary['source_stage_totals'].items():
+            logger.info(f"  - {name} (소스 합계): {elapsed:.2f}초")
+
+
+# 크롤링 실행 전체에서 공유하는 지표 (crawl_news 실행마다 초기화)
+run_metrics = RunMetrics()
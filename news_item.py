@@ -0,0 +1,130 @@
+"""
+뉴스 항목 레코드 (__slots__)
+파서가 만든 항목부터 병합, 저장소, 분석, 보고서까지 같은 NewsItem을 씁니다.
+JSON으로 쓰고 읽는 곳(저장소, 일별 로그, docs/data, HTTP 캐시)에서만 dict로 바꿉니다.
+
+- 항목마다 딕셔너리 대신 고정 슬롯을 써서 몇 달치 기록을 불러와도 메모리가 적게 듭니다.
+- 반복되는 값(category, source, main_category, date)은 sys.intern으로 문자열 하나를 공유합니다.
+- item['title'], item.get('image_url'), 'source' in item, item.update(other)처럼
+  기존 딕셔너리 코드가 그대로 동작합니다. 값이 없는 필드(None)는 키가 없는 것으로 봅니다.
+- FIELDS 밖의 키(extra_fields 설정 등)는 extra 딕셔너리에 보관합니다.
+"""
+
+import sys
+from operator import attrgetter
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+# JSON으로 쓸 때의 필드 순서
+FIELDS = ('title', 'url', 'date', 'category', 'source', 'image_url', 'scraped_at', 'main_category')
+INTERNED_FIELDS = frozenset({'date', 'category', 'source', 'main_category'})
+
+_FIELD_SET = frozenset(FIELDS)
+_get_fields = attrgetter(*FIELDS)
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if type(value) is str else value
+
+
+class NewsItem:
+    """뉴스 항목 하나 (딕셔너리처럼 읽고 쓸 수 있는 슬롯 객체)"""
+
+    __slots__ = FIELDS + ('extra',)
+
+    def __init__(self, title: Optional[str] = None, url: Optional[str] = None, date: Optional[str] = None,
+                 category: Optional[str] = None, source: Optional[str] = None,
+                 image_url: Optional[str] = None, scraped_at: Optional[str] = None,
+                 main_category: Optional[str] = None, extra: Optional[Dict[str, object]] = None):
+        self.title = title
+        self.url = url
+        self.date = _intern(date)
+        self.category = _intern(category)
+        self.source = _intern(source)
+        self.image_url = image_url
+        self.scraped_at = scraped_at
+        self.main_category = _intern(main_category)
+        self.extra = extra or None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, object]) -> 'NewsItem':
+        """JSON에서 읽은 딕셔너리를 NewsItem으로 바꿉니다."""
+        get = data.get
+        item = cls(get('title'), get('url'), get('date'), get('category'), get('source'),
+                   get('image_url'), get('scraped_at'), get('main_category'))
+        if not _FIELD_SET.issuperset(data):
+            item.extra = {key: value for key, value in data.items() if key not in _FIELD_SET}
+        return item
+
+    def to_dict(self) -> Dict[str, object]:
+        """JSON으로 쓸 딕셔너리 (FIELDS 순서, 값이 없는 필드 제외, extra는 뒤에)"""
+        data = {key: value for key, value in zip(FIELDS, _get_fields(self)) if value is not None}
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    # 딕셔너리 호환
+
+    def __getitem__(self, key: str):
+        value = getattr(self, key, None) if key in _FIELD_SET else (self.extra or {}).get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: str, value):
+        if key in _FIELD_SET:
+            setattr(self, key, sys.intern(value) if key in INTERNED_FIELDS and type(value) is str else value)
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key: str) -> bool:
+        if key in _FIELD_SET:
+            return getattr(self, key) is not None
+        return bool(self.extra) and key in self.extra
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self) -> List[str]:
+        return [key for key, _ in self.items()]
+
+    def items(self) -> Iterator[Tuple[str, object]]:
+        return iter(self.to_dict().items())
+
+    def update(self, other: Mapping[str, object] = (), **kwargs):
+        """dict.update와 같이 other에 있는 필드만 덮어씁니다."""
+        pairs: Iterable[Tuple[str, object]] = other.items() if hasattr(other, 'items') else other
+        for key, value in pairs:
+            self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, NewsItem):
+            return _get_fields(self) == _get_fields(other) and (self.extra or None) == (other.extra or None)
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __reduce__(self):
+        # 파싱 프로세스 → 메인 프로세스 전달용 (필드 값 튜플만 보냄)
+        return NewsItem, _get_fields(self) + (self.extra,)
+
+    def __repr__(self) -> str:
+        return f"NewsItem({self.to_dict()!r})"
+
+
+def from_dicts(records: Iterable[Mapping[str, object]]) -> List[NewsItem]:
+    """JSON에서 읽은 항목 목록을 NewsItem 리스트로"""
+    return [NewsItem.from_dict(record) for record in records]
+
+
+def to_dicts(news_items: Iterable[NewsItem]) -> List[Dict[str, object]]:
+    """JSON으로 쓸 항목 딕셔너리 리스트 (dict 항목은 그대로)"""
+    return [item.to_dict() if isinstance(item, NewsItem) else item for item in news_items]
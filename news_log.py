@@ -0,0 +1,286 @@
+"""
+뉴스 일별 로그 (추가 전용 JSON Lines)
+카테고리/소스별로 하루에 파일 하나를 두고, 저장할 때마다 바뀐 항목만 압축한 한 줄씩 덧붙입니다.
+
+    data/{category}/{source}/log_{date}.jsonl
+
+    {"base":{"category":"정치","source":"동아일보","main_category":"정치"},"fields":["title","url",...]}  # 첫 줄
+    {"_slot":"09-00","url":"...","title":"...","date":"...",...}   # 처음 기록하는 기사: base와 다른 필드만
+    {"_slot":"15-00","url":"...","scraped_at":"..."}               # 기록한 적 있는 기사: 마지막 기록과 다른 필드만
+    {"_slot":"15-00","_reset":true}                                # 이 시간대 목록을 비우고 다음 줄부터 다시 기록
+
+첫 줄에는 파일 안의 모든 항목이 같은 값(카테고리/소스 이름)과 필드 순서를 한 번만 적습니다.
+시간대 목록(docs/가 읽는 news_{date}_{time}.json)은 파일을 한 줄씩 읽어 다시 만듭니다:
+URL별로 기록 순서대로 모은 뒤 merge_news와 같이 date 내림차순(같은 날짜는 기록 순서)으로 정렬합니다.
+덧붙일 때 다시 만든 목록이 저장할 목록과 다르면(항목 삭제 등) _reset 후 목록 전체를 기록하므로
+읽은 목록은 항상 저장한 목록과 같습니다.
+
+    python news_log.py migrate [--data-dir data] [--keep]   # 시간대별 JSON 파일을 일별 로그로 변환
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from config import DATA_DIR, NEWS_LOG_TEMPLATE
+from news_item import NewsItem, to_dicts
+
+logger = logging.getLogger(__name__)
+
+BASE_FIELDS = ('category', 'source', 'main_category')  # 소스 파일 안에서 모든 항목이 같은 값
+SLOT_KEY = '_slot'
+RESET_KEY = '_reset'
+DROP_KEY = '_drop'  # 마지막 기록에는 있었지만 이번 항목에는 없는 필드
+
+NEWS_FILE_PATTERN = re.compile(r'^news_(\d{4}-\d{2}-\d{2})_(\d{2}-\d{2})\.json$')
+LOG_FILE_PATTERN = re.compile(r'^log_(\d{4}-\d{2}-\d{2})\.jsonl$')
+
+_MISSING = object()
+
+
+def encode_record(record: Dict[str, object]) -> str:
+    """공백 없는 한 줄 JSON"""
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+
+
+def sort_slot(news_items) -> List[Dict[str, str]]:
+    """merge_news와 같은 순서 (date 내림차순, 같은 날짜는 기존 순서)"""
+    return sorted(news_items, key=lambda x: x.get('date', ''), reverse=True)
+
+
+def get_log_path(category: str, source: str, date: str, data_dir: str = DATA_DIR) -> str:
+    """일별 로그 파일 경로 (category/source는 영문)"""
+    path = NEWS_LOG_TEMPLATE.format(category=category, source=source, date=date)
+    if data_dir != DATA_DIR:
+        path = os.path.join(data_dir, os.path.relpath(path, DATA_DIR))
+    return path
+
+
+def _iter_source_files(data_dir: str, pattern: re.Pattern) -> Iterator[Tuple[str, str, re.Match, str]]:
+    if not os.path.isdir(data_dir):
+        return
+    for category in sorted(os.listdir(data_dir)):
+        category_path = os.path.join(data_dir, category)
+        if not os.path.isdir(category_path):
+            continue
+        for source in sorted(os.listdir(category_path)):
+            source_path = os.path.join(category_path, source)
+            if not os.path.isdir(source_path):
+                continue
+            for filename in sorted(os.listdir(source_path)):
+                match = pattern.match(filename)
+                if match:
+                    yield category, source, match, os.path.join(source_path, filename)
+
+
+def iter_news_files(data_dir: str = DATA_DIR) -> Iterator[Tuple[Tuple[str, str, str, str], str]]:
+    """{category}/{source}/news_{date}_{time}.json 파일과 (category, source, date, slot) 키"""
+    for category, source, match, path in _iter_source_files(data_dir, NEWS_FILE_PATTERN):
+        yield (category, source, match.group(1), match.group(2)), path
+
+
+def iter_log_files(data_dir: str = DATA_DIR) -> Iterator[Tuple[Tuple[str, str, str], str]]:
+    """{category}/{source}/log_{date}.jsonl 파일과 (category, source, date) 키"""
+    for category, source, match, path in _iter_source_files(data_dir, LOG_FILE_PATTERN):
+        yield (category, source, match.group(1)), path
+
+
+class NewsLog:
+    """
+    일별 로그 파일 하나를 읽은 상태.
+
+    시간대별 목록(URL → 항목, 기록 순서)과 URL별 마지막 기록을 들고 있어,
+    다음에 덧붙일 기록을 마지막 기록과의 차이로 만들 수 있습니다.
+    """
+
+    def __init__(self, header: Optional[Dict[str, object]] = None):
+        self.header = header
+        self.last: Dict[str, Dict[str, str]] = {}
+        self.slots: Dict[str, Dict[str, Dict[str, str]]] = {}
+
+    def _ordered(self, item: Dict[str, str]) -> Dict[str, str]:
+        fields = self.header['fields']
+        ordered = {key: item[key] for key in fields if key in item}
+        ordered.update((key, value) for key, value in item.items() if key not in ordered)
+        return ordered
+
+    def apply(self, record: Dict[str, object]):
+        """기록 한 줄을 반영합니다."""
+        record = dict(record)
+        view = self.slots.setdefault(record.pop(SLOT_KEY), {})
+        if record.pop(RESET_KEY, False):
+            view.clear()
+            return
+
+        drop = record.pop(DROP_KEY, ())
+        item = dict(self.last.get(record['url']) or self.header['base'])
+        item.update(record)
+        for key in drop:
+            item.pop(key, None)
+        item = self._ordered(item)
+        self.last[item['url']] = item
+        view[item['url']] = item  # 이미 있는 URL은 자리를 유지하고 내용만 바꿈 (merge_news와 같음)
+
+    def slot_items(self, slot: str) -> List[Dict[str, str]]:
+        """시간대 목록 (저장한 목록과 같은 순서)"""
+        return sort_slot(self.slots.get(slot, {}).values())
+
+    def _delta(self, slot: str, item: Dict[str, str]) -> Dict[str, object]:
+        previous = self.last.get(item['url']) or self.header['base']
+        record = {SLOT_KEY: slot, 'url': item['url']}
+        record.update((key, value) for key, value in item.items()
+                      if key != 'url' and previous.get(key, _MISSING) != value)
+        drop = [key for key in previous if key not in item]
+        if drop:
+            record[DROP_KEY] = drop
+        return record
+
+    def diff(self, slot: str, news_items: List[Dict[str, str]]) -> List[Dict[str, object]]:
+        """
+        slot 목록을 news_items로 만들기 위해 덧붙일 기록을 만들고 상태에 반영합니다.
+
+        Returns:
+            기록 리스트 (바뀐 항목이 없으면 빈 리스트)
+        """
+        if not news_items and not self.slots.get(slot):
+            return []
+        if self.header is None:
+            first = news_items[0]
+            self.header = {'base': {key: first[key] for key in BASE_FIELDS if key in first},
+                           'fields': list(first)}
+
+        view = self.slots.get(slot, {})
+        changed = [item for item in news_items if view.get(item['url']) != item]
+        rebuilt = dict(view)
+        rebuilt.update((item['url'], item) for item in changed)
+
+        records = []
+        if sort_slot(rebuilt.values()) != news_items:
+            records.append({SLOT_KEY: slot, RESET_KEY: True})
+            self.apply(records[0])
+            changed = news_items
+        for item in changed:
+            record = self._delta(slot, item)
+            self.apply(record)
+            records.append(record)
+        return records
+
+
+def read_log(path: str) -> NewsLog:
+    """로그 파일을 한 줄씩 읽어 상태를 만듭니다 (파일이 없으면 빈 상태)."""
+    news_log = NewsLog()
+    if not os.path.exists(path):
+        return news_log
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # 기록 도중 중단된 줄 (다음 기록은 새 줄에서 시작)
+                logger.warning(f"뉴스 로그의 깨진 줄을 건너뜁니다 ({path}:{line_no})")
+                continue
+            if news_log.header is None:
+                news_log.header = record
+            else:
+                news_log.apply(record)
+    return news_log
+
+
+def read_slot(path: str, slot: str) -> List[Dict[str, str]]:
+    """로그 파일에서 시간대 목록 하나를 다시 만듭니다."""
+    return read_log(path).slot_items(slot)
+
+
+def append_slot(path: str, slot: str, news_items: List[NewsItem]) -> int:
+    """
+    시간대 목록을 news_items로 바꾸는 기록을 로그에 덧붙입니다.
+
+    Returns:
+        덧붙인 바이트 수 (바뀐 항목이 없으면 0)
+    """
+    news_log = read_log(path)
+    new_file = news_log.header is None
+    records = news_log.diff(slot, to_dicts(news_items))
+    if not records:
+        return 0
+
+    lines = [encode_record(news_log.header)] if new_file else []
+    lines.extend(encode_record(record) for record in records)
+    data = ('\n'.join(lines) + '\n').encode('utf-8')
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'ab') as f:
+        if f.tell():
+            with open(path, 'rb') as existing:
+                existing.seek(-1, os.SEEK_END)
+                if existing.read(1) != b'\n':
+                    data = b'\n' + data
+        f.write(data)
+    return len(data)
+
+
+def migrate(data_dir: str = DATA_DIR, keep: bool = False) -> Dict[str, int]:
+    """
+    시간대별 JSON 파일을 일별 로그로 변환합니다 (같은 소스/날짜의 시간대 순서로 덧붙임).
+    다시 만든 목록이 원본과 같은 파일만 삭제합니다 (keep이면 삭제하지 않음).
+
+    Returns:
+        {'json_files', 'log_files', 'json_bytes', 'log_bytes', 'mismatched'}
+    """
+    groups = defaultdict(list)
+    for (category, source, date, slot), path in iter_news_files(data_dir):
+        groups[(category, source, date)].append((slot, path))
+
+    stats = {'json_files': 0, 'log_files': 0, 'json_bytes': 0, 'log_bytes': 0, 'mismatched': 0}
+    for (category, source, date), slots in groups.items():
+        log_path = get_log_path(category, source, date, data_dir)
+        converted = []
+        for slot, path in sorted(slots):
+            with open(path, 'r', encoding='utf-8') as f:
+                news_items = json.load(f)
+            append_slot(log_path, slot, news_items)
+            converted.append((slot, path, news_items))
+
+        news_log = read_log(log_path)
+        for slot, path, news_items in converted:
+            stats['json_files'] += 1
+            stats['json_bytes'] += os.path.getsize(path)
+            if news_log.slot_items(slot) != news_items:
+                stats['mismatched'] += 1
+                logger.warning(f"로그에서 다시 만든 목록이 원본과 다릅니다: {path}")
+            elif not keep:
+                os.remove(path)
+        if os.path.exists(log_path):
+            stats['log_files'] += 1
+            stats['log_bytes'] += os.path.getsize(log_path)
+    return stats
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
+    arg_parser = argparse.ArgumentParser(description='뉴스 일별 로그 (추가 전용 JSON Lines)')
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+    migrate_parser = commands.add_parser('migrate', help='시간대별 JSON 파일을 일별 로그로 변환')
+    migrate_parser.add_argument('--data-dir', default=DATA_DIR, help=f'변환할 폴더 (기본 {DATA_DIR})')
+    migrate_parser.add_argument('--keep', action='store_true', help='변환한 JSON 파일을 삭제하지 않음')
+    args = arg_parser.parse_args()
+
+    stats = migrate(args.data_dir, args.keep)
+    if not stats['json_files']:
+        print(f"✅ {args.data_dir}/에 변환할 시간대별 JSON 파일이 없습니다")
+        return
+    saved = (1 - stats['log_bytes'] / stats['json_bytes']) * 100 if stats['json_bytes'] else 0
+    print(f"✅ JSON 파일 {stats['json_files']}개 → 일별 로그 {stats['log_files']}개")
+    print(f"   {stats['json_bytes']:,} bytes → {stats['log_bytes']:,} bytes ({saved:.1f}% 감소)")
+    if stats['mismatched']:
+        print(f"⚠️ 원본과 다른 목록 {stats['mismatched']}개 (원본 파일 유지)")
+
+
+if __name__ == "__main__":
+    main()
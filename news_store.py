@@ -0,0 +1,446 @@
+"""
+뉴스 저장소 (SQLite)
+수집한 뉴스 항목의 기준 저장소입니다. data/의 일별 로그(news_log)와 docs/data/의 시간대별 JSON 파일
+(docs/가 읽는 형식)은 저장할 때 함께 쓰는 사본입니다.
+
+    db/news.sqlite3    # news 테이블: 카테고리/소스/날짜/시간대별 뉴스 항목 (WAL 모드)
+
+카테고리·소스·날짜·시간대·URL에 인덱스가 있어 "이번 주 정치 기사" 같은 조회가
+파일 탐색(os.listdir + json.load) 대신 인덱스 조회가 됩니다.
+
+seen_urls 테이블은 시간대/날짜와 관계없이 한 번이라도 본 기사 URL의 색인입니다 (URL 해시 → 처음/마지막으로 본
+날짜, 이미지 URL). 크롤러는 파싱한 항목을 새 기사 / 오늘 본 기사 / 이전에 본 기사로 나누고,
+이미 본 기사는 기록해 둔 이미지를 사용합니다. 마지막으로 본 지 SEEN_URL_RETENTION_DAYS일이 지나면 삭제합니다.
+처음 열 때 data/의 일별 로그 중 마지막으로 가져온 뒤 바뀐 파일(source_files 테이블의 내용 해시와 다른 파일)을
+다시 가져옵니다. 저장소가 비어 있거나(새 체크아웃, Actions 캐시 만료) 복원한 캐시가 커밋된 로그보다
+오래된 경우에도 저장소가 git의 로그와 같아집니다.
+
+    python news_store.py import                          # data/ 일별 로그/JSON 파일 일괄 가져오기
+    python news_store.py export [--from D] [--to D]      # 저장소 → docs/data/{category}/{source}/news_{date}_{time}.json
+    python news_store.py query --category politics --days 7
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from config import CATEGORY_EN_MAP, DATA_DIR, NEWS_DB_FILE, NEWS_JSON_TEMPLATE, SITE_DATA_DIR, SOURCE_EN_MAP
+from news_item import NewsItem, to_dicts
+from news_log import iter_log_files, iter_news_files, read_log
+from output_writer import output_writer
+
+logger = logging.getLogger(__name__)
+
+# 한국 시간대 (KST = UTC+9) - 저장소의 date는 KST 기준 수집 날짜
+KST = timezone(timedelta(hours=9))
+
+# category/source는 data/의 폴더 이름(영문), item은 항목 JSON 그대로 (키 순서 유지, 내보내기용)
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS news (
+    category TEXT NOT NULL,
+    source TEXT NOT NULL,
+    date TEXT NOT NULL,
+    slot TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    title TEXT NOT NULL,
+    item TEXT NOT NULL,
+    PRIMARY KEY (category, source, date, slot, position)
+);
+CREATE INDEX IF NOT EXISTS idx_news_url ON news (url);
+CREATE INDEX IF NOT EXISTS idx_news_date ON news (date);
+CREATE INDEX IF NOT EXISTS idx_news_category ON news (category, date);
+CREATE INDEX IF NOT EXISTS idx_news_source ON news (source, date);
+CREATE INDEX IF NOT EXISTS idx_news_slot ON news (slot, date);
+CREATE TABLE IF NOT EXISTS seen_urls (
+    url_hash INTEGER PRIMARY KEY,
+    first_date TEXT NOT NULL,
+    last_date TEXT NOT NULL,
+    image_url TEXT NOT NULL DEFAULT ''
+);
+CREATE INDEX IF NOT EXISTS idx_seen_last_date ON seen_urls (last_date);
+CREATE TABLE IF NOT EXISTS source_files (
+    path TEXT PRIMARY KEY,
+    digest TEXT NOT NULL
+);
+"""
+
+SlotKey = Tuple[str, str, str, str]  # (category, source, date, slot)
+SeenEntry = Tuple[str, str, str]  # (처음 본 날짜, 마지막으로 본 날짜, 이미지 URL)
+
+# 기사 URL 분류
+SEEN_NEW = 'new'                # 처음 본 기사
+SEEN_TODAY = 'seen_today'       # 오늘 이전 시간대(또는 같은 시간대)에 본 기사
+SEEN_EARLIER = 'seen_earlier'   # 이전 날짜에 본 기사
+
+
+def url_hash(url: str) -> int:
+    """seen_urls의 키 (URL의 64비트 해시, SQLite INTEGER 범위)"""
+    return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'big', signed=True)
+
+
+def classify_seen(entry: Optional[SeenEntry], date: str) -> str:
+    """lookup_seen()의 결과로 기사를 분류합니다 (SEEN_NEW / SEEN_TODAY / SEEN_EARLIER)."""
+    if entry is None:
+        return SEEN_NEW
+    return SEEN_TODAY if entry[1] == date else SEEN_EARLIER
+
+
+def get_source_key(category: str, source: str) -> Tuple[str, str]:
+    """한글 카테고리/소스 이름을 저장소(폴더)에서 쓰는 영문 이름으로 바꿉니다."""
+    category_en = CATEGORY_EN_MAP.get(category, category.lower())
+    source_en = SOURCE_EN_MAP.get(source, source.lower().replace(' ', '_'))
+    return category_en, source_en
+
+
+def get_slot_json_path(category: str, source: str, date: str, slot: str, data_dir: str = SITE_DATA_DIR) -> str:
+    """내보낼 JSON 파일 경로 (docs/data/{category}/{source}/news_{date}_{time}.json)"""
+    path = NEWS_JSON_TEMPLATE.format(category=category, source=source, date=date, time=slot)
+    if data_dir != SITE_DATA_DIR:
+        path = os.path.join(data_dir, os.path.relpath(path, SITE_DATA_DIR))
+    return path
+
+
+def write_slot_json(path: str, news_items: List[NewsItem]) -> bool:
+    """
+    시간대 하나의 뉴스 항목을 docs/가 읽는 JSON 형식으로 씁니다.
+
+    Returns:
+        파일을 썼으면 True, 기존 파일과 내용이 같아 건너뛰었으면 False
+    """
+    return output_writer.write_json(path, to_dicts(news_items))
+
+
+class NewsStore:
+    """
+    뉴스 항목 저장소.
+
+    시간대(카테고리/소스/날짜/시간대) 단위로 항목 목록을 통째로 바꿔 쓰고, 저장한 순서대로 읽습니다.
+    연결 하나를 잠금으로 보호하므로 여러 수집 스레드에서 동시에 호출할 수 있습니다.
+    """
+
+    def __init__(self, db_file: str = NEWS_DB_FILE):
+        self.db_file = db_file
+        self.conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.conn is None:
+            os.makedirs(os.path.dirname(self.db_file) or '.', exist_ok=True)
+            conn = sqlite3.connect(self.db_file, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.executescript(SCHEMA)
+            self.conn = conn
+        return self.conn
+
+    def count(self) -> int:
+        """저장된 뉴스 항목 수"""
+        with self._lock:
+            return self._connect().execute('SELECT COUNT(*) FROM news').fetchone()[0]
+
+    def count_seen(self) -> int:
+        """기사 URL 색인의 URL 수"""
+        with self._lock:
+            return self._connect().execute('SELECT COUNT(*) FROM seen_urls').fetchone()[0]
+
+    def _replace(self, conn: sqlite3.Connection, key: SlotKey, news_items: List[NewsItem]):
+        news_items = to_dicts(news_items)
+        conn.execute('DELETE FROM news WHERE category = ? AND source = ? AND date = ? AND slot = ?', key)
+        conn.executemany(
+            'INSERT INTO news (category, source, date, slot, position, url, title, item) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            [(*key, position, item.get('url', ''), item.get('title', ''), json.dumps(item, ensure_ascii=False))
+             for position, item in enumerate(news_items)]
+        )
+
+    def save_slot(self, category: str, source: str, date: str, slot: str, news_items: List[NewsItem]):
+        """시간대 하나의 뉴스 항목을 한 트랜잭션으로 바꿔 씁니다 (category/source는 영문)."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                self._replace(conn, (category, source, date, slot), news_items)
+
+    def _slot_records(self, category: str, source: str, date: str, slot: str) -> List[Dict[str, str]]:
+        # 저장한 항목 JSON 그대로 (키 순서 유지, 내보내기용)
+        with self._lock:
+            rows = self._connect().execute(
+                'SELECT item FROM news WHERE category = ? AND source = ? AND date = ? AND slot = ? '
+                'ORDER BY position', (category, source, date, slot)
+            ).fetchall()
+        return [json.loads(item) for item, in rows]
+
+    def load_slot(self, category: str, source: str, date: str, slot: str) -> List[NewsItem]:
+        """시간대 하나의 뉴스 항목 (저장한 순서)"""
+        return [NewsItem.from_dict(record) for record in self._slot_records(category, source, date, slot)]
+
+    def _where(self, category: Optional[str], source: Optional[str], date_from: Optional[str],
+               date_to: Optional[str], slot: Optional[str]) -> Tuple[str, List[str]]:
+        conditions, params = [], []
+        for column, op, value in (('category', '=', category), ('source', '=', source),
+                                  ('date', '>=', date_from), ('date', '<=', date_to), ('slot', '=', slot)):
+            if value is not None:
+                conditions.append(f'{column} {op} ?')
+                params.append(value)
+        return (' WHERE ' + ' AND '.join(conditions)) if conditions else '', params
+
+    def load_news(self, category: Optional[str] = None, source: Optional[str] = None,
+                  date_from: Optional[str] = None, date_to: Optional[str] = None,
+                  slot: Optional[str] = None) -> List[NewsItem]:
+        """
+        조건에 맞는 뉴스 항목을 날짜/시간대/카테고리/소스/저장 순서로 반환합니다.
+
+        Args:
+            category: 영문 카테고리 (None이면 전체)
+            source: 영문 소스 (None이면 전체)
+            date_from: 시작 날짜 (YYYY-MM-DD, 포함)
+            date_to: 끝 날짜 (YYYY-MM-DD, 포함)
+            slot: 시간대 (09-00, 15-00, 19-00 중 하나, None이면 전체)
+        """
+        where, params = self._where(category, source, date_from, date_to, slot)
+        with self._lock:
+            rows = self._connect().execute(
+                f'SELECT item FROM news{where} ORDER BY date, slot, category, source, position', params
+            ).fetchall()
+        return [NewsItem.from_dict(json.loads(item)) for item, in rows]
+
+    def list_slots(self, date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[SlotKey]:
+        """항목이 있는 (category, source, date, slot) 목록"""
+        where, params = self._where(None, None, date_from, date_to, None)
+        with self._lock:
+            return self._connect().execute(
+                f'SELECT DISTINCT category, source, date, slot FROM news{where} '
+                f'ORDER BY category, source, date, slot', params
+            ).fetchall()
+
+    def delete_before(self, date: str) -> int:
+        """date(YYYY-MM-DD)보다 오래된 항목을 삭제하고 삭제한 항목 수를 반환합니다."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                return conn.execute('DELETE FROM news WHERE date < ?', (date,)).rowcount
+
+    def lookup_seen(self, urls: List[str]) -> Dict[str, SeenEntry]:
+        """색인에 있는 URL의 (처음 본 날짜, 마지막으로 본 날짜, 이미지 URL) - 정수 키 조회"""
+        hashes = {url_hash(url): url for url in urls}
+        if not hashes:
+            return {}
+        placeholders = ', '.join('?' * len(hashes))
+        with self._lock:
+            rows = self._connect().execute(
+                f'SELECT url_hash, first_date, last_date, image_url FROM seen_urls WHERE url_hash IN ({placeholders})',
+                list(hashes)
+            ).fetchall()
+        return {hashes[key]: (first_date, last_date, image_url) for key, first_date, last_date, image_url in rows}
+
+    def mark_seen(self, news_items: List[NewsItem], date: str):
+        """뉴스 항목의 URL을 date에 본 것으로 기록합니다 (이미지 URL은 비어 있지 않을 때만 갱신)."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    'INSERT INTO seen_urls (url_hash, first_date, last_date, image_url) VALUES (?, ?, ?, ?) '
+                    'ON CONFLICT (url_hash) DO UPDATE SET last_date = MAX(last_date, excluded.last_date), '
+                    "image_url = CASE WHEN excluded.image_url != '' THEN excluded.image_url ELSE image_url END",
+                    [(url_hash(item['url']), date, date, item.get('image_url') or '') for item in news_items]
+                )
+
+    def expire_seen(self, before_date: str) -> int:
+        """before_date(YYYY-MM-DD) 전에 마지막으로 본 URL을 색인에서 삭제하고 삭제한 수를 반환합니다."""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                return conn.execute('DELETE FROM seen_urls WHERE last_date < ?', (before_date,)).rowcount
+
+    def rebuild_seen(self) -> int:
+        """저장된 뉴스 항목으로 기사 URL 색인을 다시 만들고 색인한 URL 수를 반환합니다."""
+        with self._lock:
+            conn = self._connect()
+            rows = conn.execute(
+                "SELECT url, MIN(date), MAX(date), MAX(COALESCE(json_extract(item, '$.image_url'), '')) "
+                'FROM news GROUP BY url'
+            ).fetchall()
+            with conn:
+                conn.execute('DELETE FROM seen_urls')
+                conn.executemany(
+                    'INSERT OR REPLACE INTO seen_urls (url_hash, first_date, last_date, image_url) VALUES (?, ?, ?, ?)',
+                    [(url_hash(url), first_date, last_date, image_url) for url, first_date, last_date, image_url in rows]
+                )
+        return len(rows)
+
+    def import_files(self, data_dir: str = DATA_DIR, changed_only: bool = False) -> Tuple[int, int]:
+        """
+        data/의 일별 로그와 (변환 전) 시간대별 JSON 파일을 한 트랜잭션으로 가져옵니다.
+        이미 있는 시간대는 파일 내용으로 바꾸며, 같은 시간대가 둘 다 있으면 로그를 따릅니다.
+        로그를 가져올 때는 그 날짜의 시간대 중 로그와 JSON 파일 어디에도 없는 시간대를 삭제합니다.
+
+        가져온 파일의 내용 해시를 source_files 테이블에 기록하며,
+        changed_only이면 기록한 해시와 내용이 같은 파일은 건너뜁니다.
+
+        Returns:
+            (가져온 파일 수, 가져온 항목 수)
+        """
+        files = items = 0
+        with self._lock:
+            conn = self._connect()
+            known = dict(conn.execute('SELECT path, digest FROM source_files')) if changed_only else {}
+            present = set()
+            news_files = list(iter_news_files(data_dir))
+            json_keys = {key for key, _ in news_files}
+            with conn:
+                def read_changed(path: str) -> Optional[bytes]:
+                    try:
+                        with open(path, 'rb') as f:
+                            data = f.read()
+                    except OSError as e:
+                        logger.warning(f"뉴스 파일 읽기 실패 ({path}): {e}")
+                        return None
+                    relpath = os.path.relpath(path, data_dir)
+                    present.add(relpath)
+                    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+                    if known.get(relpath) == digest:
+                        return None
+                    conn.execute('INSERT OR REPLACE INTO source_files (path, digest) VALUES (?, ?)', (relpath, digest))
+                    return data
+
+                for key, path in news_files:
+                    data = read_changed(path)
+                    if data is None:
+                        continue
+                    try:
+                        news_items = json.loads(data)
+                    except ValueError as e:
+                        logger.warning(f"뉴스 파일 읽기 실패 ({path}): {e}")
+                        continue
+                    self._replace(conn, key, news_items)
+                    files += 1
+                    items += len(news_items)
+                for (category, source, date), path in iter_log_files(data_dir):
+                    if read_changed(path) is None:
+                        continue
+                    news_log = read_log(path)
+                    stale = [slot for slot, in conn.execute(
+                        'SELECT DISTINCT slot FROM news WHERE category = ? AND source = ? AND date = ?',
+                        (category, source, date))
+                        if slot not in news_log.slots and (category, source, date, slot) not in json_keys]
+                    for slot in stale:
+                        self._replace(conn, (category, source, date, slot), [])
+                    for slot in news_log.slots:
+                        news_items = news_log.slot_items(slot)
+                        self._replace(conn, (category, source, date, slot), news_items)
+                        items += len(news_items)
+                    files += 1
+                # 삭제된 파일(cleanup_old_data 등)의 해시 기록 정리
+                conn.executemany('DELETE FROM source_files WHERE path = ?',
+                                 [(path,) for path in set(known) - present])
+        return files, items
+
+    def record_file(self, path: str, data_dir: str = DATA_DIR):
+        """저장소에 이미 반영한 파일(방금 덧붙인 일별 로그)의 내용 해시를 기록합니다 (다음 실행에서 다시 가져오지 않음)."""
+        with open(path, 'rb') as f:
+            digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute('INSERT OR REPLACE INTO source_files (path, digest) VALUES (?, ?)',
+                             (os.path.relpath(path, data_dir), digest))
+
+    def export_json(self, data_dir: str = SITE_DATA_DIR, date_from: Optional[str] = None,
+                    date_to: Optional[str] = None) -> int:
+        """
+        저장소의 항목을 docs/data/{category}/{source}/news_{date}_{time}.json 형식으로 내보냅니다.
+
+        Returns:
+            쓴 파일 수
+        """
+        slots = self.list_slots(date_from, date_to)
+        for category, source, date, slot in slots:
+            write_slot_json(get_slot_json_path(category, source, date, slot, data_dir),
+                            self._slot_records(category, source, date, slot))
+        return len(slots)
+
+    def close(self):
+        with self._lock:
+            if self.conn is not None:
+                self.conn.close()
+                self.conn = None
+
+
+news_store_lock = threading.Lock()
+news_store: Optional[NewsStore] = None
+
+
+def get_news_store() -> NewsStore:
+    """
+    프로세스에서 공유하는 저장소를 반환합니다.
+    처음 열 때 data/의 일별 로그(와 변환 전 JSON 파일) 중 마지막으로 가져온 뒤 바뀐 파일을 가져오고,
+    기사 URL 색인이 비어 있으면 저장된 항목으로 만듭니다.
+    """
+    global news_store
+    with news_store_lock:
+        if news_store is None:
+            store = NewsStore()
+            files, items = store.import_files(changed_only=True)
+            if files:
+                logger.info(f"뉴스 저장소: {DATA_DIR}/에서 바뀐 파일 {files}개, 항목 {items}개를 가져왔습니다")
+            if not store.count_seen() and store.count():
+                logger.info(f"기사 URL 색인 {store.rebuild_seen()}개 생성")
+            news_store = store
+        return news_store
+
+
+def close_news_store():
+    """공유 저장소를 닫습니다 (다음 get_news_store()는 현재 작업 폴더의 저장소를 새로 엶)."""
+    global news_store
+    with news_store_lock:
+        if news_store is not None:
+            news_store.close()
+            news_store = None
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='뉴스 저장소 (SQLite) 가져오기/내보내기/조회')
+    commands = arg_parser.add_subparsers(dest='command', required=True)
+
+    import_parser = commands.add_parser('import', help=f'{DATA_DIR}/의 일별 로그/JSON 파일을 저장소로 가져오기')
+    import_parser.add_argument('--data-dir', default=DATA_DIR, help=f'가져올 폴더 (기본 {DATA_DIR})')
+
+    export_parser = commands.add_parser('export', help='저장소를 JSON 파일로 내보내기')
+    export_parser.add_argument('--data-dir', default=SITE_DATA_DIR, help=f'내보낼 폴더 (기본 {SITE_DATA_DIR})')
+    export_parser.add_argument('--from', dest='date_from', help='시작 날짜 (YYYY-MM-DD)')
+    export_parser.add_argument('--to', dest='date_to', help='끝 날짜 (YYYY-MM-DD)')
+
+    query_parser = commands.add_parser('query', help='조건에 맞는 기사 조회')
+    query_parser.add_argument('--category', help='영문 카테고리 (politics 등)')
+    query_parser.add_argument('--source', help='영문 소스 (donga 등)')
+    query_parser.add_argument('--days', type=int, default=7, help='오늘까지 최근 N일 (기본 7)')
+    query_parser.add_argument('--slot', help='시간대 (09-00, 15-00, 19-00)')
+    args = arg_parser.parse_args()
+
+    store = NewsStore()
+    if args.command == 'import':
+        files, items = store.import_files(args.data_dir)
+        print(f"✅ 파일 {files}개, 뉴스 {items}개를 {store.db_file}로 가져왔습니다 (저장소 전체 {store.count()}개)")
+    elif args.command == 'export':
+        files = store.export_json(args.data_dir, args.date_from, args.date_to)
+        output_writer.sync()
+        print(f"✅ {store.db_file}에서 JSON 파일 {files}개를 {args.data_dir}/로 내보냈습니다 "
+              f"(내용이 같아 건너뜀 {sum(output_writer.skipped.values())}개)")
+    else:
+        today = datetime.now(KST)
+        date_from = (today - timedelta(days=args.days - 1)).strftime('%Y-%m-%d')
+        news_items = store.load_news(args.category, args.source, date_from, today.strftime('%Y-%m-%d'), args.slot)
+        for item in news_items:
+            print(f"- {item.get('date', '')} {item.get('title', '')}\n  {item.get('url', '')}")
+        print(f"\n📰 {date_from} 이후 뉴스 {len(news_items)}개")
+    store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+파이프라인 출력 파일 쓰기 (docs/data 시간대별 JSON, 보고서, 트렌드 데이터)
+git에 커밋되는 파일을 쓸 때 모두 이 모듈을 거칩니다.
+
+- 내용이 기존 파일과 같으면(해시 비교) 쓰지 않아 파일 시각/커밋 변경이 생기지 않습니다.
+  volatile 패턴에 맞는 줄(생성 시각 등)은 비교에서 제외하므로, 그 줄만 다르면 기존 파일을 그대로 둡니다.
+- 같은 폴더의 임시 파일에 쓴 뒤 os.replace로 바꾸므로 중간에 중단돼도 반쯤 쓴 파일이 남지 않습니다.
+- fsync는 파일마다 하지 않고 실행 끝의 sync()에서 쓴 파일과 폴더를 한 번에 합니다.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Pattern
+
+from metrics import run_metrics
+
+logger = logging.getLogger(__name__)
+
+
+def content_hash(data: bytes, volatile: Optional[Pattern[bytes]] = None) -> str:
+    """비교용 내용 해시 (volatile에 맞는 부분 제외)"""
+    if volatile is not None:
+        data = volatile.sub(b'', data)
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def volatile_lines(pattern: str) -> Pattern[bytes]:
+    """pattern으로 시작하는 줄 전체를 비교에서 제외하는 정규식 (UTF-8)"""
+    return re.compile(rb'^' + pattern.encode('utf-8') + rb'.*$', re.MULTILINE)
+
+
+class OutputWriter:
+    """
+    출력 파일 쓰기 단계.
+
+    여러 스레드에서 동시에 호출할 수 있으며(같은 파일을 동시에 쓰지 않는 한),
+    최상위 폴더(docs, reports 등)별로 쓴 파일과 건너뛴 파일 수를 집계합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """새 실행을 위해 집계와 fsync 대기 목록을 초기화합니다."""
+        with self._lock:
+            self.written: Dict[str, int] = defaultdict(int)
+            self.skipped: Dict[str, int] = defaultdict(int)
+            self.bytes_written = 0
+            self.pending_sync: List[str] = []
+
+    def _is_same(self, path: str, data: bytes, volatile: Optional[Pattern[bytes]]) -> bool:
+        try:
+            if volatile is None and os.path.getsize(path) != len(data):
+                return False
+            with open(path, 'rb') as f:
+                existing = f.read()
+        except OSError:
+            return False
+        return content_hash(existing, volatile) == content_hash(data, volatile)
+
+    def write_bytes(self, path: str, data: bytes, volatile: Optional[Pattern[bytes]] = None) -> bool:
+        """
+        내용이 바뀐 경우에만 path를 원자적으로 바꿉니다.
+
+        Returns:
+            파일을 썼으면 True, 기존 파일과 같아 건너뛰었으면 False
+        """
+        group = os.path.normpath(path).split(os.sep)[0]
+        if self._is_same(path, data, volatile):
+            with self._lock:
+                self.skipped[group] += 1
+            run_metrics.add('outputs_skipped')
+            return False
+
+        directory = os.path.dirname(path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.chmod(temp_path, os.stat(path).st_mode & 0o777 if os.path.exists(path) else 0o644)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        with self._lock:
+            self.written[group] += 1
+            self.bytes_written += len(data)
+            self.pending_sync.append(path)
+        run_metrics.add('outputs_written')
+        return True
+
+    def write_text(self, path: str, text: str, volatile: Optional[Pattern[bytes]] = None) -> bool:
+        """UTF-8 텍스트 파일 쓰기 (write_bytes 참고)"""
+        return self.write_bytes(path, text.encode('utf-8'), volatile)
+
+    def write_json(self, path: str, data, volatile: Optional[Pattern[bytes]] = None) -> bool:
+        """들여쓰기 2칸 JSON 파일 쓰기 (json.dump(..., ensure_ascii=False, indent=2)와 같은 내용)"""
+        return self.write_text(path, json.dumps(data, ensure_ascii=False, indent=2), volatile)
+
+    def sync(self) -> int:
+        """이번 실행에서 쓴 파일과 그 폴더를 한 번에 fsync하고 fsync한 파일 수를 반환합니다."""
+        with self._lock:
+            paths, self.pending_sync = self.pending_sync, []
+        directories = set()
+        for path in paths:
+            try:
+                fd = os.open(path, os.O_RDONLY)
+                try:
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+            except OSError as e:
+                logger.warning(f"fsync 실패 ({path}): {e}")
+            directories.add(os.path.dirname(path) or '.')
+        if hasattr(os, 'O_DIRECTORY'):  # Windows는 폴더 fsync 미지원
+            for directory in directories:
+                try:
+                    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+                    try:
+                        os.fsync(fd)
+                    finally:
+                        os.close(fd)
+                except OSError:
+                    pass
+        return len(paths)
+
+    def log_stats(self):
+        """폴더별로 쓴 파일과 내용이 같아 건너뛴 파일 수를 로그로 출력합니다."""
+        written, skipped = sum(self.written.values()), sum(self.skipped.values())
+        if not written + skipped:
+            return
+        logger.info(f"\n출력 파일: 씀 {written}개 ({self.bytes_written:,} bytes), 내용 같아 건너뜀 {skipped}개")
+        for group in sorted(set(self.written) | set(self.skipped)):
+            logger.info(f"  - {group}/: 씀 {self.written[group]}개, 건너뜀 {self.skipped[group]}개")
+
+
+# 실행 전체에서 공유하는 출력 쓰기 단계 (crawl_news 실행마다 초기화)
+output_writer = OutputWriter()
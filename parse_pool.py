@@ -0,0 +1,103 @@
+"""
+파싱 프로세스 풀
+섹션 페이지 파싱과 기사 이미지 추출(HTML 파싱)을 별도 프로세스에서 실행해,
+수집 스레드가 GIL을 기다리지 않고 여러 코어에서 동시에 파싱합니다.
+
+작업 함수는 parse_worker에 있고, 작업 프로세스는 forkserver(지원하지 않는 OS는 spawn) 방식으로 띄웁니다.
+fork와 달리 크롤러 프로세스의 세션, 캐시, 저장소 연결, 스레드/잠금 상태를 물려받지 않으며,
+필요한 설정(파서 엔진, 수집 날짜/시간대)은 initializer(parse_worker.init_worker)로 넘깁니다.
+"""
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple, Union
+
+import parse_worker
+from config import PARSE_WORKERS
+from metrics import run_metrics
+from news_item import NewsItem
+from parse_worker import find_article_image, get_worker_settings, init_worker, parse_section, run_counted
+
+logger = logging.getLogger(__name__)
+
+
+def get_pool_context():
+    """forkserver(가능하면) 또는 spawn 방식의 multiprocessing 컨텍스트"""
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        # 서버 프로세스는 작업 모듈만 미리 불러옴 (기본값인 실행 스크립트 대신)
+        context.set_forkserver_preload([parse_worker.__name__])
+        return context
+    return multiprocessing.get_context('spawn')
+
+
+class ParsePool:
+    """
+    파싱 작업을 프로세스 풀에 넘기는 단계.
+
+    여러 스레드(소스 처리, 이미지 조회)에서 동시에 호출할 수 있습니다.
+    start()로 크롤링 시작 전에 작업 프로세스를 띄워 둡니다 (호출하지 않으면 처음 사용할 때 시작).
+    작업 프로세스 설정은 풀을 시작할 때의 값이므로 set_crawl_slot 이후에 시작합니다.
+    workers가 0이면 프로세스 풀 없이 호출한 스레드에서 바로 파싱합니다 (기존 방식).
+    어느 쪽이든 같은 함수로 파싱하므로 결과는 같습니다.
+    """
+
+    def __init__(self, workers: Optional[int] = PARSE_WORKERS):
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.tasks = 0
+        self.busy_time = 0.0  # 작업 제출부터 결과 수신까지 시간 합계 (전송 포함)
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self.executor is None:
+                self.tasks = 0
+                self.busy_time = 0.0
+                self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=get_pool_context(),
+                                                    initializer=init_worker, initargs=(get_worker_settings(),))
+                logger.info(f"파싱 프로세스 풀 시작: 작업자 {self.workers}개")
+            return self.executor
+
+    def start(self):
+        """작업 프로세스를 띄웁니다 (forkserver 서버와 첫 작업 프로세스 시작 비용을 크롤링 전에 처리)."""
+        if self.workers:
+            self._get_executor().submit(int).result()
+
+    def _run(self, func, *args):
+        if not self.workers:
+            return func(*args)
+
+        started = time.perf_counter()
+        result, counters = self._get_executor().submit(run_counted, func, *args).result()
+        # 호출한 스레드의 현재 단계(scope)로 집계
+        for name, value in counters.items():
+            run_metrics.add(name, value)
+        with self._lock:
+            self.tasks += 1
+            self.busy_time += time.perf_counter() - started
+        return result
+
+    def parse_section(self, parser_name: str, page: Tuple[bytes, Optional[str]],
+                      max_articles: int) -> List[NewsItem]:
+        return self._run(parse_section, parser_name, page, max_articles)
+
+    def find_article_image(self, html_content: Union[str, bytes]) -> str:
+        return self._run(find_article_image, html_content)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self.executor = self.executor, None
+        if executor is not None:
+            executor.shutdown()
+
+    def log_stats(self):
+        """프로세스 풀에서 처리한 파싱 작업 수와 평균 처리 시간을 로그로 출력합니다."""
+        if not self.tasks:
+            return
+        logger.info(f"파싱 프로세스 풀: 작업자 {self.workers}개, 작업 {self.tasks}건 "
+                    f"(평균 {self.busy_time / self.tasks * 1000:.1f}ms, 전송 포함)")
@@ -0,0 +1,61 @@
+"""
+파싱 작업 프로세스에서 실행하는 함수
+parse_pool의 작업 프로세스는 이 모듈만 불러옵니다 (parser/html_tree 외에 crawler의 세션, 캐시, 저장소, 스레드는 없음).
+크롤러 프로세스의 설정(파서 엔진, 수집 날짜/시간대)은 작업 프로세스를 띄울 때 init_worker로 넘깁니다.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import parser
+from config import PARSER_ENGINE
+from html_tree import decode_html, open_document
+from metrics import run_metrics
+from news_item import NewsItem
+
+# init_worker로 받은 크롤러 프로세스 설정 (작업 프로세스 없이 파싱할 때는 기본값)
+worker_settings = {'parser_engine': PARSER_ENGINE}
+
+
+def get_worker_settings() -> Dict[str, object]:
+    """작업 프로세스에 넘길 크롤러 프로세스 설정"""
+    return {'parser_engine': PARSER_ENGINE, 'crawl_slot': parser.crawl_slot_override}
+
+
+def init_worker(settings: Dict[str, object]):
+    """작업 프로세스 시작 때 한 번 실행 (ProcessPoolExecutor initializer)"""
+    worker_settings.update(settings)
+    crawl_slot = settings.get('crawl_slot')
+    if crawl_slot:
+        parser.set_crawl_slot(*crawl_slot)
+
+
+def parse_section(parser_name: str, page: Tuple[bytes, Optional[str]], max_articles: int) -> List[NewsItem]:
+    """
+    섹션 페이지를 등록된 파서로 파싱합니다.
+
+    Args:
+        page: (HTML 바이트, Content-Type에 선언된 인코딩) - 작업 프로세스에서 한 번만 디코딩
+    """
+    html_bytes, encoding = page
+    return parser.get_parser_info(parser_name).parse(decode_html(html_bytes, encoding), max_articles)
+
+
+def find_article_image(html_content: bytes) -> str:
+    """
+    기사 페이지에서 대표 이미지 URL을 찾습니다.
+    (Open Graph → Twitter 카드 → 본문 첫 이미지 순서, 파서 엔진은 PARSER_ENGINE)
+    """
+    doc = open_document(html_content, worker_settings['parser_engine'])
+    return doc.meta_image() or doc.body_image()
+
+
+def run_counted(func, *args) -> Tuple[object, Dict[str, int]]:
+    """
+    작업 프로세스에서 func를 실행하고, 실행 중 늘어난 실행 지표 카운터를 함께 반환합니다.
+    (작업 프로세스의 run_metrics는 크롤러 프로세스와 별개이므로 호출한 쪽에서 다시 집계)
+    """
+    before = dict(run_metrics.counters)
+    result = func(*args)
+    counters = {name: value - before.get(name, 0) for name, value in run_metrics.counters.items()
+                if value != before.get(name, 0)}
+    return result, counters
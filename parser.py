@@ -4,18 +4,50 @@ HTML 파싱 모듈
 """
 
 from bs4 import BeautifulSoup
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Callable, Union
 from datetime import datetime, timezone, timedelta
+from urllib.parse import urlparse
+import inspect
 import re
 
+from config import PARSER_SPECS, PARSER_ENGINE, SECTION_REGION_PARSE
+from html_tree import (
+    ENGINES, IMAGE_PARENT_TAGS, ArticleTextExtractor, open_document, as_tags, enclosing_tags, element_end, image_from
+)
+from metrics import run_metrics
+from news_item import NewsItem
+
 # 한국 시간대 (KST = UTC+9)
 KST = timezone(timedelta(hours=9))
 
+# 재생 모드에서 보관소를 기록한 실행의 (날짜, 시간대)로 고정 (None이면 현재 시각 기준)
+crawl_slot_override: Optional[tuple] = None
+
+
 def get_kst_now():
     """한국 시간(KST)으로 현재 시간을 반환합니다."""
     return datetime.now(KST)
 
 
+def set_crawl_slot(date: Optional[str], slot: Optional[str] = None):
+    """
+    get_crawl_date_str / get_crawl_time_str가 반환할 날짜와 시간대를 고정합니다.
+    date가 None이면 고정을 해제합니다.
+    """
+    global crawl_slot_override
+    crawl_slot_override = (date, slot) if date else None
+
+
+def get_crawl_date_str() -> str:
+    """
+    크롤링 실행 날짜 (YYYY-MM-DD, KST).
+    재생 모드에서는 보관소를 기록한 날짜입니다.
+    """
+    if crawl_slot_override:
+        return crawl_slot_override[0]
+    return get_kst_now().strftime('%Y-%m-%d')
+
+
 def get_crawl_time_str():
     """
     예정된 크롤링 시간대를 반환합니다.
@@ -29,6 +61,8 @@ def get_crawl_time_str():
     Returns:
         시간 문자열 (예: "09-00", "15-00", "19-00")
     """
+    if crawl_slot_override and crawl_slot_override[1]:
+        return crawl_slot_override[1]
     now = get_kst_now()
     hour = now.hour
 
@@ -58,20 +92,14 @@ def extract_image_url(link_element, base_url: str = "") -> str:
     Returns:
         이미지 URL 문자열
     """
-    image_url = ""
-    
     # 1. 링크 내부의 img 태그 찾기
-    img_tag = link_element.find('img')
-    if img_tag:
-        image_url = img_tag.get('src', '') or img_tag.get('data-src', '') or img_tag.get('data-lazy-src', '')
+    image_url = image_from(link_element.find('img'))
     
     # 2. 링크 부모 요소에서 이미지 찾기
     if not image_url:
-        parent_elem = link_element.find_parent(['li', 'div', 'article'])
+        parent_elem = link_element.find_parent(list(IMAGE_PARENT_TAGS))
         if parent_elem:
-            img_tag = parent_elem.find('img')
-            if img_tag:
-                image_url = img_tag.get('src', '') or img_tag.get('data-src', '') or img_tag.get('data-lazy-src', '')
+            image_url = image_from(parent_elem.find('img'))
     
     # 상대 URL을 절대 URL로 변환
     if image_url and base_url and image_url.startswith('/'):
@@ -80,7 +108,7 @@ def extract_image_url(link_element, base_url: str = "") -> str:
     return image_url
 
 
-def parse_anthropic_news(html_content: str) -> List[Dict[str, str]]:
+def parse_anthropic_news(html_content: str) -> List[NewsItem]:
     """
     Anthropic 뉴스 페이지 HTML을 파싱하여 뉴스 항목 리스트를 반환합니다.
     
@@ -88,7 +116,7 @@ def parse_anthropic_news(html_content: str) -> List[Dict[str, str]]:
         html_content: 뉴스 페이지의 HTML 문자열
         
     Returns:
-        뉴스 항목 딕셔너리 리스트 (날짜, 카테고리, 제목, URL 포함)
+        NewsItem 리스트 (날짜, 카테고리, 제목, URL 포함)
     """
     BASE_URL = "https://www.anthropic.com"
     soup = BeautifulSoup(html_content, 'lxml')
@@ -145,13 +173,8 @@ def parse_anthropic_news(html_content: str) -> List[Dict[str, str]]:
                     break
         
         # 뉴스 항목 추가
-        news_item = {
-            'title': title,
-            'url': full_url,
-            'date': date_str,
-            'category': category,
-            'scraped_at': get_kst_now().isoformat()
-        }
+        news_item = NewsItem(title=title, url=full_url, date=date_str, category=category,
+                             scraped_at=get_kst_now().isoformat())
         
         news_items.append(news_item)
         processed_urls.add(url)
@@ -166,329 +189,42 @@ def parse_anthropic_news(html_content: str) -> List[Dict[str, str]]:
     return news_items
 
 
-def parse_donga_politics(html_content: str, max_articles: int = 5) -> List[Dict[str, str]]:
-    """
-    동아일보 '많이 본 정치 뉴스' 섹션에서 상위 기사 리스트를 반환합니다.
-    
-    Args:
-        html_content: 뉴스 페이지의 HTML 문자열
-        max_articles: 최대 기사 수 (기본값: 5)
-        
-    Returns:
-        뉴스 항목 딕셔너리 리스트
-    """
-    soup = BeautifulSoup(html_content, 'lxml')
-    news_items = []
-    processed_urls = set()
-    
-    # 동아일보 '많이 본 정치 뉴스' 섹션 찾기 (<h2 class="sec_tit">)
-    trending_section = soup.find('h2', class_='sec_tit', string=re.compile(r'많이 본 정치 뉴스'))
-    
-    # fallback: h2 태그를 못 찾으면 일반 text 검색
-    if not trending_section:
-        trending_section = soup.find(string=re.compile(r'많이 본 정치 뉴스'))
-    
-    if trending_section:
-        # 많이 본 뉴스 섹션 컨테이너 찾기
-        section_parent = trending_section.find_parent(['div', 'section', 'article'])
-        if section_parent:
-            # 해당 섹션 내의 뉴스 링크 찾기
-            news_links = section_parent.find_all('a', href=re.compile(r'/news/Politics/article/all/\d+/\d+/\d+'))
-            
-            for link in news_links:
-                if len(news_items) >= max_articles:
-                    break
-                    
-                url = link.get('href', '')
-                
-                if not url or url in processed_urls:
-                    continue
-                
-                # 상대 URL을 절대 URL로 변환
-                if url.startswith('/'):
-                    full_url = f"https://www.donga.com{url}"
-                else:
-                    full_url = url
-                
-                # 제목 추출
-                title = link.get_text(strip=True)
-                
-                # 제목이 너무 짧으면 다음 링크로
-                if not title or len(title) < 10:
-                    continue
-                
-                # 이미지 URL 추출
-                image_url = extract_image_url(link, "https://www.donga.com")
-                
-                # URL에서 날짜 추출
-                date_str = ""
-                date_match = re.search(r'/(\d{8})/', url)
-                if date_match:
-                    date_num = date_match.group(1)
-                    date_str = f"{date_num[:4]}-{date_num[4:6]}-{date_num[6:8]}"
-                
-                if not date_str:
-                    date_str = get_kst_now().strftime('%Y-%m-%d')
-                
-                news_item = {
-                    'title': clean_text(title),
-                    'url': full_url,
-                    'date': date_str,
-                    'category': '정치',
-                    'source': '동아일보',
-                    'image_url': image_url,
-                    'scraped_at': get_kst_now().isoformat()
-                }
-                
-                news_items.append(news_item)
-                processed_urls.add(url)
-    
-    return news_items[:max_articles]
-
-
-def parse_chosun_politics(html_content: str, max_articles: int = 5) -> List[Dict[str, str]]:
-    """
-    조선일보 '정치 많이 본 뉴스' 섹션에서 상위 기사 리스트를 반환합니다.
-    
-    Args:
-        html_content: 뉴스 페이지의 HTML 문자열
-        max_articles: 최대 기사 수 (기본값: 5)
-        
-    Returns:
-        뉴스 항목 딕셔너리 리스트
-    """
-    soup = BeautifulSoup(html_content, 'lxml')
-    news_items = []
-    processed_urls = set()
-    
-    # 조선일보 '정치 많이 본 뉴스' 섹션 찾기
-    trending_section = soup.find('div', class_='flex-chain__heading-title', string=re.compile(r'정치\s*많이\s*본\s*뉴스'))
-    
-    news_links = []
-    if trending_section:
-        # 2단계 상위 요소까지 탐색
-        section_container = trending_section.find_parent()
-        if section_container:
-            section_container = section_container.find_parent()
-        
-        if section_container:
-            news_links = section_container.find_all('a', href=re.compile(r'/politics/[^/]+/\d{4}/\d{2}/\d{2}/[A-Z0-9]+/?'))
-    
-    # fallback: 섹션을 못 찾으면 전체 페이지에서 검색
-    if not news_links:
-        news_links = soup.find_all('a', href=re.compile(r'/politics/[^/]+/\d{4}/\d{2}/\d{2}/[A-Z0-9]+/?'))
-    
-    for link in news_links:
-        if len(news_items) >= max_articles:
-            break
-            
-        url = link.get('href', '')
-        
-        if not url or url in processed_urls:
-            continue
-        
-        # 상대 URL을 절대 URL로 변환
-        if url.startswith('/'):
-            full_url = f"https://www.chosun.com{url}"
-        else:
-            full_url = url
-        
-        # 제목 추출
-        title = link.get_text(strip=True)
-        
-        # 제목이 너무 짧으면 다음 링크로
-        if not title or len(title) < 10:
-            continue
-        
-        # 이미지 URL 추출
-        image_url = extract_image_url(link, "https://www.chosun.com")
-        
-        # URL에서 날짜 추출 (패턴: /2025/12/01/...)
-        date_str = ""
-        date_match = re.search(r'/(\d{4})/(\d{2})/(\d{2})/', url)
-        if date_match:
-            year, month, day = date_match.groups()
-            date_str = f"{year}-{month}-{day}"
-        
-        if not date_str:
-            date_str = get_kst_now().strftime('%Y-%m-%d')
-        
-        # 뉴스 항목 추가
-        news_item = {
-            'title': clean_text(title),
-            'url': full_url,
-            'date': date_str,
-            'category': '정치',
-            'source': '조선일보',
-            'image_url': image_url,
-            'scraped_at': get_kst_now().isoformat()
-        }
-        
-        news_items.append(news_item)
-        processed_urls.add(url)
-    
-    return news_items[:max_articles]
-
-
-def parse_joongang_politics(html_content: str, max_articles: int = 5) -> List[Dict[str, str]]:
-    """
-    중앙일보 정치 섹션에서 상위 기사 리스트를 반환합니다.
-    
-    Args:
-        html_content: 뉴스 페이지의 HTML 문자열
-        max_articles: 최대 기사 수 (기본값: 5)
-        
-    Returns:
-        뉴스 항목 딕셔너리 리스트
-    """
-    soup = BeautifulSoup(html_content, 'lxml')
-    news_items = []
-    processed_urls = set()
-    
-    # 중앙일보 "정치 많이 본 기사" 섹션 찾기
-    # <strong class="title"> 태그 안에서 섹션 제목 찾기
-    section_title = soup.find('strong', class_='title', string=re.compile(r'정치\s*많이\s*본\s*기사'))
-    
-    if section_title:
-        # 섹션 컨테이너 찾기 (3단계 상위 요소 = section 태그)
-        section_container = section_title.find_parent()  # div
-        if section_container:
-            section_container = section_container.find_parent()  # header
-        if section_container:
-            section_container = section_container.find_parent()  # section
-        
-        if section_container:
-            # 섹션 내의 순위가 있는 링크 찾기 (1, 2, 3, 4, 5 순위)
-            for rank in range(1, max_articles + 1):
-                # 순위 번호 찾기
-                rank_elem = section_container.find(text=str(rank))
-                if rank_elem:
-                    # 순위 근처의 링크 찾기
-                    parent = rank_elem.find_parent(['li', 'div', 'article'])
-                    if parent:
-                        link = parent.find('a', href=re.compile(r'/article/\d+'))
-                        if link:
-                            url = link.get('href', '')
-                            if url and url not in processed_urls:
-                                # 상대 URL을 절대 URL로 변환
-                                if url.startswith('/'):
-                                    full_url = f"https://www.joongang.co.kr{url}"
-                                else:
-                                    full_url = url
-                                
-                                # 제목 추출
-                                title = link.get_text(strip=True)
-                                
-                                if title and len(title) >= 10 and not title.isdigit():
-                                    # 이미지 URL 추출
-                                    image_url = extract_image_url(link, "https://www.joongang.co.kr")
-                                    
-                                    news_item = {
-                                        'title': clean_text(title),
-                                        'url': full_url,
-                                        'date': get_kst_now().strftime('%Y-%m-%d'),
-                                        'category': '정치',
-                                        'source': '중앙일보',
-                                        'image_url': image_url,
-                                        'scraped_at': get_kst_now().isoformat()
-                                    }
-                                    news_items.append(news_item)
-                                    processed_urls.add(url)
-    
-    # 5개가 안 되면 일반 정치 기사로 보충
-    if len(news_items) < max_articles:
-        all_links = soup.find_all('a', href=re.compile(r'/article/\d+'))
-        for link in all_links:
-            if len(news_items) >= max_articles:
-                break
-                
-            url = link.get('href', '')
-            if not url or url in processed_urls:
-                continue
-            
-            # 링크가 정치 컨텍스트에 있는지 확인
-            parent = link.find_parent(['article', 'div', 'section', 'li'])
-            is_politics = False
-            
-            if parent:
-                parent_text = str(parent)
-                if 'politics' in parent_text.lower():
-                    is_politics = True
-            
-            if not is_politics:
-                nearby_text = link.find_parent(['div', 'li'])
-                if nearby_text:
-                    text_content = nearby_text.get_text()
-                    if '정치' in text_content and not any(word in text_content for word in ['경제', '스포츠', '문화', '연예', '사회', '국제']):
-                        is_politics = True
-            
-            if not is_politics:
-                continue
-            
-            # 상대 URL을 절대 URL로 변환
-            if url.startswith('/'):
-                full_url = f"https://www.joongang.co.kr{url}"
-            else:
-                full_url = url
-            
-            # 제목 추출
-            title = link.get_text(strip=True)
-            
-            if not title or len(title) < 10 or title.isdigit():
-                continue
-            
-            # 이미지 URL 추출
-            image_url = extract_image_url(link, "https://www.joongang.co.kr")
-            
-            news_item = {
-                'title': clean_text(title),
-                'url': full_url,
-                'date': get_kst_now().strftime('%Y-%m-%d'),
-                'category': '정치',
-                'source': '중앙일보',
-                'image_url': image_url,
-                'scraped_at': get_kst_now().isoformat()
-            }
-            
-            news_items.append(news_item)
-            processed_urls.add(url)
-    
-    return news_items[:max_articles]
-
 
 # 하위 호환성을 위한 별칭
-def parse_news_page(html_content: str) -> List[Dict[str, str]]:
+def parse_news_page(html_content: str) -> List[NewsItem]:
     """
     parse_anthropic_news의 별칭 (하위 호환성)
     """
     return parse_anthropic_news(html_content)
 
 
-def parse_article_content(html_content: str) -> Optional[Dict[str, str]]:
+def parse_article_content(html_content: Union[str, bytes], max_length: Optional[int] = None,
+                          chunk_size: int = 16 * 1024) -> Optional[Dict[str, str]]:
     """
-    개별 기사 페이지에서 상세 내용을 추출합니다. (선택사항)
-    
+    개별 기사 페이지에서 상세 내용을 추출합니다.
+
+    html_tree.ArticleTextExtractor에 chunk_size씩 나눠 넘기므로 페이지 트리를 통째로 만들지 않습니다.
+    (기사 본문 수집 모드는 응답을 받는 대로 같은 추출기에 넘김)
+
     Args:
-        html_content: 기사 페이지의 HTML 문자열
-        
+        html_content: 기사 페이지의 HTML 문자열 또는 바이트
+        max_length: 지정하면 본문을 이 길이까지만 반환 (full_content_length는 전체 길이)
+        chunk_size: 추출기에 한 번에 넘길 크기
+
     Returns:
-        기사 내용 딕셔너리 (제목, 본문 등)
+        기사 내용 딕셔너리 (제목, 본문, 전체 본문 길이)
     """
-    soup = BeautifulSoup(html_content, 'lxml')
-    
-    # 기사 제목
-    title_tag = soup.find('h1')
-    title = title_tag.get_text(strip=True) if title_tag else ""
-    
-    # 기사 본문 (일반적인 패턴)
-    content_sections = soup.find_all(['p', 'article'])
-    content = "\n\n".join([section.get_text(strip=True) for section in content_sections if section.get_text(strip=True)])
-    
-    return {
-        'title': title,
-        'content': content[:1000],  # 처음 1000자만 저장
-        'full_content_length': len(content)
-    }
+    if isinstance(html_content, str):
+        html_content = html_content.encode('utf-8')
+        extractor = ArticleTextExtractor('utf-8')
+    else:
+        extractor = ArticleTextExtractor()
+    for start in range(0, len(html_content), chunk_size):
+        extractor.feed(html_content[start:start + chunk_size])
+    article = extractor.close()
+    if max_length is not None:
+        article['content'] = article['content'][:max_length]
+    return article
 
 
 def clean_text(text: str) -> str:
@@ -508,1367 +244,618 @@ def clean_text(text: str) -> str:
     return text
 
 
-def parse_joongang_sports(html_content: str, max_articles: int = 5) -> List[Dict[str, str]]:
-    """
-    중앙일보 '스포츠 많이 본 기사' 섹션에서 상위 기사 리스트를 반환합니다.
-    
-    Args:
-        html_content: 뉴스 페이지의 HTML 문자열
-        max_articles: 최대 기사 수 (기본값: 5)
-        
-    Returns:
-        뉴스 항목 딕셔너리 리스트
-    """
-    soup = BeautifulSoup(html_content, 'lxml')
-    news_items = []
-    processed_urls = set()
-    
-    # 중앙일보 "스포츠 많이 본 기사" 섹션 찾기
-    section_title = soup.find('strong', class_='title', string=re.compile(r'스포츠\s*많이\s*본\s*기사'))
-    
-    if section_title:
-        # 3단계 상위 요소까지 탐색 (section 태그)
-        section_container = section_title.find_parent()  # div
-        if section_container:
-            section_container = section_container.find_parent()  # header
-        if section_container:
-            section_container = section_container.find_parent()  # section
-        
-        if section_container:
-            # 순위 번호로 기사 찾기 (1, 2, 3, 4, 5)
-            for rank in range(1, max_articles + 1):
-                rank_elem = section_container.find(string=str(rank))
-                if rank_elem:
-                    parent = rank_elem.find_parent(['li', 'div', 'article'])
-                    if parent:
-                        link = parent.find('a', href=re.compile(r'/article/\d+'))
-                        if link:
-                            url = link.get('href', '')
-                            if url and url not in processed_urls:
-                                if url.startswith('/'):
-                                    full_url = f"https://www.joongang.co.kr{url}"
-                                else:
-                                    full_url = url
-                                
-                                title = link.get_text(strip=True)
-                                
-                                if title and len(title) >= 10 and not title.isdigit():
-                                    news_item = {
-                                        'title': clean_text(title),
-                                        'url': full_url,
-                                        'date': get_kst_now().strftime('%Y-%m-%d'),
-                                        'category': '스포츠',
-                                        'source': '중앙일보',
-                                        'scraped_at': get_kst_now().isoformat()
-                                    }
-                                    news_items.append(news_item)
-                                    processed_urls.add(url)
-    
-    # fallback: 섹션을 못 찾으면 스포츠 관련 링크 검색
-    if len(news_items) < max_articles:
-        all_links = soup.find_all('a', href=re.compile(r'/article/\d+'))
-        for link in all_links:
+
+# ===========================================
+# 선택자 규칙(config.PARSER_SPECS) 기반 섹션 파서 엔진
+# ===========================================
+
+# URL에서 날짜를 추출하는 규칙: (정규식, 매치 → 'YYYY-MM-DD')
+DATE_RULES = {
+    'url_yyyymmdd': (re.compile(r'/(\d{8})/'),
+                     lambda m: f"{m.group(1)[:4]}-{m.group(1)[4:6]}-{m.group(1)[6:8]}"),
+    'url_ymd_path': (re.compile(r'/(\d{4})/(\d{2})/(\d{2})/'),
+                     lambda m: '-'.join(m.groups())),
+    'today': None,
+}
+
+
+# 페이지 전체 링크의 카테고리를 판단할 주변 요소 (context_markup: HTML, context_text: 텍스트)
+CONTEXT_MARKUP_PARENTS = ['article', 'div', 'section', 'li']
+CONTEXT_TEXT_PARENTS = ['div', 'li']
+# 섹션 조각을 찾을 때 제목 위치에서 거슬러 올라갈 최대 요소 단계
+REGION_MAX_LEVELS = 12
+# 제목 문자열이 제목 요소 안에 중첩될 수 있는 깊이 (예: <h2><span><b>제목)
+REGION_HEADING_DEPTH = 3
+
+
+def cached_check(cache: dict, element, check, doc) -> bool:
+    """요소별 판단 결과를 cache에 저장해 재사용합니다 (요소를 함께 보관해 id가 재사용되지 않게 함)."""
+    entry = cache.get(id(element))
+    if entry is None:
+        entry = cache[id(element)] = (element, check(doc, element))
+    return entry[1]
+
+
+def class_marker(class_name: Optional[str]):
+    """시작 태그 문자열에서 class 속성 값에 class_name이 있는지 찾는 정규식"""
+    if not class_name:
+        return None
+    return re.compile(r'class\s*=\s*["\']?[^"\'>]*(?<![\w-])' + re.escape(class_name) + r'(?![\w-])')
+
+
+class SelectorSpec:
+    """
+    컴파일된 섹션 파싱 규칙.
+
+    '많이 본 뉴스' 제목 → 섹션 컨테이너 → 기사 링크 순서로 찾고,
+    부족하면 page_fallback 방식으로 페이지 전체 링크를 사용합니다.
+    규칙 항목의 의미는 config.PARSER_SPECS 주석을 참고하세요.
+    """
+
+    def __init__(self, name: str, spec: Dict):
+        self.name = name
+        self.category = spec['category']
+        self.source = spec['source']
+        self.base_url = spec['base_url']
+
+        self.engine = spec.get('engine', PARSER_ENGINE)
+        if self.engine not in ENGINES:
+            raise ValueError(f"[{name}] 알 수 없는 파서 엔진: {self.engine}")
+
+        self.heading_tag = spec['heading_tag']
+        self.heading_class = spec.get('heading_class')
+        self.heading_class_marker = class_marker(self.heading_class)
+        self.heading_start_tag = re.compile(
+            r'<' + re.escape(self.heading_tag) + r'\b(?:"[^"]*"|\'[^\']*\'|[^\'">])*>', re.I)
+        self.heading_text = re.compile(spec['heading_text']) if spec.get('heading_text') else None
+        self.heading_text_contains = spec.get('heading_text_contains')
+        self.heading_text_fallback = spec.get('heading_text_fallback', False)
+
+        self.container_parent = spec.get('container_parent')
+        self.container_class = spec.get('container_class')
+        self.container_tags = as_tags(self.container_parent)
+        self.container_class_marker = class_marker(self.container_class)
+        self.container_hops = spec.get('container_hops', 0)
+
+        self.link_pattern = re.compile(spec['link_pattern'])
+        self.link_match_start = spec.get('link_match') == 'start'
+        self.rank_parent = spec.get('rank_parent')
+
+        self.title_tags = spec.get('title_tags')
+        self.min_title_length = spec.get('min_title_length', 10)
+        self.reject_numeric_title = spec.get('reject_numeric_title', False)
+
+        self.page_fallback = spec.get('page_fallback')
+        self.context_markup = spec.get('context_markup')
+        self.context_text = spec.get('context_text')
+        self.context_exclude = spec.get('context_exclude', [])
+
+        if spec['date'] not in DATE_RULES:
+            raise ValueError(f"[{name}] 알 수 없는 날짜 규칙: {spec['date']}")
+        self.date_rule = DATE_RULES[spec['date']]
+        self.image = spec.get('image', True)
+        self.article_images = spec.get('article_images', True)
+        self.extra_fields = spec.get('extra_fields', {})
+
+    def find_heading(self, doc, string_fallback: bool = True):
+        """'많이 본 뉴스' 제목 요소(또는 문자열)를 찾습니다."""
+        if self.heading_text_contains:
+            for heading in doc.find_all(self.heading_tag, self.heading_class):
+                heading_text = doc.text(heading)
+                if all(word in heading_text for word in self.heading_text_contains):
+                    return heading
+            return None
+
+        heading = doc.find_by_string(self.heading_tag, self.heading_class, self.heading_text)
+        if heading is None and self.heading_text_fallback and string_fallback:
+            heading = doc.find_string(self.heading_text)
+        return heading
+
+    def find_container(self, doc, heading):
+        """제목에서 위로 올라가 섹션 컨테이너를 찾습니다."""
+        if self.container_hops:
+            container = heading
+            for _ in range(self.container_hops):
+                container = doc.find_parent(container)
+                if container is None:
+                    return None
+            return container
+        return doc.find_parent(heading, self.container_parent, self.container_class)
+
+    def find_section_links(self, doc, container, max_articles: int) -> List:
+        """섹션 컨테이너 안의 기사 링크를 순서대로 반환합니다."""
+        if self.rank_parent:
+            links = []
+            ranks = [str(rank) for rank in range(1, max_articles + 1)]
+            rank_elems = doc.find_strings(ranks, container)
+            for rank in ranks:
+                rank_elem = rank_elems.get(rank)
+                if rank_elem is not None:
+                    parent = doc.find_parent(rank_elem, self.rank_parent)
+                    if parent is not None:
+                        link = self.first_link(doc, parent)
+                        if link is not None:
+                            links.append(link)
+            return links
+
+        if self.link_match_start:
+            return [link for link in doc.links(container) if self.link_pattern.match(link.get('href', ''))]
+        return self.page_links(doc, container)
+
+    def page_links(self, doc, scope=None) -> List:
+        """href가 link_pattern과 일치하는 링크 (scope가 없으면 페이지 전체)"""
+        return [link for link in doc.links(scope) if self.link_pattern.search(link.get('href', ''))]
+
+    def first_link(self, doc, scope):
+        for link in doc.links(scope):
+            if self.link_pattern.search(link.get('href', '')):
+                return link
+        return None
+
+    def context_links(self, doc, links):
+        """
+        페이지 전체 링크 중 이 카테고리 기사로 보이는 링크를 순서대로 반환합니다 (규칙이 없으면 전부).
+
+        주변 요소(article/div/section/li의 HTML, div/li의 텍스트)로 판단하며, 여러 링크가 같은
+        요소를 공유하므로 요소별 판단 결과를 저장해 요소마다 한 번만 직렬화합니다.
+        """
+        if not self.context_markup and not self.context_text:
+            yield from links
+            return
+
+        markup_matches = {}
+        text_matches = {}
+        for link in links:
+            if self.context_markup:
+                parent = doc.find_parent(link, CONTEXT_MARKUP_PARENTS)
+                if parent is not None and cached_check(markup_matches, parent, self.markup_in_context, doc):
+                    yield link
+                    continue
+
+            if self.context_text:
+                nearby = doc.find_parent(link, CONTEXT_TEXT_PARENTS)
+                if nearby is not None and cached_check(text_matches, nearby, self.text_in_context, doc):
+                    yield link
+
+    def markup_in_context(self, doc, element) -> bool:
+        parent_markup = doc.markup(element).lower()
+        return any(word in parent_markup for word in self.context_markup)
+
+    def text_in_context(self, doc, element) -> bool:
+        text_content = doc.text(element, strip=False)
+        return self.context_text in text_content and not any(word in text_content for word in self.context_exclude)
+
+    def extract_date(self, url: str) -> str:
+        if self.date_rule:
+            pattern, formatter = self.date_rule
+            date_match = pattern.search(url)
+            if date_match:
+                return formatter(date_match)
+        return get_kst_now().strftime('%Y-%m-%d')
+
+    def extract_title(self, doc, link) -> str:
+        if self.title_tags:
+            title_elem = doc.find_first(link, self.title_tags)
+            if title_elem is not None:
+                return doc.text(title_elem)
+        return doc.text(link)
+
+    def collect_items(self, doc, links, news_items: List[NewsItem], processed_urls: set,
+                      max_articles: int, scope=None):
+        """
+        링크들로 뉴스 항목을 만들어 news_items에 추가합니다 (max_articles까지).
+
+        이미지는 scope(섹션 컨테이너, None이면 페이지 전체)를 한 번 훑어 만든
+        링크 → 이미지 맵(doc.image_map)에서 찾습니다.
+        """
+        images = doc.image_map(scope) if self.image else None
+        for link in links:
             if len(news_items) >= max_articles:
                 break
-                
+
             url = link.get('href', '')
             if not url or url in processed_urls:
                 continue
-            
-            # 스포츠 컨텍스트 확인
-            parent = link.find_parent(['article', 'div', 'section', 'li'])
-            is_sports = False
-            
-            if parent:
-                parent_text = str(parent)
-                if 'sports' in parent_text.lower() or 'sport' in parent_text.lower():
-                    is_sports = True
-            
-            if not is_sports:
-                nearby_text = link.find_parent(['div', 'li'])
-                if nearby_text:
-                    text_content = nearby_text.get_text()
-                    if '스포츠' in text_content:
-                        is_sports = True
-            
-            if not is_sports:
-                continue
-            
-            if url.startswith('/'):
-                full_url = f"https://www.joongang.co.kr{url}"
-            else:
-                full_url = url
-            
-            title = link.get_text(strip=True)
-            
-            if not title or len(title) < 10 or title.isdigit():
+
+            # 상대 URL을 절대 URL로 변환
+            full_url = f"{self.base_url}{url}" if url.startswith('/') else url
+
+            title = self.extract_title(doc, link)
+            if not title or len(title) < self.min_title_length or (
+                    self.reject_numeric_title and title.isdigit()):
                 continue
-            
-            news_item = {
-                'title': clean_text(title),
-                'url': full_url,
-                'date': get_kst_now().strftime('%Y-%m-%d'),
-                'category': '스포츠',
-                'source': '중앙일보',
-                'scraped_at': get_kst_now().isoformat()
-            }
+
+            news_item = NewsItem(title=clean_text(title), url=full_url, date=self.extract_date(url),
+                                 category=self.category, source=self.source)
+            if self.image:
+                image_url = images.get(link)
+                if image_url.startswith('/'):
+                    image_url = f"{self.base_url}{image_url}"
+                news_item['image_url'] = image_url
+            news_item['scraped_at'] = get_kst_now().isoformat()
+            news_item.update(self.extra_fields)
+
             news_items.append(news_item)
             processed_urls.add(url)
-    
-    return news_items[:max_articles]
+
+    def find_anchor(self, html_content: str) -> Optional[int]:
+        """
+        HTML 문자열에서 '많이 본 뉴스' 제목이 있을 위치를 찾습니다 (파싱 없이).
+
+        heading_text 규칙은 제목 문자열이, heading_text_contains 규칙은 제목 클래스가
+        처음 나오는 위치(시작 태그 바로 뒤)입니다.
+        """
+        if self.heading_text:
+            match = self.heading_text.search(html_content)
+            return match.start() if match else None
+        if self.heading_class_marker:
+            match = self.heading_class_marker.search(html_content)
+            if match:
+                tag_end = html_content.find('>', match.end())
+                return tag_end + 1 if tag_end != -1 else None
+        return None
+
+    def has_encoded_heading_before(self, html_content: str, position: int) -> bool:
+        """
+        position 앞의 제목 후보 요소에 문자 참조(&nbsp; 등)가 있는지 확인합니다.
+
+        문자 참조는 파싱 후에야 heading_text와 일치할 수 있으므로, 이런 후보가 앞에 있으면
+        원문에서 처음 찾은 제목이 실제 첫 제목인지 알 수 없습니다.
+        """
+        if not self.heading_text:
+            return False
+        for match in self.heading_start_tag.finditer(html_content, 0, position):
+            if self.heading_class_marker and not self.heading_class_marker.search(match.group(0)):
+                continue
+            text_end = html_content.find('</', match.end(), position)
+            if '&' in html_content[match.end():text_end if text_end != -1 else position]:
+                return True
+        return False
+
+    def find_region(self, html_content: str) -> Optional[str]:
+        """
+        '많이 본 뉴스' 섹션 컨테이너 요소의 HTML만 잘라 반환합니다 (찾지 못하면 None).
+
+        제목 위치에서 거꾸로 태그를 훑어 제목 → 컨테이너 순서로 감싸는 요소를 찾고,
+        컨테이너 시작 태그부터 짝이 맞는 닫는 태그까지를 조각으로 사용합니다.
+        """
+        anchor = self.find_anchor(html_content)
+        if anchor is None or self.has_encoded_heading_before(html_content, anchor):
+            return None
+
+        ancestors = []
+        for ancestor in enclosing_tags(html_content, anchor):
+            ancestors.append(ancestor)
+            container_level = self.region_container_level(ancestors)
+            if container_level is not None:
+                break
+            if len(ancestors) >= REGION_MAX_LEVELS:
+                return None
+        else:
+            return None
+
+        start = ancestors[container_level][0]
+        end = element_end(html_content, start)
+        return html_content[start:end] if end else None
+
+    def region_container_level(self, ancestors: List[tuple]) -> Optional[int]:
+        """
+        제목 위치를 감싸는 시작 태그들(안쪽부터) 중 섹션 컨테이너의 단계를 반환합니다.
+        (아직 판단할 수 없으면 None)
+        """
+        names = [name for _, name, _ in ancestors]
+        if self.heading_tag in names[:REGION_HEADING_DEPTH]:
+            heading_level = names.index(self.heading_tag)
+        elif len(names) < REGION_HEADING_DEPTH:
+            return None
+        else:
+            # 제목 요소 밖의 문자열 (조각에서 제목을 찾지 못해 전체 파싱으로 전환됨)
+            heading_level = 0
+
+        if self.container_hops:
+            container_level = heading_level + self.container_hops
+            return container_level if container_level < len(ancestors) else None
+        for level in range(heading_level + 1, len(ancestors)):
+            if names[level] in self.container_tags and self.container_markup_matches(ancestors[level][2]):
+                return level
+        return None
+
+    def container_markup_matches(self, start_tag: str) -> bool:
+        return not self.container_class_marker or bool(self.container_class_marker.search(start_tag))
+
+    def parse_document(self, doc, max_articles: int, region: bool = False) -> Optional[List[NewsItem]]:
+        """
+        파싱된 문서에서 뉴스 항목을 추출합니다.
+
+        region이 True이면 doc은 섹션 컨테이너 조각이며, 결과가 전체 페이지 파싱과
+        달라질 수 있는 경우(조각 밖 요소 참조, 페이지 전체 링크 보충 필요) None을 반환합니다.
+        """
+        news_items = []
+        processed_urls = set()
+
+        links = []
+        container = None
+        # 조각에 제목 요소가 없으면 페이지 전체 문자열 검색(heading_text_fallback)이 필요
+        heading = self.find_heading(doc, string_fallback=not region)
+        if heading is not None:
+            container = self.find_container(doc, heading)
+            if container is not None:
+                links = self.find_section_links(doc, container, max_articles)
+
+        needs_page_links = ((self.page_fallback == 'if_empty' and not links)
+                            or (self.page_fallback == 'fill_links' and len(links) < max_articles))
+        if region and (container is None or doc.escaped or needs_page_links):
+            return None
+
+        all_in_container = True
+        if self.page_fallback == 'if_empty' and not links:
+            links = self.page_links(doc)
+            all_in_container = False
+        elif self.page_fallback == 'fill_links' and len(links) < max_articles:
+            all_in_container = False
+            existing_urls = set(link.get('href', '') for link in links)
+            for link in self.page_links(doc):
+                if len(links) >= max_articles:
+                    break
+                url = link.get('href', '')
+                if url and url not in existing_urls:
+                    links.append(link)
+                    existing_urls.add(url)
+
+        # 페이지 전체 링크로 대체/보충했으면 이미지도 페이지 전체에서 찾음
+        links_scope = container if links and all_in_container else None
+        self.collect_items(doc, links, news_items, processed_urls, max_articles, links_scope)
+
+        needs_page_items = self.page_fallback == 'fill_items' and len(news_items) < max_articles
+        if region and (doc.escaped or needs_page_items):
+            return None
+
+        if needs_page_items:
+            self.collect_items(doc, self.context_links(doc, self.page_links(doc)), news_items, processed_urls,
+                               max_articles)
+
+        return news_items[:max_articles]
+
+    def parse_region(self, html_content: str, max_articles: int, engine: str) -> Optional[List[NewsItem]]:
+        """섹션 컨테이너 조각만 파싱합니다 (조각으로 결과를 확정할 수 없으면 None)."""
+        fragment = self.find_region(html_content)
+        if fragment is None:
+            return None
+        doc = open_document(fragment, engine)
+        if not doc.limit_to_region():
+            return None
+        return self.parse_document(doc, max_articles, region=True)
+
+    def parse(self, html_content: str, max_articles: int = 5, engine: Optional[str] = None,
+              region: Optional[bool] = None) -> List[NewsItem]:
+        """
+        섹션 페이지 HTML에서 상위 기사 리스트를 반환합니다.
+
+        SECTION_REGION_PARSE가 켜져 있으면 '많이 본 뉴스' 섹션 조각만 먼저 파싱하고,
+        조각을 찾지 못하거나 조각만으로 결과를 확정할 수 없을 때 페이지 전체를 파싱합니다.
+        (실행 지표 region_parses / region_fallbacks로 집계)
+
+        Args:
+            html_content: 뉴스 페이지의 HTML 문자열
+            max_articles: 최대 기사 수
+            engine: 'lxml' / 'bs4' (생략 시 규칙의 engine 값)
+            region: 섹션 조각 파싱 여부 (생략 시 SECTION_REGION_PARSE)
+
+        Returns:
+            NewsItem 리스트
+        """
+        engine = engine or self.engine
+        if SECTION_REGION_PARSE if region is None else region:
+            news_items = self.parse_region(html_content, max_articles, engine) if isinstance(html_content, str) else None
+            if news_items is not None:
+                run_metrics.add('region_parses')
+                return news_items
+            run_metrics.add('region_fallbacks')
+
+        return self.parse_document(open_document(html_content, engine), max_articles)
+
+
+# import 시 모든 규칙을 한 번 컴파일
+SELECTOR_SPECS = {name: SelectorSpec(name, spec) for name, spec in PARSER_SPECS.items()}
 
 
-def parse_donga_sports(html_content: str, max_articles: int = 5) -> List[Dict[str, str]]:
+def parse_with_spec(parser_name: str, html_content: str, max_articles: int = 5,
+                    engine: Optional[str] = None, region: Optional[bool] = None) -> List[NewsItem]:
     """
-    동아일보 '많이 본 스포츠 뉴스' 섹션에서 상위 기사 리스트를 반환합니다.
-    
+    PARSER_SPECS의 규칙으로 섹션 페이지를 파싱합니다.
+
     Args:
+        parser_name: NEWS_SOURCES의 'parser' 값 (예: 'donga_politics')
         html_content: 뉴스 페이지의 HTML 문자열
-        max_articles: 최대 기사 수 (기본값: 5)
-        
+        max_articles: 최대 기사 수
+        engine: 'lxml' / 'bs4' (생략 시 규칙의 engine 값)
+        region: 섹션 조각 파싱 여부 (생략 시 SECTION_REGION_PARSE)
+
     Returns:
-        뉴스 항목 딕셔너리 리스트
+        NewsItem 리스트
     """
-    soup = BeautifulSoup(html_content, 'lxml')
-    news_items = []
-    processed_urls = set()
-    
-    # 동아일보 '많이 본 스포츠 뉴스' 섹션 찾기
-    trending_section = soup.find('h2', class_='sec_tit', string=re.compile(r'많이 본 스포츠 뉴스'))
-    
-    # fallback
-    if not trending_section:
-        trending_section = soup.find(string=re.compile(r'많이 본 스포츠 뉴스'))
-    
-    if trending_section:
-        section_parent = trending_section.find_parent(['div', 'section', 'article'])
-        if section_parent:
-            news_links = section_parent.find_all('a', href=re.compile(r'/news/Sports/article/all/\d+/\d+/\d+'))
-            
-            for link in news_links:
-                if len(news_items) >= max_articles:
-                    break
-                    
-                url = link.get('href', '')
-                
-                if not url or url in processed_urls:
-                    continue
-                
-                if url.startswith('/'):
-                    full_url = f"https://www.donga.com{url}"
-                else:
-                    full_url = url
-                
-                title = link.get_text(strip=True)
-                
-                if not title or len(title) < 10:
-                    continue
-                
-                # 이미지 URL 추출
-                image_url = extract_image_url(link, "https://www.donga.com")
-                
-                # URL에서 날짜 추출
-                date_str = ""
-                date_match = re.search(r'/(\d{8})/', url)
-                if date_match:
-                    date_num = date_match.group(1)
-                    date_str = f"{date_num[:4]}-{date_num[4:6]}-{date_num[6:8]}"
-                
-                if not date_str:
-                    date_str = get_kst_now().strftime('%Y-%m-%d')
-                
-                news_item = {
-                    'title': clean_text(title),
-                    'url': full_url,
-                    'date': date_str,
-                    'category': '스포츠',
-                    'source': '동아일보',
-                    'image_url': image_url,
-                    'scraped_at': get_kst_now().isoformat()
-                }
-                
-                news_items.append(news_item)
-                processed_urls.add(url)
-    
-    return news_items[:max_articles]
+    return SELECTOR_SPECS[parser_name].parse(html_content, max_articles, engine, region)
 
 
-def parse_chosun_sports(html_content: str, max_articles: int = 5) -> List[Dict[str, str]]:
+class ParserInfo:
     """
-    조선일보 '스포츠 많이 본 뉴스' 섹션에서 상위 기사 리스트를 반환합니다.
-    
-    Args:
-        html_content: 뉴스 페이지의 HTML 문자열
-        max_articles: 최대 기사 수 (기본값: 5)
-        
-    Returns:
-        뉴스 항목 딕셔너리 리스트
+    등록된 섹션 파서와 능력 정보 (크롤러 시작 시 한 번 조회).
+
+    Attributes:
+        name: NEWS_SOURCES의 'parser' 값
+        func: 파싱 함수 (html_content[, max_articles])
+        accepts_max_articles: max_articles 인자를 받는지 (함수 시그니처로 판단)
+        host: 파서가 처리하는 언론사 호스트 (예: www.donga.com, 모르면 None)
+        article_images: 목록에서 못 찾은 이미지를 기사 페이지에서 조회해야 하는지
     """
-    soup = BeautifulSoup(html_content, 'lxml')
-    news_items = []
-    processed_urls = set()
-    
-    # 조선일보 '스포츠 많이 본 뉴스' 섹션 찾기
-    trending_section = soup.find('div', class_='flex-chain__heading-title', string=re.compile(r'스포츠\s*많이\s*본\s*뉴스'))
-    
-    news_links = []
-    if trending_section:
-        # 2단계 상위 요소까지 탐색
-        section_container = trending_section.find_parent()
-        if section_container:
-            section_container = section_container.find_parent()
-        
-        if section_container:
-            news_links = section_container.find_all('a', href=re.compile(r'/sports/[^/]+/\d{4}/\d{2}/\d{2}/[A-Z0-9]+/?'))
-    
-    # fallback
-    if not news_links:
-        news_links = soup.find_all('a', href=re.compile(r'/sports/[^/]+/\d{4}/\d{2}/\d{2}/[A-Z0-9]+/?'))
-    
-    for link in news_links:
-        if len(news_items) >= max_articles:
-            break
-            
-        url = link.get('href', '')
-        
-        if not url or url in processed_urls:
-            continue
-        
-        if url.startswith('/'):
-            full_url = f"https://www.chosun.com{url}"
+
+    def __init__(self, name: str, func: Callable, host: Optional[str] = None, article_images: bool = True):
+        self.name = name
+        self.func = func
+        self.accepts_max_articles = 'max_articles' in inspect.signature(func).parameters
+        self.host = host
+        self.article_images = article_images
+
+    def parse(self, html_content: str, max_articles: int) -> List[NewsItem]:
+        """max_articles를 받는 파서에만 넘겨 파싱합니다 (딕셔너리를 반환하는 파서 결과는 NewsItem으로 바꿈)."""
+        if self.accepts_max_articles:
+            news_items = self.func(html_content, max_articles=max_articles)
         else:
-            full_url = url
-        
-        title = link.get_text(strip=True)
-        
-        if not title or len(title) < 10:
-            continue
-        
-        # URL에서 날짜 추출
-        date_str = ""
-        date_match = re.search(r'/(\d{4})/(\d{2})/(\d{2})/', url)
-        if date_match:
-            year, month, day = date_match.groups()
-            date_str = f"{year}-{month}-{day}"
-        
-        if not date_str:
-            date_str = get_kst_now().strftime('%Y-%m-%d')
-        
-        news_item = {
-            'title': clean_text(title),
-            'url': full_url,
-            'date': date_str,
-            'category': '스포츠',
-            'source': '조선일보',
-            'scraped_at': get_kst_now().isoformat()
-        }
-        
-        news_items.append(news_item)
-        processed_urls.add(url)
-    
-    return news_items[:max_articles]
+            news_items = self.func(html_content)
+        return [item if isinstance(item, NewsItem) else NewsItem.from_dict(item) for item in news_items]
+
+
+# 파서 이름 → ParserInfo (PARSER_SPECS 규칙 + @register_parser 함수)
+PARSERS: Dict[str, ParserInfo] = {}
 
 
-def parse_joongang_economy(html_content: str, max_articles: int = 5) -> List[Dict[str, str]]:
+def register_parser(name: Optional[str] = None, host: Optional[str] = None, article_images: bool = True):
     """
-    중앙일보 '경제 많이 본 기사' 섹션에서 상위 기사 리스트를 반환합니다.
-    
+    섹션 파서 함수를 등록하는 데코레이터.
+
+    규칙(PARSER_SPECS)으로 표현할 수 없는 페이지의 파서 함수에 붙입니다.
+
+        @register_parser(host='www.example.com')
+        def parse_example_politics(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+            ...
+
     Args:
-        html_content: 뉴스 페이지의 HTML 문자열
-        max_articles: 최대 기사 수 (기본값: 5)
-        
-    Returns:
-        뉴스 항목 딕셔너리 리스트
+        name: 파서 이름 (생략 시 함수 이름에서 'parse_'를 뺀 이름)
+        host: 언론사 호스트
+        article_images: 목록에서 못 찾은 이미지를 기사 페이지에서 조회할지 (False면 이미지 조회 생략)
+
+    Raises:
+        ValueError: 같은 이름의 파서가 이미 등록된 경우
     """
-    soup = BeautifulSoup(html_content, 'lxml')
-    news_items = []
-    processed_urls = set()
-    
-    # 중앙일보 "경제 많이 본 기사" 섹션 찾기
-    section_title = soup.find('strong', class_='title', string=re.compile(r'경제\s*많이\s*본\s*기사'))
-    
-    if section_title:
-        # 3단계 상위 요소까지 탐색 (section 태그)
-        section_container = section_title.find_parent()  # div
-        if section_container:
-            section_container = section_container.find_parent()  # header
-        if section_container:
-            section_container = section_container.find_parent()  # section
-        
-        if section_container:
-            # 순위 번호로 기사 찾기 (1, 2, 3, 4, 5)
-            for rank in range(1, max_articles + 1):
-                rank_elem = section_container.find(string=str(rank))
-                if rank_elem:
-                    parent = rank_elem.find_parent(['li', 'div', 'article'])
-                    if parent:
-                        link = parent.find('a', href=re.compile(r'/article/\d+'))
-                        if link:
-                            url = link.get('href', '')
-                            if url and url not in processed_urls:
-                                if url.startswith('/'):
-                                    full_url = f"https://www.joongang.co.kr{url}"
-                                else:
-                                    full_url = url
-                                
-                                title = link.get_text(strip=True)
-                                
-                                if title and len(title) >= 10 and not title.isdigit():
-                                    news_item = {
-                                        'title': clean_text(title),
-                                        'url': full_url,
-                                        'date': get_kst_now().strftime('%Y-%m-%d'),
-                                        'category': '경제',
-                                        'source': '중앙일보',
-                                        'scraped_at': get_kst_now().isoformat(),
-                                        'main_category': '경제'
-                                    }
-                                    news_items.append(news_item)
-                                    processed_urls.add(url)
-    
-    # fallback: 섹션을 못 찾으면 경제 관련 링크 검색
-    if len(news_items) < max_articles:
-        all_links = soup.find_all('a', href=re.compile(r'/article/\d+'))
-        for link in all_links:
-            if len(news_items) >= max_articles:
-                break
-                
-            url = link.get('href', '')
-            if not url or url in processed_urls:
-                continue
-            
-            # 경제 컨텍스트 확인
-            parent = link.find_parent(['article', 'div', 'section', 'li'])
-            is_economy = False
-            
-            if parent:
-                parent_text = str(parent)
-                if 'economy' in parent_text.lower():
-                    is_economy = True
-            
-            if not is_economy:
-                nearby_text = link.find_parent(['div', 'li'])
-                if nearby_text:
-                    text_content = nearby_text.get_text()
-                    if '경제' in text_content:
-                        is_economy = True
-            
-            if not is_economy:
-                continue
-            
-            if url.startswith('/'):
-                full_url = f"https://www.joongang.co.kr{url}"
-            else:
-                full_url = url
-            
-            title = link.get_text(strip=True)
-            
-            if not title or len(title) < 10 or title.isdigit():
-                continue
-            
-            news_item = {
-                'title': clean_text(title),
-                'url': full_url,
-                'date': get_kst_now().strftime('%Y-%m-%d'),
-                'category': '경제',
-                'source': '중앙일보',
-                'scraped_at': get_kst_now().isoformat(),
-                'main_category': '경제'
-            }
-            news_items.append(news_item)
-            processed_urls.add(url)
-    
-    return news_items[:max_articles]
+    def decorator(func: Callable) -> Callable:
+        parser_name = name or func.__name__[len('parse_'):]
+        if parser_name in PARSERS:
+            raise ValueError(f"파서 '{parser_name}'가 이미 등록되어 있습니다")
+        PARSERS[parser_name] = ParserInfo(parser_name, func, host, article_images)
+        return func
+    return decorator
 
 
-def parse_donga_economy(html_content: str, max_articles: int = 5) -> List[Dict[str, str]]:
-    """
-    동아일보 '많이 본 경제 뉴스' 섹션에서 상위 기사 리스트를 반환합니다.
-    
-    Args:
-        html_content: 뉴스 페이지의 HTML 문자열
-        max_articles: 최대 기사 수 (기본값: 5)
-        
-    Returns:
-        뉴스 항목 딕셔너리 리스트
-    """
-    soup = BeautifulSoup(html_content, 'lxml')
-    news_items = []
-    processed_urls = set()
-    
-    # 동아일보 '많이 본 경제 뉴스' 섹션 찾기
-    trending_section = soup.find('h2', class_='sec_tit', string=re.compile(r'많이 본 경제 뉴스'))
-    
-    # fallback
-    if not trending_section:
-        trending_section = soup.find(string=re.compile(r'많이 본 경제 뉴스'))
-    
-    if trending_section:
-        section_parent = trending_section.find_parent(['div', 'section', 'article'])
-        if section_parent:
-            news_links = section_parent.find_all('a', href=re.compile(r'/news/Economy/article/all/\d+/\d+/\d+'))
-            
-            for link in news_links:
-                if len(news_items) >= max_articles:
-                    break
-                    
-                url = link.get('href', '')
-                
-                if not url or url in processed_urls:
-                    continue
-                
-                if url.startswith('/'):
-                    full_url = f"https://www.donga.com{url}"
-                else:
-                    full_url = url
-                
-                title = link.get_text(strip=True)
-                
-                if not title or len(title) < 10:
-                    continue
-                
-                # URL에서 날짜 추출
-                date_str = ""
-                date_match = re.search(r'/(\d{8})/', url)
-                if date_match:
-                    date_num = date_match.group(1)
-                    date_str = f"{date_num[:4]}-{date_num[4:6]}-{date_num[6:8]}"
-                
-                if not date_str:
-                    date_str = get_kst_now().strftime('%Y-%m-%d')
-                
-                news_item = {
-                    'title': clean_text(title),
-                    'url': full_url,
-                    'date': date_str,
-                    'category': '경제',
-                    'source': '동아일보',
-                    'scraped_at': get_kst_now().isoformat(),
-                    'main_category': '경제'
-                }
-                
-                news_items.append(news_item)
-                processed_urls.add(url)
-    
-    return news_items[:max_articles]
+def register_spec_parsers():
+    """PARSER_SPECS 규칙을 파서로 등록합니다 (호스트는 규칙의 base_url)."""
+    for parser_name, selector_spec in SELECTOR_SPECS.items():
+        register_parser(parser_name, urlparse(selector_spec.base_url).netloc,
+                        selector_spec.article_images)(selector_spec.parse)
 
 
-def parse_chosun_economy(html_content: str, max_articles: int = 5) -> List[Dict[str, str]]:
+register_spec_parsers()
+
+# 규칙으로 표현하지 않은 파서 (register_parser보다 먼저 정의되어 데코레이터 대신 여기서 등록)
+register_parser(host='www.anthropic.com')(parse_anthropic_news)
+
+
+def get_parser_info(parser_name: str) -> ParserInfo:
     """
-    조선일보 '조선경제 많이 본 뉴스' 섹션에서 상위 기사 리스트를 반환합니다.
-    
-    Args:
-        html_content: 뉴스 페이지의 HTML 문자열
-        max_articles: 최대 기사 수 (기본값: 5)
-        
-    Returns:
-        뉴스 항목 딕셔너리 리스트
+    등록된 파서 정보를 반환합니다.
+
+    Raises:
+        AttributeError: 등록된 파서가 없는 경우
     """
-    soup = BeautifulSoup(html_content, 'lxml')
-    news_items = []
-    processed_urls = set()
-    
-    # 조선일보 '조선경제 많이 본 뉴스' 섹션 찾기
-    trending_section = soup.find('div', class_='flex-chain__heading-title', string=re.compile(r'조선경제\s*많이\s*본\s*뉴스'))
-    
-    news_links = []
-    if trending_section:
-        # 2단계 상위 요소까지 탐색
-        section_container = trending_section.find_parent()
-        if section_container:
-            section_container = section_container.find_parent()
-        
-        if section_container:
-            news_links = section_container.find_all('a', href=re.compile(r'/economy/[^/]+/\d{4}/\d{2}/\d{2}/[A-Z0-9]+/?'))
-    
-    # fallback
-    if not news_links:
-        news_links = soup.find_all('a', href=re.compile(r'/economy/[^/]+/\d{4}/\d{2}/\d{2}/[A-Z0-9]+/?'))
-    
-    for link in news_links:
-        if len(news_items) >= max_articles:
-            break
-            
-        url = link.get('href', '')
-        
-        if not url or url in processed_urls:
-            continue
-        
-        if url.startswith('/'):
-            full_url = f"https://www.chosun.com{url}"
-        else:
-            full_url = url
-        
-        title = link.get_text(strip=True)
-        
-        if not title or len(title) < 10:
-            continue
-        
-        # URL에서 날짜 추출
-        date_str = ""
-        date_match = re.search(r'/(\d{4})/(\d{2})/(\d{2})/', url)
-        if date_match:
-            year, month, day = date_match.groups()
-            date_str = f"{year}-{month}-{day}"
-        
-        if not date_str:
-            date_str = get_kst_now().strftime('%Y-%m-%d')
-        
-        news_item = {
-            'title': clean_text(title),
-            'url': full_url,
-            'date': date_str,
-            'category': '경제',
-            'source': '조선일보',
-            'scraped_at': get_kst_now().isoformat(),
-            'main_category': '경제'
-        }
-        
-        news_items.append(news_item)
-        processed_urls.add(url)
-    
-    return news_items[:max_articles]
+    parser_info = PARSERS.get(parser_name)
+    if parser_info is None:
+        raise AttributeError(f"파서 '{parser_name}'가 등록되어 있지 않습니다 (PARSER_SPECS 또는 @register_parser)")
+    return parser_info
+
+
+def get_parser(parser_name: str):
+    """파서 이름에 해당하는 파싱 함수를 반환합니다 (get_parser_info(...).func)."""
+    return get_parser_info(parser_name).func
 
 
 # ===========================================
-# 사회 뉴스 파서 함수들
+# 소스별 파서 함수 (하위 호환성 - 규칙은 config.PARSER_SPECS)
 # ===========================================
 
-def parse_chosun_society(html_content: str, max_articles: int = 5) -> List[Dict[str, str]]:
-    """
-    조선일보 '사회 많이 본 뉴스' 섹션에서 상위 기사 리스트를 반환합니다.
-    
-    Args:
-        html_content: 뉴스 페이지의 HTML 문자열
-        max_articles: 최대 기사 수 (기본값: 5)
-        
-    Returns:
-        뉴스 항목 딕셔너리 리스트
-    """
-    soup = BeautifulSoup(html_content, 'lxml')
-    news_items = []
-    processed_urls = set()
-    
-    # 조선일보 '사회 많이 본 뉴스' 섹션 찾기
-    trending_section = soup.find('div', class_='flex-chain__heading-title', string=re.compile(r'사회\s*많이\s*본\s*뉴스'))
-    
-    news_links = []
-    if trending_section:
-        # 2단계 상위 요소까지 탐색
-        section_container = trending_section.find_parent()
-        if section_container:
-            section_container = section_container.find_parent()
-        
-        if section_container:
-            news_links = section_container.find_all('a', href=re.compile(r'/national/[^/]+/\d{4}/\d{2}/\d{2}/[A-Z0-9]+/?'))
-    
-    # fallback: 섹션을 못 찾으면 전체 페이지에서 검색
-    if not news_links:
-        news_links = soup.find_all('a', href=re.compile(r'/national/[^/]+/\d{4}/\d{2}/\d{2}/[A-Z0-9]+/?'))
-    
-    for link in news_links:
-        if len(news_items) >= max_articles:
-            break
-            
-        url = link.get('href', '')
-        
-        if not url or url in processed_urls:
-            continue
-        
-        # 상대 URL을 절대 URL로 변환
-        if url.startswith('/'):
-            full_url = f"https://www.chosun.com{url}"
-        else:
-            full_url = url
-        
-        # 제목 추출
-        title = link.get_text(strip=True)
-        
-        # 제목이 너무 짧으면 다음 링크로
-        if not title or len(title) < 10:
-            continue
-        
-        # 이미지 URL 추출
-        image_url = extract_image_url(link, "https://www.chosun.com")
-        
-        # URL에서 날짜 추출 (패턴: /2025/12/01/...)
-        date_str = ""
-        date_match = re.search(r'/(\d{4})/(\d{2})/(\d{2})/', url)
-        if date_match:
-            year, month, day = date_match.groups()
-            date_str = f"{year}-{month}-{day}"
-        
-        if not date_str:
-            date_str = get_kst_now().strftime('%Y-%m-%d')
-        
-        news_item = {
-            'title': clean_text(title),
-            'url': full_url,
-            'date': date_str,
-            'category': '사회',
-            'source': '조선일보',
-            'image_url': image_url,
-            'scraped_at': get_kst_now().isoformat()
-        }
-        
-        news_items.append(news_item)
-        processed_urls.add(url)
-    
-    return news_items[:max_articles]
+def parse_donga_politics(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+    """동아일보 '많이 본 정치 뉴스' 섹션에서 상위 기사 리스트를 반환합니다."""
+    return parse_with_spec('donga_politics', html_content, max_articles)
 
 
-def parse_joongang_society(html_content: str, max_articles: int = 5) -> List[Dict[str, str]]:
-    """
-    중앙일보 사회 섹션에서 상위 기사 리스트를 반환합니다.
-    
-    Args:
-        html_content: 뉴스 페이지의 HTML 문자열
-        max_articles: 최대 기사 수 (기본값: 5)
-        
-    Returns:
-        뉴스 항목 딕셔너리 리스트
-    """
-    soup = BeautifulSoup(html_content, 'lxml')
-    news_items = []
-    processed_urls = set()
-    
-    # 중앙일보 "사회 많이 본 기사" 섹션 찾기
-    section_title = soup.find('strong', class_='title', string=re.compile(r'사회\s*많이\s*본\s*기사'))
-    
-    if section_title:
-        # 섹션 컨테이너 찾기 (3단계 상위 요소 = section 태그)
-        section_container = section_title.find_parent()  # div
-        if section_container:
-            section_container = section_container.find_parent()  # header
-        if section_container:
-            section_container = section_container.find_parent()  # section
-        
-        if section_container:
-            # 섹션 내의 순위가 있는 링크 찾기 (1, 2, 3, 4, 5 순위)
-            for rank in range(1, max_articles + 1):
-                # 순위 번호 찾기
-                rank_elem = section_container.find(text=str(rank))
-                if rank_elem:
-                    # 순위 근처의 링크 찾기
-                    parent = rank_elem.find_parent(['li', 'div', 'article'])
-                    if parent:
-                        link = parent.find('a', href=re.compile(r'/article/\d+'))
-                        if link:
-                            url = link.get('href', '')
-                            if url and url not in processed_urls:
-                                # 상대 URL을 절대 URL로 변환
-                                if url.startswith('/'):
-                                    full_url = f"https://www.joongang.co.kr{url}"
-                                else:
-                                    full_url = url
-                                
-                                # 제목 추출
-                                title = link.get_text(strip=True)
-                                
-                                if title and len(title) >= 10 and not title.isdigit():
-                                    # 이미지 URL 추출
-                                    image_url = extract_image_url(link, "https://www.joongang.co.kr")
-                                    
-                                    news_item = {
-                                        'title': clean_text(title),
-                                        'url': full_url,
-                                        'date': get_kst_now().strftime('%Y-%m-%d'),
-                                        'category': '사회',
-                                        'source': '중앙일보',
-                                        'image_url': image_url,
-                                        'scraped_at': get_kst_now().isoformat()
-                                    }
-                                    news_items.append(news_item)
-                                    processed_urls.add(url)
-    
-    # 5개가 안 되면 일반 사회 기사로 보충
-    if len(news_items) < max_articles:
-        all_links = soup.find_all('a', href=re.compile(r'/article/\d+'))
-        for link in all_links:
-            if len(news_items) >= max_articles:
-                break
-                
-            url = link.get('href', '')
-            if not url or url in processed_urls:
-                continue
-            
-            # 상대 URL을 절대 URL로 변환
-            if url.startswith('/'):
-                full_url = f"https://www.joongang.co.kr{url}"
-            else:
-                full_url = url
-            
-            # 제목 추출
-            title = link.get_text(strip=True)
-            
-            if not title or len(title) < 10 or title.isdigit():
-                continue
-            
-            # 이미지 URL 추출
-            image_url = extract_image_url(link, "https://www.joongang.co.kr")
-            
-            news_item = {
-                'title': clean_text(title),
-                'url': full_url,
-                'date': get_kst_now().strftime('%Y-%m-%d'),
-                'category': '사회',
-                'source': '중앙일보',
-                'image_url': image_url,
-                'scraped_at': get_kst_now().isoformat()
-            }
-            
-            news_items.append(news_item)
-            processed_urls.add(url)
-    
-    return news_items[:max_articles]
+def parse_chosun_politics(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+    """조선일보 '정치 많이 본 뉴스' 섹션에서 상위 기사 리스트를 반환합니다."""
+    return parse_with_spec('chosun_politics', html_content, max_articles)
 
 
-def parse_donga_society(html_content: str, max_articles: int = 5) -> List[Dict[str, str]]:
-    """
-    동아일보 '많이 본 사회 뉴스' 섹션에서 상위 기사 리스트를 반환합니다.
-    
-    Args:
-        html_content: 뉴스 페이지의 HTML 문자열
-        max_articles: 최대 기사 수 (기본값: 5)
-        
-    Returns:
-        뉴스 항목 딕셔너리 리스트
-    """
-    soup = BeautifulSoup(html_content, 'lxml')
-    news_items = []
-    processed_urls = set()
-    
-    # 동아일보 '많이 본 사회 뉴스' 섹션 찾기
-    trending_section = soup.find('h2', class_='sec_tit', string=re.compile(r'많이 본 사회 뉴스'))
-    
-    # fallback: h2 태그를 못 찾으면 일반 text 검색
-    if not trending_section:
-        trending_section = soup.find(string=re.compile(r'많이 본 사회 뉴스'))
-    
-    if trending_section:
-        # 많이 본 뉴스 섹션 컨테이너 찾기
-        section_parent = trending_section.find_parent(['div', 'section', 'article'])
-        if section_parent:
-            # 해당 섹션 내의 뉴스 링크 찾기
-            news_links = section_parent.find_all('a', href=re.compile(r'/news/Society/article/all/\d+/\d+/\d+'))
-            
-            for link in news_links:
-                if len(news_items) >= max_articles:
-                    break
-                    
-                url = link.get('href', '')
-                
-                if not url or url in processed_urls:
-                    continue
-                
-                # 상대 URL을 절대 URL로 변환
-                if url.startswith('/'):
-                    full_url = f"https://www.donga.com{url}"
-                else:
-                    full_url = url
-                
-                # 제목 추출
-                title = link.get_text(strip=True)
-                
-                # 제목이 너무 짧으면 다음 링크로
-                if not title or len(title) < 10:
-                    continue
-                
-                # 이미지 URL 추출
-                image_url = extract_image_url(link, "https://www.donga.com")
-                
-                # URL에서 날짜 추출
-                date_str = ""
-                date_match = re.search(r'/(\d{8})/', url)
-                if date_match:
-                    date_num = date_match.group(1)
-                    date_str = f"{date_num[:4]}-{date_num[4:6]}-{date_num[6:8]}"
-                
-                if not date_str:
-                    date_str = get_kst_now().strftime('%Y-%m-%d')
-                
-                news_item = {
-                    'title': clean_text(title),
-                    'url': full_url,
-                    'date': date_str,
-                    'category': '사회',
-                    'source': '동아일보',
-                    'image_url': image_url,
-                    'scraped_at': get_kst_now().isoformat()
-                }
-                
-                news_items.append(news_item)
-                processed_urls.add(url)
-    
-    return news_items[:max_articles]
+def parse_joongang_politics(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+    """중앙일보 정치 섹션에서 상위 기사 리스트를 반환합니다."""
+    return parse_with_spec('joongang_politics', html_content, max_articles)
 
 
-# ===========================================
-# 국제 뉴스 파서 함수들
-# ===========================================
+def parse_joongang_sports(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+    """중앙일보 '스포츠 많이 본 기사' 섹션에서 상위 기사 리스트를 반환합니다."""
+    return parse_with_spec('joongang_sports', html_content, max_articles)
 
-def parse_chosun_international(html_content: str, max_articles: int = 5) -> List[Dict[str, str]]:
-    """
-    조선일보 '국제 많이 본 뉴스' 섹션에서 상위 기사 리스트를 반환합니다.
-    
-    Args:
-        html_content: 뉴스 페이지의 HTML 문자열
-        max_articles: 최대 기사 수 (기본값: 5)
-        
-    Returns:
-        뉴스 항목 딕셔너리 리스트
-    """
-    soup = BeautifulSoup(html_content, 'lxml')
-    news_items = []
-    processed_urls = set()
-    
-    # 조선일보 '국제 많이 본 뉴스' 섹션 찾기
-    trending_section = soup.find('div', class_='flex-chain__heading-title', string=re.compile(r'국제\s*많이\s*본\s*뉴스'))
-    
-    news_links = []
-    if trending_section:
-        # 2단계 상위 요소까지 탐색
-        section_container = trending_section.find_parent()
-        if section_container:
-            section_container = section_container.find_parent()
-        
-        if section_container:
-            news_links = section_container.find_all('a', href=re.compile(r'/international/[^/]+/\d{4}/\d{2}/\d{2}/[A-Z0-9]+/?'))
-    
-    # fallback: 섹션을 못 찾으면 전체 페이지에서 검색
-    if not news_links:
-        news_links = soup.find_all('a', href=re.compile(r'/international/[^/]+/\d{4}/\d{2}/\d{2}/[A-Z0-9]+/?'))
-    
-    for link in news_links:
-        if len(news_items) >= max_articles:
-            break
-            
-        url = link.get('href', '')
-        
-        if not url or url in processed_urls:
-            continue
-        
-        # 상대 URL을 절대 URL로 변환
-        if url.startswith('/'):
-            full_url = f"https://www.chosun.com{url}"
-        else:
-            full_url = url
-        
-        # 제목 추출
-        title = link.get_text(strip=True)
-        
-        # 제목이 너무 짧으면 다음 링크로
-        if not title or len(title) < 10:
-            continue
-        
-        # 이미지 URL 추출
-        image_url = extract_image_url(link, "https://www.chosun.com")
-        
-        # URL에서 날짜 추출 (패턴: /2025/12/01/...)
-        date_str = ""
-        date_match = re.search(r'/(\d{4})/(\d{2})/(\d{2})/', url)
-        if date_match:
-            year, month, day = date_match.groups()
-            date_str = f"{year}-{month}-{day}"
-        
-        if not date_str:
-            date_str = get_kst_now().strftime('%Y-%m-%d')
-        
-        news_item = {
-            'title': clean_text(title),
-            'url': full_url,
-            'date': date_str,
-            'category': '국제',
-            'source': '조선일보',
-            'image_url': image_url,
-            'scraped_at': get_kst_now().isoformat()
-        }
-        
-        news_items.append(news_item)
-        processed_urls.add(url)
-    
-    return news_items[:max_articles]
 
+def parse_donga_sports(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+    """동아일보 '많이 본 스포츠 뉴스' 섹션에서 상위 기사 리스트를 반환합니다."""
+    return parse_with_spec('donga_sports', html_content, max_articles)
 
-def parse_joongang_international(html_content: str, max_articles: int = 5) -> List[Dict[str, str]]:
-    """
-    중앙일보 국제 섹션에서 상위 기사 리스트를 반환합니다.
-    
-    Args:
-        html_content: 뉴스 페이지의 HTML 문자열
-        max_articles: 최대 기사 수 (기본값: 5)
-        
-    Returns:
-        뉴스 항목 딕셔너리 리스트
-    """
-    soup = BeautifulSoup(html_content, 'lxml')
-    news_items = []
-    processed_urls = set()
-    
-    # 중앙일보 "국제 많이 본 기사" 섹션 찾기
-    section_title = soup.find('strong', class_='title', string=re.compile(r'국제\s*많이\s*본\s*기사'))
-    
-    if section_title:
-        # 섹션 컨테이너 찾기 (3단계 상위 요소 = section 태그)
-        section_container = section_title.find_parent()  # div
-        if section_container:
-            section_container = section_container.find_parent()  # header
-        if section_container:
-            section_container = section_container.find_parent()  # section
-        
-        if section_container:
-            # 섹션 내의 순위가 있는 링크 찾기 (1, 2, 3, 4, 5 순위)
-            for rank in range(1, max_articles + 1):
-                # 순위 번호 찾기
-                rank_elem = section_container.find(text=str(rank))
-                if rank_elem:
-                    # 순위 근처의 링크 찾기
-                    parent = rank_elem.find_parent(['li', 'div', 'article'])
-                    if parent:
-                        link = parent.find('a', href=re.compile(r'/article/\d+'))
-                        if link:
-                            url = link.get('href', '')
-                            if url and url not in processed_urls:
-                                # 상대 URL을 절대 URL로 변환
-                                if url.startswith('/'):
-                                    full_url = f"https://www.joongang.co.kr{url}"
-                                else:
-                                    full_url = url
-                                
-                                # 제목 추출
-                                title = link.get_text(strip=True)
-                                
-                                if title and len(title) >= 10 and not title.isdigit():
-                                    # 이미지 URL 추출
-                                    image_url = extract_image_url(link, "https://www.joongang.co.kr")
-                                    
-                                    news_item = {
-                                        'title': clean_text(title),
-                                        'url': full_url,
-                                        'date': get_kst_now().strftime('%Y-%m-%d'),
-                                        'category': '국제',
-                                        'source': '중앙일보',
-                                        'image_url': image_url,
-                                        'scraped_at': get_kst_now().isoformat()
-                                    }
-                                    news_items.append(news_item)
-                                    processed_urls.add(url)
-    
-    # 5개가 안 되면 일반 국제 기사로 보충
-    if len(news_items) < max_articles:
-        all_links = soup.find_all('a', href=re.compile(r'/article/\d+'))
-        for link in all_links:
-            if len(news_items) >= max_articles:
-                break
-                
-            url = link.get('href', '')
-            if not url or url in processed_urls:
-                continue
-            
-            # 상대 URL을 절대 URL로 변환
-            if url.startswith('/'):
-                full_url = f"https://www.joongang.co.kr{url}"
-            else:
-                full_url = url
-            
-            # 제목 추출
-            title = link.get_text(strip=True)
-            
-            if not title or len(title) < 10 or title.isdigit():
-                continue
-            
-            # 이미지 URL 추출
-            image_url = extract_image_url(link, "https://www.joongang.co.kr")
-            
-            news_item = {
-                'title': clean_text(title),
-                'url': full_url,
-                'date': get_kst_now().strftime('%Y-%m-%d'),
-                'category': '국제',
-                'source': '중앙일보',
-                'image_url': image_url,
-                'scraped_at': get_kst_now().isoformat()
-            }
-            
-            news_items.append(news_item)
-            processed_urls.add(url)
-    
-    return news_items[:max_articles]
 
+def parse_chosun_sports(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+    """조선일보 '스포츠 많이 본 뉴스' 섹션에서 상위 기사 리스트를 반환합니다."""
+    return parse_with_spec('chosun_sports', html_content, max_articles)
 
-def parse_donga_international(html_content: str, max_articles: int = 5) -> List[Dict[str, str]]:
-    """
-    동아일보 '많이 본 국제 뉴스' 섹션에서 상위 기사 리스트를 반환합니다.
-    
-    Args:
-        html_content: 뉴스 페이지의 HTML 문자열
-        max_articles: 최대 기사 수 (기본값: 5)
-        
-    Returns:
-        뉴스 항목 딕셔너리 리스트
-    """
-    soup = BeautifulSoup(html_content, 'lxml')
-    news_items = []
-    processed_urls = set()
-    
-    # 동아일보 '많이 본 국제 뉴스' 섹션 찾기
-    trending_section = soup.find('h2', class_='sec_tit', string=re.compile(r'많이 본 국제 뉴스'))
-    
-    # fallback: h2 태그를 못 찾으면 일반 text 검색
-    if not trending_section:
-        trending_section = soup.find(string=re.compile(r'많이 본 국제 뉴스'))
-    
-    if trending_section:
-        # 많이 본 뉴스 섹션 컨테이너 찾기
-        section_parent = trending_section.find_parent(['div', 'section', 'article'])
-        if section_parent:
-            # 해당 섹션 내의 뉴스 링크 찾기
-            news_links = section_parent.find_all('a', href=re.compile(r'/news/Inter/article/all/\d+/\d+/\d+'))
-            
-            for link in news_links:
-                if len(news_items) >= max_articles:
-                    break
-                    
-                url = link.get('href', '')
-                
-                if not url or url in processed_urls:
-                    continue
-                
-                # 상대 URL을 절대 URL로 변환
-                if url.startswith('/'):
-                    full_url = f"https://www.donga.com{url}"
-                else:
-                    full_url = url
-                
-                # 제목 추출
-                title = link.get_text(strip=True)
-                
-                # 제목이 너무 짧으면 다음 링크로
-                if not title or len(title) < 10:
-                    continue
-                
-                # 이미지 URL 추출
-                image_url = extract_image_url(link, "https://www.donga.com")
-                
-                # URL에서 날짜 추출
-                date_str = ""
-                date_match = re.search(r'/(\d{8})/', url)
-                if date_match:
-                    date_num = date_match.group(1)
-                    date_str = f"{date_num[:4]}-{date_num[4:6]}-{date_num[6:8]}"
-                
-                if not date_str:
-                    date_str = get_kst_now().strftime('%Y-%m-%d')
-                
-                news_item = {
-                    'title': clean_text(title),
-                    'url': full_url,
-                    'date': date_str,
-                    'category': '국제',
-                    'source': '동아일보',
-                    'image_url': image_url,
-                    'scraped_at': get_kst_now().isoformat()
-                }
-                
-                news_items.append(news_item)
-                processed_urls.add(url)
-    
-    return news_items[:max_articles]
 
+def parse_joongang_economy(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+    """중앙일보 '경제 많이 본 기사' 섹션에서 상위 기사 리스트를 반환합니다."""
+    return parse_with_spec('joongang_economy', html_content, max_articles)
 
-# ===========================================
-# 문화 뉴스 파서 함수들
-# ===========================================
 
-def parse_chosun_culture(html_content: str, max_articles: int = 5) -> List[Dict[str, str]]:
-    """
-    조선일보 '문화·라이프 많이 본 뉴스' 섹션에서 상위 기사 리스트를 반환합니다.
-    
-    Args:
-        html_content: 뉴스 페이지의 HTML 문자열
-        max_articles: 최대 기사 수 (기본값: 5)
-        
-    Returns:
-        뉴스 항목 딕셔너리 리스트
-    """
-    soup = BeautifulSoup(html_content, 'lxml')
-    news_items = []
-    processed_urls = set()
-    
-    # 방법 1: "문화·라이프 많이 본 뉴스" 섹션 찾기
-    headings = soup.find_all('div', class_='flex-chain__heading-title')
-    culture_section = None
-    
-    for heading in headings:
-        heading_text = heading.get_text(strip=True)
-        if '문화' in heading_text and '라이프' in heading_text and '많이' in heading_text:
-            culture_section = heading.find_parent('section', class_='flex-chain')
-            break
-    
-    news_links = []
-    if culture_section:
-        # 섹션 내의 모든 링크 찾기
-        all_links = culture_section.find_all('a', href=True)
-        for link in all_links:
-            url = link.get('href', '')
-            # 문화/연예 카테고리 URL 패턴 확인
-            if re.match(r'/(culture-life|entertainments)/[^/]+/\d{4}/\d{2}/\d{2}/[A-Z0-9]+/?', url):
-                news_links.append(link)
-    
-    # 방법 2: 충분한 링크를 못 찾으면 전체 페이지에서 culture-life와 entertainments 검색
-    if len(news_links) < max_articles:
-        # 두 카테고리 모두 검색
-        additional_links = soup.find_all('a', href=re.compile(r'/(culture-life|entertainments)/[^/]+/\d{4}/\d{2}/\d{2}/[A-Z0-9]+/?'))
-        
-        # 이미 추가한 URL 확인
-        existing_urls = set(link.get('href', '') for link in news_links)
-        
-        for link in additional_links:
-            if len(news_links) >= max_articles:
-                break
-            url = link.get('href', '')
-            if url and url not in existing_urls:
-                news_links.append(link)
-                existing_urls.add(url)
-    
-    for link in news_links:
-        if len(news_items) >= max_articles:
-            break
-            
-        url = link.get('href', '')
-        
-        if not url or url in processed_urls:
-            continue
-        
-        # 상대 URL을 절대 URL로 변환
-        if url.startswith('/'):
-            full_url = f"https://www.chosun.com{url}"
-        else:
-            full_url = url
-        
-        # 제목 추출 (h2, h3, h4, h5 태그에서)
-        title_elem = link.find(['h2', 'h3', 'h4', 'h5', 'h6'])
-        if title_elem:
-            title = title_elem.get_text(strip=True)
-        else:
-            title = link.get_text(strip=True)
-        
-        # 제목이 너무 짧으면 다음 링크로
-        if not title or len(title) < 10:
-            continue
-        
-        # 이미지 URL 추출
-        image_url = extract_image_url(link, "https://www.chosun.com")
-        
-        # URL에서 날짜 추출 (패턴: /2025/12/01/...)
-        date_str = ""
-        date_match = re.search(r'/(\d{4})/(\d{2})/(\d{2})/', url)
-        if date_match:
-            year, month, day = date_match.groups()
-            date_str = f"{year}-{month}-{day}"
-        
-        if not date_str:
-            date_str = get_kst_now().strftime('%Y-%m-%d')
-        
-        news_item = {
-            'title': clean_text(title),
-            'url': full_url,
-            'date': date_str,
-            'category': '문화',
-            'source': '조선일보',
-            'image_url': image_url,
-            'scraped_at': get_kst_now().isoformat()
-        }
-        
-        news_items.append(news_item)
-        processed_urls.add(url)
-    
-    return news_items[:max_articles]
+def parse_donga_economy(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+    """동아일보 '많이 본 경제 뉴스' 섹션에서 상위 기사 리스트를 반환합니다."""
+    return parse_with_spec('donga_economy', html_content, max_articles)
 
 
-def parse_joongang_culture(html_content: str, max_articles: int = 5) -> List[Dict[str, str]]:
-    """
-    중앙일보 문화 섹션에서 상위 기사 리스트를 반환합니다.
-    
-    Args:
-        html_content: 뉴스 페이지의 HTML 문자열
-        max_articles: 최대 기사 수 (기본값: 5)
-        
-    Returns:
-        뉴스 항목 딕셔너리 리스트
-    """
-    soup = BeautifulSoup(html_content, 'lxml')
-    news_items = []
-    processed_urls = set()
-    
-    # 중앙일보 "문화 많이 본 기사" 섹션 찾기
-    section_title = soup.find('strong', class_='title', string=re.compile(r'문화\s*많이\s*본\s*기사'))
-    
-    if section_title:
-        # 섹션 컨테이너 찾기 (3단계 상위 요소 = section 태그)
-        section_container = section_title.find_parent()  # div
-        if section_container:
-            section_container = section_container.find_parent()  # header
-        if section_container:
-            section_container = section_container.find_parent()  # section
-        
-        if section_container:
-            # 섹션 내의 순위가 있는 링크 찾기 (1, 2, 3, 4, 5 순위)
-            for rank in range(1, max_articles + 1):
-                # 순위 번호 찾기
-                rank_elem = section_container.find(text=str(rank))
-                if rank_elem:
-                    # 순위 근처의 링크 찾기
-                    parent = rank_elem.find_parent(['li', 'div', 'article'])
-                    if parent:
-                        link = parent.find('a', href=re.compile(r'/article/\d+'))
-                        if link:
-                            url = link.get('href', '')
-                            if url and url not in processed_urls:
-                                # 상대 URL을 절대 URL로 변환
-                                if url.startswith('/'):
-                                    full_url = f"https://www.joongang.co.kr{url}"
-                                else:
-                                    full_url = url
-                                
-                                # 제목 추출
-                                title = link.get_text(strip=True)
-                                
-                                if title and len(title) >= 10 and not title.isdigit():
-                                    # 이미지 URL 추출
-                                    image_url = extract_image_url(link, "https://www.joongang.co.kr")
-                                    
-                                    news_item = {
-                                        'title': clean_text(title),
-                                        'url': full_url,
-                                        'date': get_kst_now().strftime('%Y-%m-%d'),
-                                        'category': '문화',
-                                        'source': '중앙일보',
-                                        'image_url': image_url,
-                                        'scraped_at': get_kst_now().isoformat()
-                                    }
-                                    news_items.append(news_item)
-                                    processed_urls.add(url)
-    
-    # 5개가 안 되면 일반 문화 기사로 보충
-    if len(news_items) < max_articles:
-        all_links = soup.find_all('a', href=re.compile(r'/article/\d+'))
-        for link in all_links:
-            if len(news_items) >= max_articles:
-                break
-                
-            url = link.get('href', '')
-            if not url or url in processed_urls:
-                continue
-            
-            # 상대 URL을 절대 URL로 변환
-            if url.startswith('/'):
-                full_url = f"https://www.joongang.co.kr{url}"
-            else:
-                full_url = url
-            
-            # 제목 추출
-            title = link.get_text(strip=True)
-            
-            if not title or len(title) < 10 or title.isdigit():
-                continue
-            
-            # 이미지 URL 추출
-            image_url = extract_image_url(link, "https://www.joongang.co.kr")
-            
-            news_item = {
-                'title': clean_text(title),
-                'url': full_url,
-                'date': get_kst_now().strftime('%Y-%m-%d'),
-                'category': '문화',
-                'source': '중앙일보',
-                'image_url': image_url,
-                'scraped_at': get_kst_now().isoformat()
-            }
-            
-            news_items.append(news_item)
-            processed_urls.add(url)
-    
-    return news_items[:max_articles]
+def parse_chosun_economy(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+    """조선일보 '조선경제 많이 본 뉴스' 섹션에서 상위 기사 리스트를 반환합니다."""
+    return parse_with_spec('chosun_economy', html_content, max_articles)
 
 
-def parse_donga_culture(html_content: str, max_articles: int = 5) -> List[Dict[str, str]]:
-    """
-    동아일보 '많이 본 문화 뉴스' 섹션에서 상위 기사 리스트를 반환합니다.
-    
-    Args:
-        html_content: 뉴스 페이지의 HTML 문자열
-        max_articles: 최대 기사 수 (기본값: 5)
-        
-    Returns:
-        뉴스 항목 딕셔너리 리스트
-    """
-    soup = BeautifulSoup(html_content, 'lxml')
-    news_items = []
-    processed_urls = set()
-    
-    # 동아일보 '많이 본 문화 뉴스' 섹션 찾기
-    trending_section = soup.find('h2', class_='sec_tit', string=re.compile(r'많이 본 문화 뉴스'))
-    
-    # fallback: h2 태그를 못 찾으면 일반 text 검색
-    if not trending_section:
-        trending_section = soup.find(string=re.compile(r'많이 본 문화 뉴스'))
-    
-    if trending_section:
-        # 많이 본 뉴스 섹션 컨테이너 찾기
-        section_parent = trending_section.find_parent(['div', 'section', 'article'])
-        if section_parent:
-            # 해당 섹션 내의 뉴스 링크 찾기
-            news_links = section_parent.find_all('a', href=re.compile(r'/news/Culture/article/all/\d+/\d+/\d+'))
-            
-            for link in news_links:
-                if len(news_items) >= max_articles:
-                    break
-                    
-                url = link.get('href', '')
-                
-                if not url or url in processed_urls:
-                    continue
-                
-                # 상대 URL을 절대 URL로 변환
-                if url.startswith('/'):
-                    full_url = f"https://www.donga.com{url}"
-                else:
-                    full_url = url
-                
-                # 제목 추출
-                title = link.get_text(strip=True)
-                
-                # 제목이 너무 짧으면 다음 링크로
-                if not title or len(title) < 10:
-                    continue
-                
-                # 이미지 URL 추출
-                image_url = extract_image_url(link, "https://www.donga.com")
-                
-                # URL에서 날짜 추출
-                date_str = ""
-                date_match = re.search(r'/(\d{8})/', url)
-                if date_match:
-                    date_num = date_match.group(1)
-                    date_str = f"{date_num[:4]}-{date_num[4:6]}-{date_num[6:8]}"
-                
-                if not date_str:
-                    date_str = get_kst_now().strftime('%Y-%m-%d')
-                
-                news_item = {
-                    'title': clean_text(title),
-                    'url': full_url,
-                    'date': date_str,
-                    'category': '문화',
-                    'source': '동아일보',
-                    'image_url': image_url,
-                    'scraped_at': get_kst_now().isoformat()
-                }
-                
-                news_items.append(news_item)
-                processed_urls.add(url)
-    
-    return news_items[:max_articles]
+def parse_chosun_society(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+    """조선일보 '사회 많이 본 뉴스' 섹션에서 상위 기사 리스트를 반환합니다."""
+    return parse_with_spec('chosun_society', html_content, max_articles)
+
+
+def parse_joongang_society(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+    """중앙일보 사회 섹션에서 상위 기사 리스트를 반환합니다."""
+    return parse_with_spec('joongang_society', html_content, max_articles)
+
+
+def parse_donga_society(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+    """동아일보 '많이 본 사회 뉴스' 섹션에서 상위 기사 리스트를 반환합니다."""
+    return parse_with_spec('donga_society', html_content, max_articles)
+
+
+def parse_chosun_international(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+    """조선일보 '국제 많이 본 뉴스' 섹션에서 상위 기사 리스트를 반환합니다."""
+    return parse_with_spec('chosun_international', html_content, max_articles)
+
+
+def parse_joongang_international(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+    """중앙일보 국제 섹션에서 상위 기사 리스트를 반환합니다."""
+    return parse_with_spec('joongang_international', html_content, max_articles)
+
+
+def parse_donga_international(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+    """동아일보 '많이 본 국제 뉴스' 섹션에서 상위 기사 리스트를 반환합니다."""
+    return parse_with_spec('donga_international', html_content, max_articles)
+
+
+def parse_chosun_culture(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+    """조선일보 '문화·라이프 많이 본 뉴스' 섹션에서 상위 기사 리스트를 반환합니다."""
+    return parse_with_spec('chosun_culture', html_content, max_articles)
+
+
+def parse_joongang_culture(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+    """중앙일보 문화 섹션에서 상위 기사 리스트를 반환합니다."""
+    return parse_with_spec('joongang_culture', html_content, max_articles)
 
 
+def parse_donga_culture(html_content: str, max_articles: int = 5) -> List[NewsItem]:
+    """동아일보 '많이 본 문화 뉴스' 섹션에서 상위 기사 리스트를 반환합니다."""
+    return parse_with_spec('donga_culture', html_content, max_articles)
@@ -3,16 +3,19 @@
 카테고리/소스별 개별 보고서 및 통합 보고서 생성
 """
 
-import json
 import os
+import sqlite3
 from datetime import datetime, timezone, timedelta
 from collections import defaultdict
+from typing import Optional, Set, Tuple
 import re
 from config import (
     NEWS_SOURCES, CATEGORY_EN_MAP, SOURCE_EN_MAP,
     REPORT_TEMPLATE, COMBINED_REPORT_TEMPLATE, NEWS_JSON_TEMPLATE
 )
 from parser import get_crawl_time_str
+from news_store import get_news_store, get_source_key
+from output_writer import output_writer, volatile_lines
 
 # 한국 시간대 (KST = UTC+9)
 KST = timezone(timedelta(hours=9))
@@ -21,6 +24,9 @@ def get_kst_now():
     """한국 시간(KST)으로 현재 시간을 반환합니다."""
     return datetime.now(KST)
 
+# 보고서 비교에서 제외할 줄 (생성 시각)
+REPORT_VOLATILE = volatile_lines(r'\*\*보고서 생성일\*\*: ')
+
 
 def get_category_source_json_path(category: str, source: str, date: str, time: str = None) -> str:
     """
@@ -46,25 +52,25 @@ def get_category_source_json_path(category: str, source: str, date: str, time: s
 
 def load_all_news_by_date(date: str) -> dict:
     """
-    특정 날짜의 모든 카테고리/소스 뉴스를 로드합니다.
+    특정 날짜(현재 시간대)의 모든 카테고리/소스 뉴스를 저장소에서 로드합니다.
     
     Returns:
-        {category: {source: [news_items]}} 형태의 딕셔너리
+        {category: {source: [NewsItem]}} 형태의 딕셔너리
     """
     all_data = defaultdict(lambda: defaultdict(list))
+    store = get_news_store()
+    slot = get_crawl_time_str()
     
     for category, sources in NEWS_SOURCES.items():
         for source_config in sources:
             source_name = source_config['name']
-            json_path = get_category_source_json_path(category, source_name, date)
-            
-            if os.path.exists(json_path):
-                try:
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        all_data[category][source_name] = data
-                except Exception as e:
-                    print(f"⚠️ [{source_name}] 데이터 로드 실패: {e}")
+            try:
+                data = store.load_slot(*get_source_key(category, source_name), date, slot)
+            except sqlite3.Error as e:
+                print(f"⚠️ [{source_name}] 데이터 로드 실패: {e}")
+                continue
+            if data:
+                all_data[category][source_name] = data
     
     return all_data
 
@@ -92,6 +98,13 @@ def clean_title(title):
     return title
 
 
+def get_source_report_path(category: str, source: str, date: str) -> str:
+    """카테고리/소스별 보고서 파일 경로"""
+    category_en = CATEGORY_EN_MAP.get(category, category.lower())
+    source_en = SOURCE_EN_MAP.get(source, source.lower().replace(' ', '_'))
+    return REPORT_TEMPLATE.format(category=category_en, source=source_en, date=date)
+
+
 def generate_source_report(category: str, source: str, news_list: list, date: str) -> str:
     """
     개별 소스의 보고서를 생성합니다.
@@ -141,27 +154,22 @@ def generate_source_report(category: str, source: str, news_list: list, date: st
     report.append("## 📌 정보\n\n")
     report.append(f"- **카테고리**: {category}\n")
     report.append(f"- **출처**: {source}\n")
-    report.append(f"- **데이터 파일**: `data/{CATEGORY_EN_MAP.get(category, category.lower())}/{SOURCE_EN_MAP.get(source, source.lower())}/news_{date}.json`\n\n")
+    report.append(f"- **데이터 파일**: `{get_category_source_json_path(category, source, date)}`\n\n")
     
-    # 파일 저장
-    category_en = CATEGORY_EN_MAP.get(category, category.lower())
-    source_en = SOURCE_EN_MAP.get(source, source.lower().replace(' ', '_'))
-    output_file = REPORT_TEMPLATE.format(category=category_en, source=source_en, date=date)
-    
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(''.join(report))
+    # 파일 저장 (생성일 외에 바뀐 내용이 없으면 기존 파일 유지)
+    output_file = get_source_report_path(category, source, date)
+    output_writer.write_text(output_file, ''.join(report), REPORT_VOLATILE)
     
     return output_file
 
 
-def generate_combined_report(date: str) -> str:
+def generate_combined_report(date: str, changed_sources: Optional[Set[Tuple[str, str]]] = None) -> str:
     """
     모든 카테고리/소스의 뉴스를 통합한 보고서를 생성합니다.
     
     Args:
         date: 날짜 (YYYY-MM-DD)
+        changed_sources: 지정하면 이 (카테고리, 소스)와 보고서가 없는 소스만 개별 보고서를 다시 생성
         
     Returns:
         생성된 보고서 파일 경로
@@ -242,18 +250,21 @@ def generate_combined_report(date: str) -> str:
     
     # 파일 저장
     output_file = COMBINED_REPORT_TEMPLATE.format(date=date)
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(''.join(report))
-    
-    print(f"✅ 통합 보고서 생성 완료: {output_file}")
+    if output_writer.write_text(output_file, ''.join(report), REPORT_VOLATILE):
+        print(f"✅ 통합 보고서 생성 완료: {output_file}")
+    else:
+        print(f"ℹ️ 통합 보고서 변경 없음, 기존 파일 유지: {output_file}")
     
     # 개별 소스별 보고서도 생성
     print("\n📝 개별 소스별 보고서 생성 중...")
     source_reports = []
     for category, sources_dict in all_data.items():
         for source, news_list in sources_dict.items():
+            if changed_sources is not None and (category, source) not in changed_sources:
+                existing_report = get_source_report_path(category, source, date)
+                if os.path.exists(existing_report):
+                    print(f"  - [{category}/{source}] 변경 없음, 보고서 유지: {existing_report}")
+                    continue
             source_report = generate_source_report(category, source, news_list, date)
             source_reports.append(source_report)
             print(f"  ✓ [{category}/{source}] 보고서 생성: {source_report}")
@@ -272,6 +283,7 @@ def main():
     
     try:
         report_file = generate_combined_report(today)
+        output_writer.sync()
         
         if report_file:
             print(f"✨ 보고서 생성 완료!")
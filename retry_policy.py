@@ -0,0 +1,188 @@
+"""
+재시도 정책 및 호스트별 회로 차단기(Circuit Breaker)
+지수 백오프 + jitter로 재시도하고, 연속 실패한 호스트는 같은 실행 안에서 즉시 실패 처리합니다.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+
+from config import (
+    MAX_RETRIES, RETRY_DELAY, RETRY_MAX_DELAY, RETRYABLE_STATUSES,
+    CIRCUIT_BREAKER_THRESHOLD, CIRCUIT_BREAKER_RESET_TIMEOUT
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RetryPolicy:
+    """
+    재시도 여부와 대기 시간을 결정합니다.
+
+    연결 오류, 타임아웃, RETRYABLE_STATUSES 응답만 재시도하며
+    대기 시간은 min(max_delay, base_delay * 2^attempt) 범위의 무작위 값(full jitter)입니다.
+    """
+
+    def __init__(self, max_attempts: int = MAX_RETRIES, base_delay: float = RETRY_DELAY,
+                 max_delay: float = RETRY_MAX_DELAY, retryable_statuses=RETRYABLE_STATUSES):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retryable_statuses = set(retryable_statuses)
+
+    def is_retryable(self, error: Exception) -> bool:
+        """재시도할 만한 오류인지 판단합니다."""
+        if isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            return True
+        if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+            return error.response.status_code in self.retryable_statuses
+        return False
+
+    def get_delay(self, attempt: int, error: Optional[Exception] = None) -> float:
+        """
+        attempt번째 시도(0부터) 실패 후 대기할 시간을 반환합니다.
+
+        서버가 Retry-After(초)를 보냈으면 그 값 이상 기다립니다.
+        """
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('Retry-After', '') if response is not None else ''
+        if retry_after.isdigit():
+            delay = max(delay, min(self.max_delay, float(retry_after)))
+        return delay
+
+
+class CircuitBreaker:
+    """
+    단일 호스트의 회로 차단기.
+
+    closed: 정상 요청
+    open: 연속 실패가 임계값에 도달해 요청을 즉시 거부
+    half_open: reset_timeout이 지나 시험 요청 하나만 허용
+               (시험 요청의 결과가 기록될 때까지 다른 요청은 거부)
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, host: str, failure_threshold: int = CIRCUIT_BREAKER_THRESHOLD,
+                 reset_timeout: float = CIRCUIT_BREAKER_RESET_TIMEOUT):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.probe_in_flight = False   # half_open 시험 요청이 진행 중인지
+        self.transitions = 0
+        self.rejected = 0              # 차단기로 거부된 요청 수
+        self.failed_fetches = 0        # 재시도까지 모두 실패한 요청 수
+        self.failed_fetch_time = 0.0   # 위 요청들에 소요된 시간 합계
+        self._lock = threading.Lock()
+
+    def _transition(self, new_state: str):
+        logger.warning(f"회로 차단기 [{self.host}]: {self.state} → {new_state}")
+        self.state = new_state
+        self.transitions += 1
+
+    def allow_request(self) -> bool:
+        """
+        요청을 보내도 되는지 확인합니다 (거부 시 집계).
+
+        half_open에서는 시험 요청 하나만 허용하며, 허용받은 요청은 결과를
+        record_success / record_failure / release 중 하나로 반드시 기록해야 합니다.
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    self.rejected += 1
+                    return False
+                self._transition(self.HALF_OPEN)
+            if self.state == self.HALF_OPEN:
+                if self.probe_in_flight:
+                    self.rejected += 1
+                    return False
+                self.probe_in_flight = True
+            return True
+
+    def is_open(self) -> bool:
+        """집계 없이 현재 요청을 거부 중인지만 확인합니다 (시험 요청 진행 중 포함)."""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                return self.probe_in_flight
+            return self.state == self.OPEN and time.monotonic() - self.opened_at < self.reset_timeout
+
+    def release(self):
+        """시험 요청이 호스트 상태와 무관한 오류(재시도하지 않는 오류)로 끝나 다음 요청이 다시 시험하도록 합니다."""
+        with self._lock:
+            self.probe_in_flight = False
+
+    def record_success(self):
+        """성공한 요청을 기록합니다."""
+        with self._lock:
+            self.probe_in_flight = False
+            self.consecutive_failures = 0
+            if self.state != self.CLOSED:
+                self._transition(self.CLOSED)
+
+    def record_failure(self):
+        """재시도 대상 오류로 실패한 시도를 기록합니다."""
+        with self._lock:
+            self.probe_in_flight = False
+            self.consecutive_failures += 1
+            if self.state == self.HALF_OPEN or (
+                    self.state == self.CLOSED and self.consecutive_failures >= self.failure_threshold):
+                self._transition(self.OPEN)
+                self.opened_at = time.monotonic()
+
+    def record_failed_fetch(self, elapsed: float):
+        """재시도까지 모두 실패한 요청과 소요 시간을 기록합니다 (절약 시간 추정용)."""
+        with self._lock:
+            self.failed_fetches += 1
+            self.failed_fetch_time += elapsed
+
+    def estimated_time_saved(self) -> float:
+        """거부된 요청 수 × 실패한 요청의 평균 소요 시간"""
+        with self._lock:
+            if not self.failed_fetches:
+                return 0.0
+            return self.rejected * self.failed_fetch_time / self.failed_fetches
+
+
+class CircuitBreakerRegistry:
+    """호스트별 회로 차단기 모음"""
+
+    def __init__(self):
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, host: str) -> CircuitBreaker:
+        """호스트의 회로 차단기를 반환합니다 (없으면 생성)."""
+        with self._lock:
+            if host not in self.breakers:
+                self.breakers[host] = CircuitBreaker(host)
+            return self.breakers[host]
+
+    def reset(self):
+        """모든 차단기 상태를 초기화합니다 (크롤링 실행 시작 시)."""
+        with self._lock:
+            self.breakers.clear()
+
+    def log_stats(self):
+        """상태 전이 횟수, 거부된 요청 수, 추정 절약 시간을 로그로 출력합니다."""
+        active = [b for b in self.breakers.values() if b.transitions or b.rejected]
+        if not active:
+            return
+
+        logger.info("\n회로 차단기 통계 (호스트별):")
+        for breaker in sorted(active, key=lambda b: b.host):
+            logger.info(
+                f"  - {breaker.host}: 상태 {breaker.state}, 전이 {breaker.transitions}회, "
+                f"거부 {breaker.rejected}건, 추정 절약 시간 {breaker.estimated_time_saved():.1f}초"
+            )